@@ -18,14 +18,280 @@ description:
 author:
   - Miguel Angel Munoz (@magonzalez)
 version_added: "2.0.0"
+options:
+  keepalive:
+    description:
+      - Send REST API requests over a pool of persistent HTTP/1.1 keep-alive connections
+        instead of opening a new TCP and TLS session for every request.
+      - The pool belongs to the persistent ansible-connection of one host and connects
+        to the device directly, without going through a proxy.
+    type: bool
+    default: false
+    vars:
+      - name: ansible_httpapi_fortios_keepalive
+  keepalive_pool_size:
+    description:
+      - Maximum number of keep-alive connections opened to the device.
+    type: int
+    default: 4
+    vars:
+      - name: ansible_httpapi_fortios_keepalive_pool_size
+  keepalive_idle_timeout:
+    description:
+      - Seconds after which an idle keep-alive connection is not reused anymore.
+      - Keep it below the admin session idle timeout of the device.
+    type: int
+    default: 30
+    vars:
+      - name: ansible_httpapi_fortios_keepalive_idle_timeout
+  keepalive_health_check:
+    description:
+      - Check that an idle keep-alive connection has not been closed by the device before reusing it.
+    type: bool
+    default: true
+    vars:
+      - name: ansible_httpapi_fortios_keepalive_health_check
+  compression:
+    description:
+      - Negotiate gzip or deflate compressed responses and decompress them transparently, streamed
+        responses on the keep-alive connections are decompressed chunk by chunk.
+      - Without I(keepalive) only gzip is negotiated.
+    type: bool
+    default: true
+    vars:
+      - name: ansible_httpapi_fortios_compression
+  compress_requests:
+    description:
+      - Send the body of large PUT and POST requests gzip compressed with a C(Content-Encoding) header.
+      - Only enable it for firmware which accepts compressed request bodies.
+    type: bool
+    default: false
+    vars:
+      - name: ansible_httpapi_fortios_compress_requests
+  compress_requests_min_size:
+    description:
+      - Minimum size in bytes of a request body to be compressed when I(compress_requests) is enabled.
+    type: int
+    default: 65536
+    vars:
+      - name: ansible_httpapi_fortios_compress_requests_min_size
+  max_concurrency:
+    description:
+      - Maximum number of requests sent to the device at the same time by C(send_requests).
+      - Requests are only dispatched concurrently when I(keepalive) is enabled, otherwise they are sent one by one.
+    type: int
+    default: 4
+    vars:
+      - name: ansible_httpapi_fortios_max_concurrency
+  retry_max_attempts:
+    description:
+      - Number of times a request throttled by the device is sent again.
+      - A request is throttled when the device answers 429 or 503, or 500 with a "too many sessions" kind of error.
+      - Set it to 0 to disable retries.
+    type: int
+    default: 3
+    vars:
+      - name: ansible_httpapi_fortios_retry_max_attempts
+  retry_backoff_base:
+    description:
+      - Base delay in seconds of the jittered exponential backoff between retries.
+      - A C(Retry-After) header sent by the device takes precedence.
+    type: float
+    default: 0.5
+    vars:
+      - name: ansible_httpapi_fortios_retry_backoff_base
+  retry_backoff_max:
+    description:
+      - Maximum delay in seconds between two retries.
+    type: float
+    default: 30
+    vars:
+      - name: ansible_httpapi_fortios_retry_backoff_max
+  retry_error_codes:
+    description:
+      - Additional FortiOS error codes of 500 responses which are treated as throttling and retried.
+    type: list
+    elements: int
+    default: []
+    vars:
+      - name: ansible_httpapi_fortios_retry_error_codes
+  rate_limit:
+    description:
+      - Maximum number of requests per second sent to the device, 0 means unlimited.
+    type: float
+    default: 0
+    vars:
+      - name: ansible_httpapi_fortios_rate_limit
+  rate_limit_burst:
+    description:
+      - Number of requests which may be sent at once before I(rate_limit) applies.
+    type: int
+    default: 10
+    vars:
+      - name: ansible_httpapi_fortios_rate_limit_burst
+  adaptive_concurrency:
+    description:
+      - Adapt the number of concurrent requests between 1 and I(max_concurrency) to the device,
+        it is halved when the device throttles and grows back additively while requests succeed.
+    type: bool
+    default: true
+    vars:
+      - name: ansible_httpapi_fortios_adaptive_concurrency
+  adaptive_latency_target:
+    description:
+      - Latency in milliseconds above which a response is considered a congestion signal
+        by I(adaptive_concurrency), 0 only considers throttling responses.
+    type: int
+    default: 0
+    vars:
+      - name: ansible_httpapi_fortios_adaptive_latency_target
+  response_cache:
+    description:
+      - Cache successful CMDB GET responses inside the persistent connection, so that the tasks of a play
+        which read the same table or object again are answered without a request to the device.
+      - A PUT, POST or DELETE to a table drops the cached responses of that table in the same vdom,
+        any other write drops the whole cache.
+      - Hits and misses are reported in the trace records and by C(get_trace_stats).
+    type: bool
+    default: false
+    vars:
+      - name: ansible_httpapi_fortios_response_cache
+  response_cache_ttl:
+    description:
+      - Seconds for which a cached response is served.
+    type: int
+    default: 60
+    vars:
+      - name: ansible_httpapi_fortios_response_cache_ttl
+  response_cache_max_entries:
+    description:
+      - Maximum number of cached responses, the least recently used response is evicted first.
+    type: int
+    default: 256
+    vars:
+      - name: ansible_httpapi_fortios_response_cache_max_entries
+  response_cache_max_bytes:
+    description:
+      - Maximum total size in bytes of the cached responses.
+    type: int
+    default: 16777216
+    vars:
+      - name: ansible_httpapi_fortios_response_cache_max_bytes
+  existence_index:
+    description:
+      - Keep an index of the master keys of the CMDB tables written through the connection, so that
+        an object is created with POST or updated with PUT directly instead of trying PUT first.
+      - A table is listed once with only its master key, later writes through the connection keep the index up to date.
+    type: bool
+    default: true
+    vars:
+      - name: ansible_httpapi_fortios_existence_index
+  existence_index_ttl:
+    description:
+      - Seconds after which a table of the existence index is listed again.
+    type: int
+    default: 300
+    vars:
+      - name: ansible_httpapi_fortios_existence_index_ttl
+  snapshot_ttl:
+    description:
+      - Seconds for which the snapshot of a CMDB table read by the check mode of the modules is reused.
+        One snapshot is taken per table and vdom, writes through the connection drop the snapshot of the table.
+    type: int
+    default: 3600
+    vars:
+      - name: ansible_httpapi_fortios_snapshot_ttl
+  session_sharing:
+    description:
+      - Share one authenticated admin session between all the ansible-connection processes of the
+        controller which log in to the same device with the same username and password.
+      - The session is stored in a file locked local store, a process that gets a 401 logs in again once
+        for all of them and the session is only logged out by the last process using it.
+      - Not used with access token authentication.
+    type: bool
+    default: false
+    vars:
+      - name: ansible_httpapi_fortios_session_sharing
+  session_store_dir:
+    description:
+      - Directory of the shared session store, it is only readable by the current user.
+    type: path
+    default: ~/.ansible/tmp/fortios_sessions
+    vars:
+      - name: ansible_httpapi_fortios_session_store_dir
+  session_store_ttl:
+    description:
+      - Seconds after the last use for which a shared session is reused, keep it below the admin idle timeout of the device.
+    type: int
+    default: 240
+    vars:
+      - name: ansible_httpapi_fortios_session_store_ttl
+  system_cache:
+    description:
+      - Cache the firmware version and the validity of the access token on the controller,
+        so that parallel workers and later tasks do not query C(/api/v2/monitor/system/status) again.
+      - Entries are keyed by host and a fingerprint of the credential, the credential itself is not stored.
+    type: bool
+    default: false
+    vars:
+      - name: ansible_httpapi_fortios_system_cache
+  system_cache_dir:
+    description:
+      - Directory of the controller side system cache.
+    type: path
+    default: ~/.ansible/tmp/fortios_cache
+    vars:
+      - name: ansible_httpapi_fortios_system_cache_dir
+  system_cache_ttl:
+    description:
+      - Seconds for which a system cache entry is considered valid.
+    type: int
+    default: 300
+    vars:
+      - name: ansible_httpapi_fortios_system_cache_ttl
+  trace_file:
+    description:
+      - Path of a JSON lines file to which one trace record per REST API request is appended.
+      - A record holds the method, the url template with object keys replaced by C({mkey}), the vdom,
+        the status, the request and response sizes, the connect, TLS, time to first byte and total
+        timings in milliseconds and the retry count. Connect, TLS and time to first byte are only
+        measured when I(keepalive) is enabled.
+      - Per endpoint latency histograms are appended as a summary record on logout.
+    type: path
+    vars:
+      - name: ansible_httpapi_fortios_trace_file
+  trace_sink:
+    description:
+      - Custom trace sink importable on the controller, given as C(package.module.attribute).
+      - The attribute is either a class whose instances have a C(write(record)) method or a function called with every record.
+    type: str
+    vars:
+      - name: ansible_httpapi_fortios_trace_sink
 """
 
 import json
 from ansible.plugins.httpapi import HttpApiBase
 from ansible.module_utils.basic import to_text
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils.six import BytesIO
 from ansible.module_utils.six.moves import urllib
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.compression import ACCEPT_ENCODING, compress_body, decode_body, iter_decoded
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.compression import is_compressed
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.connection_pool import HTTPConnectionPool
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.existence_index import ExistenceIndex
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.json_stream import JSONResultsStream
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.rate_limit import RetryPolicy, TokenBucket, AIMDLimiter
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.response_cache import ResponseCache
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.query import build_query
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.session_store import SessionStore
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.system_cache import SystemStateCache, token_fingerprint
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.tracing import TraceRecorder, JSONLinesSink, load_sink
+import os
 import re
+import threading
+import time
 # import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 
@@ -40,6 +306,26 @@ class HttpApi(HttpApiBase):
         self._log = None
         self._logged_in = False
         self._session_key = ''
+        self._pool = None
+        self._system_cache = None
+        self._send_lock = threading.Lock()
+        self._tracer = None
+        self._retry_policy = None
+        self._rate_limiter = None
+        self._concurrency_limiter = None
+        self._response_cache = None
+        self._existence_index = None
+        self._snapshots = None
+        self._session_store = None
+        self._session_generation = 0
+        self._session_touched = 0
+
+    def _get_plugin_option(self, option, default=None):
+        try:
+            value = self.get_option(option)
+        except KeyError:
+            return default
+        return default if value is None else value
 
     def log(self, msg):
         log_enabled = self._conn.get_option('enable_log')
@@ -61,6 +347,222 @@ class HttpApi(HttpApiBase):
 
         return token
 
+    def _get_system_cache(self):
+        if not self._get_plugin_option('system_cache', False):
+            return None
+        if self._system_cache is None:
+            self._system_cache = SystemStateCache(
+                self._get_plugin_option('system_cache_dir', '~/.ansible/tmp/fortios_cache'),
+                ttl=self._get_plugin_option('system_cache_ttl', 300),
+            )
+        return self._system_cache
+
+    def _system_cache_key(self):
+        host = self.connection.get_option('host')
+        credential = self.get_access_token() or self.connection.get_option('remote_user')
+        return host, token_fingerprint(credential)
+
+    def _read_system_cache(self):
+        cache = self._get_system_cache()
+        if not cache:
+            return None
+        host, fingerprint = self._system_cache_key()
+        return cache.get(host, fingerprint)
+
+    def _write_system_cache(self, **values):
+        cache = self._get_system_cache()
+        if not cache:
+            return
+        host, fingerprint = self._system_cache_key()
+        try:
+            cache.update(host, fingerprint, **values)
+        except (IOError, OSError) as err:
+            self.log('failed to update system cache: %s' % (err))
+
+    def _invalidate_system_cache(self):
+        cache = self._get_system_cache()
+        if cache:
+            host, fingerprint = self._system_cache_key()
+            cache.invalidate(host, fingerprint)
+
+    def _get_tracer(self):
+        if self._tracer is None:
+            sinks = list()
+            trace_file = self._get_plugin_option('trace_file')
+            if trace_file:
+                sinks.append(JSONLinesSink(trace_file))
+            trace_sink = self._get_plugin_option('trace_sink')
+            if trace_sink:
+                sinks.append(load_sink(trace_sink))
+            self._tracer = TraceRecorder(sinks, log=self.log)
+        return self._tracer
+
+    def get_trace_stats(self):
+        """
+        Per endpoint latency histograms and counters of the requests sent over this connection.
+        """
+        stats = self._get_tracer().get_stats()
+        if self._concurrency_limiter:
+            stats['concurrency'] = self._concurrency_limiter.get_stats()
+        if self._response_cache:
+            stats['response_cache'] = self._response_cache.get_stats()
+        return stats
+
+    def _get_response_cache(self):
+        if not self._get_plugin_option('response_cache', False):
+            return None
+        if self._response_cache is None:
+            self._response_cache = ResponseCache(
+                max_entries=self._get_plugin_option('response_cache_max_entries', 256),
+                max_bytes=self._get_plugin_option('response_cache_max_bytes', 16 * 1024 * 1024),
+                ttl=self._get_plugin_option('response_cache_ttl', 60),
+            )
+        return self._response_cache
+
+    def _get_existence_index(self):
+        if not self._get_plugin_option('existence_index', True):
+            return None
+        if self._existence_index is None:
+            self._existence_index = ExistenceIndex(ttl=self._get_plugin_option('existence_index_ttl', 300))
+        return self._existence_index
+
+    def object_exists(self, url, mkey_name, mkey):
+        """
+        Tell whether an object of a CMDB table exists, the table is listed once with only its master key.
+        :param url: The url of the table, e.g. /api/v2/cmdb/firewall/address?vdom=root
+        :param mkey_name: The name of the master key attribute of the table.
+
+        :return: True or False, None if it is unknown and the caller has to find it out itself.
+        """
+        existence_index = self._get_existence_index()
+        if not existence_index:
+            return None
+        exists = existence_index.lookup(url, mkey)
+        if exists is not None:
+            return exists
+        status, result_data = self.send_request(url=url, params={'format': mkey_name}, method='GET')
+        try:
+            results = json.loads(result_data)['results'] if status == 200 else None
+        except (ValueError, KeyError, TypeError):
+            results = None
+        if not isinstance(results, list):
+            return None
+        existence_index.load(url, mkey_name, [result.get(mkey_name) for result in results if isinstance(result, dict)])
+        self.log('indexed %d objects of %s' % (len(results), url))
+        return existence_index.lookup(url, mkey)
+
+    def get_snapshot(self, url):
+        """
+        GET a CMDB table once per connection for check mode, later calls are served from the snapshot
+        until it expires or a write through the connection changes the table.
+
+        :return: Status code and response data.
+        """
+        if self._snapshots is None:
+            self._snapshots = ResponseCache(max_entries=1024, max_bytes=64 * 1024 * 1024,
+                                            ttl=self._get_plugin_option('snapshot_ttl', 3600))
+        cached = self._snapshots.get('GET', url)
+        if cached:
+            return cached
+        status, result_data = self.send_request(url=url, method='GET')
+        self._snapshots.put('GET', url, status, result_data)
+        return status, result_data
+
+    def _init_scheduler(self):
+        if self._retry_policy is not None:
+            return
+        self._retry_policy = RetryPolicy(
+            max_retries=self._get_plugin_option('retry_max_attempts', 3),
+            base_delay=self._get_plugin_option('retry_backoff_base', 0.5),
+            max_delay=self._get_plugin_option('retry_backoff_max', 30),
+            error_codes=self._get_plugin_option('retry_error_codes', []),
+        )
+        self._rate_limiter = TokenBucket(
+            rate=self._get_plugin_option('rate_limit', 0),
+            burst=self._get_plugin_option('rate_limit_burst', 10),
+        )
+        maximum = self._get_plugin_option('max_concurrency', 4) if self._get_plugin_option('keepalive', False) else 1
+        self._concurrency_limiter = AIMDLimiter(
+            maximum,
+            minimum=1 if self._get_plugin_option('adaptive_concurrency', True) else maximum,
+            latency_target_ms=self._get_plugin_option('adaptive_latency_target', 0),
+        )
+
+    def _get_session_store(self):
+        if not self._get_plugin_option('session_sharing', False):
+            return None
+        if 'access_token' in self._conn._options and self._conn.get_option('access_token'):
+            return None
+        if self._session_store is None:
+            self._session_store = SessionStore(
+                self._get_plugin_option('session_store_dir', '~/.ansible/tmp/fortios_sessions'),
+                ttl=self._get_plugin_option('session_store_ttl', 240),
+            )
+        return self._session_store
+
+    def _adopt_shared_session(self, entry):
+        self.connection._auth = entry.get('auth_headers') or None
+        self._session_key = entry.get('session_key', '')
+        self._session_generation = entry.get('generation', 0)
+        self._logged_in = True
+
+    def _save_shared_session(self, store, host, username, holders, generation):
+        entry = {
+            'auth_headers': dict(self.connection._auth or {}),
+            'session_key': self._session_key,
+            'holders': holders,
+            'generation': generation,
+        }
+        self._session_generation = generation
+        self._session_touched = time.time()
+        store.register(host, username, entry)
+
+    def _login_shared_session(self, store, username, password):
+        host = self.connection.get_option('host')
+        with store.lock(host, username):
+            entry = store.load(host, username)
+            if entry:
+                self.log('reusing shared session of generation %d' % (entry['generation']))
+                self._adopt_shared_session(entry)
+                store.register(host, username, entry)
+                self._session_touched = time.time()
+                return
+            self._login_with_password(username, password)
+            self._save_shared_session(store, host, username, [], 1)
+
+    def _refresh_shared_session(self, rejected_generation):
+        """
+        Log in again after a 401 unless another process or thread already did it, the newest session wins.
+        :param rejected_generation: The generation of the session the device rejected.
+        """
+        store = self._get_session_store()
+        host = self.connection.get_option('host')
+        username = self.connection.get_option('remote_user')
+        with store.lock(host, username):
+            entry = store.load(host, username)
+            if entry and entry['generation'] > rejected_generation:
+                self.log('adopting refreshed shared session of generation %d' % (entry['generation']))
+                self._adopt_shared_session(entry)
+                store.register(host, username, entry)
+                return
+            self.log('shared session rejected, logging in again')
+            self._logged_in = False
+            self._session_key = ''
+            self.connection._auth = None
+            self._login_with_password(username, self.connection.get_option('password'))
+            generation = max(entry['generation'] if entry else 0, self._session_generation) + 1
+            self._save_shared_session(store, host, username, entry['holders'] if entry else [], generation)
+
+    def _touch_shared_session(self):
+        store = self._get_session_store()
+        if not store or time.time() - self._session_touched < store.ttl / 3:
+            return
+        self._session_touched = time.time()
+        host = self.connection.get_option('host')
+        username = self.connection.get_option('remote_user')
+        with store.lock(host, username):
+            store.touch(host, username)
+
     def set_become(self, become_context):
         """
         Elevation is not required on Fortinet devices - Skipped
@@ -83,15 +585,36 @@ class HttpApi(HttpApiBase):
         if self.get_access_token() is not None:
             self.log('login with access token')
             self._logged_in = True
+            cached = self._read_system_cache()
+            if cached and cached.get('auth_valid'):
+                self.log('access token validated by system cache, skipping login check')
+                self._system_version = self._system_version or cached.get('system_version')
+                return
             self.send_request(url='/logincheck')
-            status, dummy = self.send_request(url='/api/v2/monitor/system/status?vdom=root')
+            status, result = self.send_request(url='/api/v2/monitor/system/status?vdom=root')
 
             if status == 401:
+                self._invalidate_system_cache()
                 raise Exception('Invalid access token. Please check')
 
+            cached_values = {'auth_valid': True}
+            try:
+                cached_values['system_version'] = json.loads(result).get('version')
+            except ValueError:
+                pass
+            self._write_system_cache(**cached_values)
             self.log('login with access token succeeded')
             return
 
+        store = self._get_session_store()
+        if store:
+            self._login_shared_session(store, username, password)
+        else:
+            self._login_with_password(username, password)
+
+        self.update_system_version()
+
+    def _login_with_password(self, username, password):
         self.log('login with username and password, try API based auth first')
         auth_payload = {
             "username": username,
@@ -126,15 +649,34 @@ class HttpApi(HttpApiBase):
                 # some older fortios version may pass session key through cookies
                 pass
 
-        self.update_system_version()
-
     def logout(self):
         """ Call to implement session logout."""
         self.log('logout')
+        store = self._get_session_store()
+        if store and self._logged_in:
+            host = self.connection.get_option('host')
+            username = self.connection.get_option('remote_user')
+            with store.lock(host, username):
+                is_last_holder = store.unregister(host, username)
+            if not is_last_holder:
+                self.log('shared session still used by other processes, skipping logout')
+                self._logged_in = False
+                self._release_resources()
+                return
+        # a rejected logout must not log in again.
         if self._session_key:
-            self.send_request(url='/api/v2/authentication', method='DELETE')
+            self.send_request(url='/api/v2/authentication', method='DELETE', _session_refreshed=True)
         else:
-            self.send_request(url='/logout', method="POST")
+            self.send_request(url='/logout', method="POST", _session_refreshed=True)
+        self._release_resources()
+
+    def _release_resources(self):
+        if self._tracer and self._tracer.sinks:
+            self._tracer.flush()
+        if self._pool:
+            self.log('keep-alive connection pool stats: %s' % (self._pool.get_stats()))
+            self._pool.close()
+            self._pool = None
 
     def update_auth(self, response, response_text):
         """
@@ -193,27 +735,19 @@ class HttpApi(HttpApiBase):
         return url
 
     def _concat_params(self, url, params):
-        if not params or not len(params):
-            return url
-        url = url + '?' if '?' not in url else url
-        for param_key in params:
-            param_value = params[param_key]
-            if url[-1] == '?':
-                url += '%s=%s' % (param_key, param_value)
-            else:
-                url += '&%s=%s' % (param_key, param_value)
-        return url
-
-    def send_request(self, **message_kwargs):
         """
-        Responsible for actual sending of data to the connection httpapi base plugin.
-        :param should_pre_login: should perform login in place instead of having connection obj to trigger.
-            this is required because for httpapi update_auth can only update headers but /api/v2/authentication
-            returns sessio_key in resp body.
-        :param message_kwargs: A formatted dictionary containing request info: url, data, method
-
-        :return: Status code and response data.
+        Append the query parameters to the url, values are url encoded.
+        :param params: A dictionary, a list value is sent as a repeated key (e.g. several filter keys),
+            or a list of [key, value] pairs.
         """
+        query = build_query(params)
+        if not query:
+            return url
+        if '?' not in url:
+            return url + '?' + query
+        return url + ('' if url[-1] in ['?', '&'] else '&') + query
+
+    def _prepare_request(self, message_kwargs):
         if not self._logged_in and message_kwargs.get('should_pre_login', True):
             self.log('perform pre request login')
             # trigger automated login call by httpapi
@@ -228,18 +762,310 @@ class HttpApi(HttpApiBase):
         params = message_kwargs.get('params', {})
 
         url = self._concat_params(url, params)
+        return url, data, method
+
+    def send_request(self, **message_kwargs):
+        """
+        Responsible for actual sending of data to the connection httpapi base plugin.
+        :param should_pre_login: should perform login in place instead of having connection obj to trigger.
+            this is required because for httpapi update_auth can only update headers but /api/v2/authentication
+            returns sessio_key in resp body.
+        :param message_kwargs: A formatted dictionary containing request info: url, data, method
+
+        :return: Status code and response data.
+        """
+        url, data, method = self._prepare_request(message_kwargs)
         self.log('Sending request: METHOD:%s URL:%s DATA:%s' % (method, url, data))
 
+        self._init_scheduler()
+        session_generation = self._session_generation
+        trace = dict()
+        started = time.time()
+        retries = 0
+        response_cache = self._get_response_cache()
+        if response_cache and method == 'GET':
+            cached = response_cache.get(method, url)
+            trace['cache'] = 'hit' if cached else 'miss'
+            self._get_tracer().increase('cache_hits' if cached else 'cache_misses')
+            if cached:
+                self._get_tracer().record(method, url, cached[0], (time.time() - started) * 1000, request_bytes=0,
+                                          response_bytes=len(cached[1]), retries=0, **trace)
+                self.log("response data from cache: %s...<truncated>" % (cached[1][:200]))
+                return cached[0], cached[1]
+        elif response_cache:
+            response_cache.invalidate(url)
         try:
-            response, response_data = self.connection.send(url, data, method=method)
+            while True:
+                self._rate_limiter.acquire()
+                self._concurrency_limiter.acquire()
+                sent = time.time()
+                try:
+                    response, response_data = self._send(url, data, method, message_kwargs.get('timeout'), trace=trace)
+                except Exception:
+                    self._concurrency_limiter.release()
+                    raise
+                json_formatted = to_text(response_data.getvalue())
+                throttled = self._retry_policy.is_throttled(response.status, json_formatted)
+                self._concurrency_limiter.release(throttled, (time.time() - sent) * 1000)
+                if not throttled or retries >= self._retry_policy.max_retries:
+                    break
+                headers = getattr(response, 'headers', None)
+                delay = self._retry_policy.delay(retries, headers.get('Retry-After') if headers else None)
+                retries += 1
+                self._get_tracer().increase('throttled')
+                self.log('request throttled with status %s, retry %d in %.2f seconds' % (response.status, retries, delay))
+                time.sleep(delay)
 
-            json_formatted = to_text(response_data.getvalue())
+            if response.status == 401:
+                # a cached token validation must not outlive a rejected request.
+                self._invalidate_system_cache()
+                if self._logged_in and self._get_session_store() and not message_kwargs.get('_session_refreshed'):
+                    self._refresh_shared_session(session_generation)
+                    return self.send_request(_session_refreshed=True, **message_kwargs)
+            elif self._logged_in and self._get_session_store():
+                self._touch_shared_session()
+            if response_cache and method == 'GET':
+                response_cache.put(method, url, response.status, json_formatted)
+            elif response_cache:
+                # drop what a concurrent reader may have cached while the write was in flight.
+                response_cache.invalidate(url)
+            if method != 'GET' and self._existence_index:
+                self._existence_index.record_write(method, url, response.status, json_formatted)
+            if method != 'GET' and self._snapshots:
+                self._snapshots.invalidate(url)
 
+            self._get_tracer().record(method, url, response.status, (time.time() - started) * 1000,
+                                      request_bytes=len(to_bytes(data)) if data else 0,
+                                      response_bytes=len(response_data.getvalue()),
+                                      retries=retries + trace.pop('pool_retries', 0), **trace)
             self.log("response data: %s...<truncated>" % (json_formatted[:200]))
             return response.status, json_formatted
         except Exception as err:
             raise Exception(err)
 
+    def _open_stream(self, url, data, method, timeout, trace):
+        """
+        :return: The response to close once read, None if there is nothing to close, its status,
+        its Retry-After header and an iterator of the decompressed chunks of its body.
+        """
+        if self._get_plugin_option('keepalive', False) and self.connection._auth:
+            headers, body = self._build_pooled_request(method, data, trace)
+            response = self._get_connection_pool().stream(method, url, body=body, headers=headers, timeout=timeout, trace=trace)
+            self.connection._auth = self.update_auth(response, None) or self.connection._auth
+            chunks = iter_decoded(response.iter_chunks(), response.getheader('Content-Encoding'))
+            return response, response.status, response.getheader('Retry-After'), chunks
+        # the connection plugin reads the whole body, it is still decoded item by item.
+        plain_response, response_data = self._send(url, data, method, trace=trace)
+        headers = getattr(plain_response, 'headers', None)
+        chunks = iter(lambda: response_data.read(65536), b'')
+        return None, plain_response.status, headers.get('Retry-After') if headers else None, chunks
+
+    def stream_request(self, **message_kwargs):
+        """
+        Send a request and write the items of the results array of the response to a file as JSON lines,
+        the response is decoded incrementally so that it is never held in memory as a whole.
+        The request is throttled, limited and retried as in send_request, the response cache, the shared
+        session refresh and the existence index are not involved.
+        :param dest: The absolute path of the JSON lines file to write, the other arguments are the same as send_request.
+
+        :return: Status code, response data without the results items and the number of items written.
+        """
+        dest = message_kwargs['dest']
+        if not os.path.isabs(dest):
+            # the path would resolve against the working directory of the persistent connection.
+            raise Exception('dest must be an absolute path: %s' % (dest))
+        url, data, method = self._prepare_request(message_kwargs)
+        self.log('Streaming request: METHOD:%s URL:%s DEST:%s' % (method, url, dest))
+
+        self._init_scheduler()
+        response = None
+        trace = dict()
+        started = time.time()
+        retries = 0
+        try:
+            while True:
+                self._rate_limiter.acquire()
+                self._concurrency_limiter.acquire()
+                sent = time.time()
+                throttled = False
+                try:
+                    response, status, retry_after, chunks = self._open_stream(url, data, method, message_kwargs.get('timeout'), trace)
+                    if status != 200:
+                        # an error response is small, it is read at once to tell whether it is throttled.
+                        body = b''.join(chunks)
+                        chunks = iter([body])
+                        throttled = self._retry_policy.is_throttled(status, to_text(body))
+                except Exception:
+                    self._concurrency_limiter.release()
+                    raise
+                latency_ms = (time.time() - sent) * 1000
+                if not throttled or retries >= self._retry_policy.max_retries:
+                    break
+                self._concurrency_limiter.release(throttled, latency_ms)
+                if response:
+                    response.close()
+                    response = None
+                delay = self._retry_policy.delay(retries, retry_after)
+                retries += 1
+                self._get_tracer().increase('throttled')
+                self.log('streamed request throttled with status %s, retry %d in %.2f seconds' % (status, retries, delay))
+                time.sleep(delay)
+
+            try:
+                stream = JSONResultsStream(chunks)
+                with open(dest, 'w') as f:
+                    for item in stream:
+                        f.write(json.dumps(item))
+                        f.write('\n')
+            finally:
+                self._concurrency_limiter.release(throttled, latency_ms)
+            if status == 401:
+                self._invalidate_system_cache()
+            self._get_tracer().record(method, url, status, (time.time() - started) * 1000,
+                                      request_bytes=len(to_bytes(data)) if data else 0,
+                                      results_count=stream.count, streamed=True,
+                                      retries=retries + trace.pop('pool_retries', 0), **trace)
+            self.log('streamed %d items to %s, status: %s' % (stream.count, dest, status))
+            return status, json.dumps(stream.envelope), stream.count
+        except Exception as err:
+            raise Exception(err)
+        finally:
+            if response:
+                response.close()
+
+    def send_requests(self, requests, max_workers=None):
+        """
+        Dispatch a batch of requests over a bounded worker pool.
+        :param requests: A list of dictionaries with the send_request arguments: url, data, method, params.
+        :param max_workers: Optional upper bound of concurrent requests, capped by the max_concurrency option.
+
+        :return: A list of [status code, response data] in the same order as requests,
+            the status code is None if the request raised an error.
+        """
+        if not requests:
+            return []
+        if not self._logged_in:
+            self.log('perform pre request login')
+            self.connection.send("/logincheck", {})
+
+        concurrency = self._get_plugin_option('max_concurrency', 4)
+        # create the shared helpers before workers race for them.
+        self._get_tracer()
+        self._init_scheduler()
+        self._get_response_cache()
+        self._get_existence_index()
+        if self._get_plugin_option('keepalive', False):
+            self._get_connection_pool()
+        else:
+            concurrency = 1
+        if max_workers:
+            concurrency = min(concurrency, max_workers)
+        concurrency = max(1, min(concurrency, len(requests)))
+        self.log('dispatching %d requests with concurrency %d' % (len(requests), concurrency))
+
+        def _dispatch(request):
+            try:
+                return list(self.send_request(**request))
+            except Exception as err:
+                return [None, to_text(err)]
+
+        if concurrency == 1:
+            return [_dispatch(request) for request in requests]
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            return list(executor.map(_dispatch, requests))
+        finally:
+            executor.shutdown(wait=True)
+
+    def _get_connection_pool(self):
+        if self._pool is None:
+            self._pool = HTTPConnectionPool(
+                self.connection._url,
+                max_size=self._get_plugin_option('keepalive_pool_size', 4),
+                idle_timeout=self._get_plugin_option('keepalive_idle_timeout', 30),
+                timeout=self.connection.get_option('persistent_command_timeout'),
+                validate_certs=self.connection.get_option('validate_certs'),
+                health_check=self._get_plugin_option('keepalive_health_check', True),
+                ciphers=self.connection.get_option('ciphers') if 'ciphers' in self.connection._options else None,
+            )
+        return self._pool
+
+    def _compress_request_body(self, method, body, headers, trace):
+        if method not in ['PUT', 'POST'] or not self._get_plugin_option('compress_requests', False):
+            return body
+        if len(body) < self._get_plugin_option('compress_requests_min_size', 65536):
+            return body
+        compressed = compress_body(body)
+        headers['Content-Encoding'] = 'gzip'
+        if trace is not None:
+            trace['request_wire_bytes'] = len(compressed)
+        return compressed
+
+    def _build_pooled_request(self, method, data, trace):
+        headers = dict(self.connection._auth)
+        if self._get_plugin_option('compression', True):
+            headers['Accept-Encoding'] = ACCEPT_ENCODING
+        body = None
+        if data:
+            body = to_bytes(data)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+            body = self._compress_request_body(method, body, headers, trace)
+        return headers, body
+
+    def _decode_plugin_response(self, response, response_data, trace):
+        headers = getattr(response, 'headers', None)
+        content_encoding = headers.get('Content-Encoding') if headers else None
+        body = response_data.getvalue()
+        # open_url may have decompressed the body already.
+        if not is_compressed(content_encoding) or body[:2] != b'\x1f\x8b':
+            return response_data
+        if trace is not None:
+            trace['content_encoding'] = content_encoding
+            trace['response_wire_bytes'] = len(body)
+        return BytesIO(decode_body(body, content_encoding))
+
+    def _send(self, url, data, method, timeout=None, trace=None):
+        """
+        Send the request over the keep-alive connection pool if it is enabled, the initial
+        login exchange always goes through the connection plugin which establishes the session.
+        :return: response object and a BytesIO buffer of the decompressed response body.
+        """
+        if not self._get_plugin_option('keepalive', False) or not self.connection._auth:
+            headers = dict()
+            if self.connection._auth and self._get_plugin_option('compression', True):
+                # http.client asks for an identity encoded body unless told otherwise.
+                headers['Accept-Encoding'] = 'gzip'
+            if data and self.connection._auth:
+                data = self._compress_request_body(method, to_bytes(data), headers, trace)
+            # the connection plugin keeps a single auth state and is not thread safe.
+            with self._send_lock:
+                if headers:
+                    response, response_data = self.connection.send(url, data, method=method, headers=headers)
+                else:
+                    response, response_data = self.connection.send(url, data, method=method)
+            return response, self._decode_plugin_response(response, response_data, trace)
+
+        headers, body = self._build_pooled_request(method, data, trace)
+        response, response_body = self._get_connection_pool().request(method, url, body=body, headers=headers, timeout=timeout, trace=trace)
+        content_encoding = response.getheader('Content-Encoding')
+        if content_encoding and trace is not None:
+            trace['content_encoding'] = content_encoding
+            trace['response_wire_bytes'] = len(response_body)
+        response_data = BytesIO(decode_body(response_body, content_encoding))
+        self.connection._auth = self.update_auth(response, response_data) or self.connection._auth
+        response_data.seek(0)
+        return response, response_data
+
+    def get_connection_pool_stats(self):
+        """
+        Report how often keep-alive connections were created, reused and discarded.
+        """
+        if not self._pool:
+            return {'enabled': bool(self._get_plugin_option('keepalive', False))}
+        stats = self._pool.get_stats()
+        stats['enabled'] = True
+        return stats
+
     def update_system_version(self):
         """
         retrieve the system status of fortigate device
@@ -248,10 +1074,17 @@ class HttpApi(HttpApiBase):
         check_system_status = self._conn.get_option('check_system_status') if 'check_system_status' in self._conn._options else True
         if not check_system_status or self._system_version:
             return
+        cached = self._read_system_cache()
+        if cached and cached.get('system_version'):
+            self._system_version = cached['system_version']
+            self.log('system version from system cache: %s' % (self._system_version))
+            return
         url = '/api/v2/monitor/system/status?vdom=root'
         status, result = self.send_request(url=url)
         result_json = json.loads(result)
         self._system_version = result_json.get('version', 'undefined')
+        if status == 200 and 'version' in result_json:
+            self._write_system_cache(system_version=self._system_version)
         self.log('system version: %s' % (self._system_version))
         self.log('ansible version: %s' % (self._ansible_fos_version))
 
@@ -86,6 +86,33 @@ def is_same_comparison(reorder_current, reorder_filtered):
     return True
 
 
+def is_same_value(current_value, desired_value):
+    '''
+    Compare a serialized desired value with the current one. Unlike is_same_comparison, every member
+    of a list of dicts is matched, at its own position or else anywhere in the current list, and the
+    attributes following an address are compared too. Use it to decide whether a write can be skipped.
+    '''
+    if isinstance(desired_value, dict):
+        if not isinstance(current_value, dict):
+            return False
+        for key, value in desired_value.items():
+            if key not in current_value or not is_same_value(current_value[key], value):
+                return False
+        return True
+    if isinstance(desired_value, list):
+        if not isinstance(current_value, list) or len(current_value) != len(desired_value):
+            return False
+        if len(desired_value) and isinstance(desired_value[0], dict):
+            for current_member, member in zip(current_value, desired_value):
+                if not is_same_value(current_member, member) and not any(is_same_value(other, member) for other in current_value):
+                    return False
+            return True
+        return current_value == desired_value
+    if isinstance(desired_value, str) and IP_PREFIX.match(desired_value):
+        return isinstance(current_value, (str, list)) and is_same_ip_address(current_value, desired_value)
+    return current_value == desired_value
+
+
 def find_current_values(reorder_current, reorder_filtered):
     '''Find keyvalues in current according to keys from filtered'''
     result = {}
@@ -0,0 +1,76 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import gzip
+import io
+import zlib
+
+ACCEPT_ENCODING = 'gzip, deflate'
+SUPPORTED_ENCODINGS = ['gzip', 'x-gzip', 'deflate']
+
+
+class StreamDecompressor(object):
+    '''
+    Incremental decoder of a gzip or deflate encoded body.
+    deflate is sent by some servers without the zlib header, both forms are accepted.
+    '''
+
+    def __init__(self, content_encoding):
+        self.encoding = (content_encoding or '').strip().lower()
+        # 32 + MAX_WBITS detects either a gzip or a zlib header.
+        self._decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        self._first_chunk = True
+
+    def decompress(self, chunk):
+        if self._first_chunk and self.encoding == 'deflate':
+            self._first_chunk = False
+            try:
+                return self._decompressor.decompress(chunk)
+            except zlib.error:
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._first_chunk = False
+        return self._decompressor.decompress(chunk)
+
+    def flush(self):
+        return self._decompressor.flush()
+
+
+def is_compressed(content_encoding):
+    return (content_encoding or '').strip().lower() in SUPPORTED_ENCODINGS
+
+
+def decode_body(data, content_encoding):
+    if not data or not is_compressed(content_encoding):
+        return data
+    decompressor = StreamDecompressor(content_encoding)
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+def iter_decoded(chunks, content_encoding):
+    if not is_compressed(content_encoding):
+        for chunk in chunks:
+            yield chunk
+        return
+    decompressor = StreamDecompressor(content_encoding)
+    for chunk in chunks:
+        data = decompressor.decompress(chunk)
+        if data:
+            yield data
+    data = decompressor.flush()
+    if data:
+        yield data
+
+
+def compress_body(data):
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=6) as f:
+        f.write(data)
+    return buffer.getvalue()
@@ -0,0 +1,265 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import select
+import socket
+import ssl
+import threading
+import time
+
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+# errors which indicate that a kept-alive socket was closed by the peer
+# between two requests, the request may be replayed on a new socket.
+STALE_CONNECTION_ERRORS = (
+    http_client.BadStatusLine,
+    http_client.CannotSendRequest,
+    http_client.ResponseNotReady,
+    socket.error,
+)
+
+# a request which failed once it was sent may have been processed by the device,
+# only these methods are then replayed, the others only if sending failed.
+REPLAYABLE_METHODS = ['GET', 'HEAD']
+
+
+class PooledConnection(object):
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.requests = 0
+
+
+class PooledResponse(object):
+    '''A response whose body is read incrementally from a pooled connection.'''
+
+    def __init__(self, pool, pooled, response):
+        self._pool = pool
+        self._pooled = pooled
+        self._response = response
+        self._consumed = False
+        self._closed = False
+        self.status = response.status
+
+    def getheaders(self):
+        return self._response.getheaders()
+
+    def getheader(self, name, default=None):
+        return self._response.getheader(name, default)
+
+    def iter_chunks(self, chunk_size=65536):
+        while True:
+            chunk = self._response.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        self._consumed = True
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._consumed:
+            self._pooled.requests += 1
+        self._pool.release(self._pooled, reusable=self._consumed and not self._response.will_close)
+
+
+class HTTPConnectionPool(object):
+    '''
+    A bounded pool of persistent HTTP/1.1 keep-alive connections to one device.
+
+    The pool is owned by a single ansible-connection process, at most max_size
+    sockets are opened at any time and idle sockets are reused in LIFO order.
+    '''
+
+    def __init__(self, base_url, max_size=4, idle_timeout=30, timeout=30,
+                 validate_certs=True, health_check=True, ciphers=None):
+        parsed = urlparse(base_url)
+        self.scheme = parsed.scheme or 'https'
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if self.scheme == 'https' else 80)
+        self.max_size = max(1, int(max_size))
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.validate_certs = validate_certs
+        self.health_check = health_check
+        self.ciphers = ciphers
+        self._ssl_context = None
+        self._idle = list()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self.stats = {
+            'requests': 0,
+            'created': 0,
+            'reused': 0,
+            'discarded': 0,
+            'health_check_failures': 0,
+        }
+
+    def _get_ssl_context(self):
+        if self._ssl_context is None:
+            context = ssl.create_default_context()
+            if not self.validate_certs:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            if self.ciphers:
+                context.set_ciphers(':'.join(self.ciphers) if isinstance(self.ciphers, list) else self.ciphers)
+            self._ssl_context = context
+        return self._ssl_context
+
+    def _new_connection(self):
+        if self.scheme == 'https':
+            conn = http_client.HTTPSConnection(self.host, self.port, timeout=self.timeout, context=self._get_ssl_context())
+        else:
+            conn = http_client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        self._increase('created')
+        return PooledConnection(conn)
+
+    def _increase(self, counter, step=1):
+        with self._lock:
+            self.stats[counter] += step
+
+    def _is_healthy(self, pooled):
+        if self.idle_timeout and time.time() - pooled.last_used > self.idle_timeout:
+            return False
+        sock = pooled.conn.sock
+        if sock is None:
+            return False
+        if not self.health_check:
+            return True
+        # an idle keep-alive socket must not be readable: readability means
+        # either the peer closed it (EOF) or it sent unsolicited data.
+        try:
+            readable, dummy, dummy = select.select([sock], [], [], 0)
+        except (ValueError, socket.error):
+            return False
+        if readable:
+            self._increase('health_check_failures')
+            return False
+        return True
+
+    def _discard(self, pooled):
+        self._increase('discarded')
+        try:
+            pooled.conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        self._slots.acquire()
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+            if pooled is None:
+                return self._new_connection(), False
+            if self._is_healthy(pooled):
+                self._increase('reused')
+                return pooled, True
+            self._discard(pooled)
+
+    def release(self, pooled, reusable=True):
+        try:
+            if reusable and pooled.conn.sock is not None:
+                pooled.last_used = time.time()
+                with self._lock:
+                    self._idle.append(pooled)
+            else:
+                self._discard(pooled)
+        finally:
+            self._slots.release()
+
+    def _connect(self, pooled, trace):
+        conn = pooled.conn
+        started = time.time()
+        # connect in two steps to tell the TCP handshake from the TLS handshake.
+        http_client.HTTPConnection.connect(conn)
+        connected = time.time()
+        trace['connect_ms'] = round((connected - started) * 1000, 3)
+        if self.scheme == 'https':
+            conn.sock = self._get_ssl_context().wrap_socket(conn.sock, server_hostname=self.host)
+            trace['tls_ms'] = round((time.time() - connected) * 1000, 3)
+
+    def _open(self, method, path, body, headers, timeout, trace):
+        self._increase('requests')
+        attempts = 0
+        while True:
+            attempts += 1
+            pooled, reused = self.acquire()
+            trace['reused'] = reused
+            trace['pool_retries'] = attempts - 1
+            sent = False
+            try:
+                pooled.conn.timeout = timeout or self.timeout
+                if pooled.conn.sock is None:
+                    self._connect(pooled, trace)
+                else:
+                    pooled.conn.sock.settimeout(timeout or self.timeout)
+                started = time.time()
+                pooled.conn.request(method, path, body=body, headers=headers or {})
+                sent = True
+                response = pooled.conn.getresponse()
+                trace['ttfb_ms'] = round((time.time() - started) * 1000, 3)
+                return pooled, response
+            except socket.timeout:
+                self.release(pooled, reusable=False)
+                raise
+            except STALE_CONNECTION_ERRORS:
+                self.release(pooled, reusable=False)
+                if reused and attempts == 1 and (not sent or method in REPLAYABLE_METHODS):
+                    continue
+                raise
+            except Exception:
+                self.release(pooled, reusable=False)
+                raise
+
+    def request(self, method, path, body=None, headers=None, timeout=None, trace=None):
+        '''
+        Send one request and read the whole response body.
+        :param trace: Optional dictionary filled with connect, TLS and time-to-first-byte timings.
+        :return: the http_client response object and the response body in bytes.
+        '''
+        pooled, response = self._open(method, path, body, headers, timeout, trace if trace is not None else dict())
+        try:
+            response_data = response.read()
+        except Exception:
+            self.release(pooled, reusable=False)
+            raise
+        pooled.requests += 1
+        self.release(pooled, reusable=not response.will_close)
+        return response, response_data
+
+    def stream(self, method, path, body=None, headers=None, timeout=None, trace=None):
+        '''
+        Send one request without reading the response body.
+        :return: a PooledResponse, the caller must close it to return the connection to the pool.
+        '''
+        pooled, response = self._open(method, path, body, headers, timeout, trace if trace is not None else dict())
+        return PooledResponse(self, pooled, response)
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['idle'] = len(self._idle)
+        stats['max_size'] = self.max_size
+        stats['reuse_ratio'] = round(float(stats['reused']) / stats['requests'], 4) if stats['requests'] else 0.0
+        return stats
+
+    def close(self):
+        with self._lock:
+            idle = self._idle
+            self._idle = list()
+        for pooled in idle:
+            try:
+                pooled.conn.close()
+            except Exception:
+                pass
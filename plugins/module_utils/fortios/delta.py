@@ -0,0 +1,93 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_value, serialize
+
+# a nested table is rewritten as a whole if more of its members change.
+SUB_TABLE_MAX_CHANGE_RATIO = 0.5
+
+
+def find_child_mkey(options):
+    '''the master key of a nested table is its only required attribute.'''
+    required = [attr for attr, spec in options.items() if spec.get('required')]
+    return required[0] if len(required) == 1 else None
+
+
+def is_same_attribute(current_value, desired_value):
+    return is_same_value(serialize(current_value), serialize(desired_value))
+
+
+def diff_members(mkey_name, current_members, desired_members):
+    '''
+    :return: The members to create, update and delete, or None if the table has to be written as a whole:
+        a member without master key, a changed order, too many or no member changes.
+    '''
+    current_index = dict()
+    for position, member in enumerate(current_members):
+        if not isinstance(member, dict) or member.get(mkey_name) is None:
+            return None
+        current_index[str(member[mkey_name])] = (position, member)
+
+    changes = {'create': [], 'update': [], 'delete': []}
+    desired_keys = set()
+    last_position = -1
+    for member in desired_members:
+        if not isinstance(member, dict) or member.get(mkey_name) is None:
+            return None
+        member_key = str(member[mkey_name])
+        desired_keys.add(member_key)
+        if member_key not in current_index:
+            changes['create'].append(member)
+            continue
+        position, current_member = current_index[member_key]
+        # created members are appended by the device, the kept ones must not move.
+        if changes['create'] or position < last_position:
+            return None
+        last_position = position
+        if not is_same_value(serialize(current_member), serialize(member)):
+            changes['update'].append(member)
+    changes['delete'] = [member[mkey_name] for member in current_members if str(member[mkey_name]) not in desired_keys]
+
+    total_changes = len(changes['create']) + len(changes['update']) + len(changes['delete'])
+    if not total_changes or total_changes > max(1, int(len(current_members) * SUB_TABLE_MAX_CHANGE_RATIO)):
+        return None
+    return changes
+
+
+def compute_delta(options, current_object, desired_object):
+    '''
+    Diff the object to write against its current state.
+    :param options: The argument spec options of the object, keyed by the underscore attribute names.
+    :param current_object: The object as returned by the device.
+    :param desired_object: The object to write, keyed by the hyphen attribute names.
+
+    :return: The changed top level attributes to PUT, and per nested table updated through its own url
+        a dictionary of its master key and the members to create, update and delete.
+    '''
+    delta = dict()
+    sub_tables = dict()
+    for attr, value in desired_object.items():
+        if attr not in current_object:
+            delta[attr] = value
+            continue
+        if is_same_attribute(current_object[attr], value):
+            continue
+        spec = options.get(attr.replace('-', '_')) or {}
+        child_mkey = None
+        if spec.get('type') == 'list' and spec.get('elements') == 'dict' and isinstance(current_object[attr], list):
+            child_mkey = find_child_mkey(spec.get('options') or {})
+        changes = diff_members(child_mkey.replace('_', '-'), current_object[attr], value) if child_mkey and value else None
+        if changes:
+            changes['mkey'] = child_mkey.replace('_', '-')
+            sub_tables[attr] = changes
+        else:
+            delta[attr] = value
+    return delta, sub_tables
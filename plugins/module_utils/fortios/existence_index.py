@@ -0,0 +1,101 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import threading
+import time
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse, unquote
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.response_cache import split_cmdb_url
+
+
+class ExistenceIndex(object):
+    '''
+    Master keys of the CMDB tables used through one persistent connection.
+
+    A table is listed once with only its master key, afterwards the successful writes sent
+    through the connection keep the index up to date, so that the existence of an object is
+    known without asking the device again. Tables expire after ttl seconds.
+    '''
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._tables = dict()
+        self._lock = threading.Lock()
+
+    def _table_key(self, url):
+        parts = split_cmdb_url(url)
+        if not parts:
+            return None
+        return parts[0], parts[1]
+
+    def lookup(self, url, mkey):
+        '''
+        :param url: Any url of the table, with its vdom query.
+        :return: True or False, None if the table is not indexed.
+        '''
+        table_key = self._table_key(url)
+        with self._lock:
+            entry = self._tables.get(table_key)
+            if not entry:
+                return None
+            if entry['expires_at'] < time.time():
+                del self._tables[table_key]
+                return None
+            return str(mkey) in entry['keys']
+
+    def load(self, url, mkey_name, mkeys):
+        table_key = self._table_key(url)
+        if not table_key:
+            return
+        with self._lock:
+            self._tables[table_key] = {
+                'mkey_name': mkey_name,
+                'keys': set(str(mkey) for mkey in mkeys),
+                'expires_at': time.time() + self.ttl,
+            }
+
+    def invalidate(self, url):
+        with self._lock:
+            self._tables.pop(self._table_key(url), None)
+
+    def record_write(self, method, url, status, response_text):
+        '''update the index with the outcome of a write request sent to url.'''
+        table_key = self._table_key(url)
+        with self._lock:
+            entry = self._tables.get(table_key)
+        if not entry:
+            return
+        segments = urlparse(url).path.split('/')
+        if len(segments) > 7:
+            # a child table of an object, the object itself is not created or deleted.
+            return
+        mkey = unquote(segments[6]) if len(segments) == 7 else None
+        if method == 'POST' and mkey is None and status == 200:
+            try:
+                mkey = json.loads(response_text).get('mkey')
+            except (ValueError, AttributeError):
+                mkey = None
+            if mkey is None:
+                self.invalidate(url)
+                return
+            exists = True
+        elif method == 'PUT' and mkey is not None and status in [200, 404]:
+            exists = status == 200
+        elif method == 'DELETE' and mkey is not None and status in [200, 404]:
+            exists = False
+        else:
+            return
+        with self._lock:
+            if exists:
+                entry['keys'].add(str(mkey))
+            else:
+                entry['keys'].discard(str(mkey))
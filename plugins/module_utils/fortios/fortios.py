@@ -11,12 +11,15 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import os
-import time
-import traceback
+import tempfile
 
 from ansible.module_utils._text import to_text
 import json
 from ansible_collections.fortinet.fortios.plugins.module_utils.common.type_utils import underscore_to_hyphen
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_value, serialize
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.delta import compute_delta
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.query import compile_query_options, iter_query_pairs, to_query_params
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.response import decode_response
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.secret_field import is_secret_field
 
 try:
@@ -26,30 +29,26 @@ except ImportError:
 
 # BEGIN DEPRECATED
 
-# check for pyFG lib
-try:
-    from pyFG import FortiOS, FortiConfig
-    from pyFG.exceptions import FailedCommit
-    HAS_PYFG = True
-except ImportError:
-    HAS_PYFG = False
+# the pyFG based helpers live in module_utils.fortios.legacy, imported on first use only.
+LEGACY_NAMES = ['HAS_PYFG', 'AnsibleFortios', 'backup', 'fortios_required_if', 'fortios_mutually_exclusive', 'fortios_error_codes']
+
 
-fortios_required_if = [
-    ['file_mode', False, ['host', 'username', 'password']],
-    ['file_mode', True, ['config_file']],
-    ['backup', True, ['backup_path']],
-]
+def __getattr__(name):
+    if name in LEGACY_NAMES:
+        from ansible_collections.fortinet.fortios.plugins.module_utils.fortios import legacy
+        return getattr(legacy, name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
-fortios_mutually_exclusive = [
-    ['config_file', 'host'],
-    ['config_file', 'username'],
-    ['config_file', 'password']
-]
 
-fortios_error_codes = {
-    '-3': "Object not found",
-    '-61': "Command error"
-}
+def has_secret_attribute(data):
+    '''whether data carries an attribute which the device only returns encrypted.'''
+    if isinstance(data, list):
+        return any(has_secret_attribute(elem) for elem in data)
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if is_secret_field(str(key).replace('-', '_')) or has_secret_attribute(value):
+                return True
+    return False
 
 
 def check_legacy_fortiosapi(module):
@@ -73,13 +72,12 @@ def schema_to_module_spec(schema):
         rdata['type'] = schema['type']
         if schema['type'] == 'list':
             rdata['elements'] = schema.get('elements')
-        rdata['required'] = schema['required'] if 'required' in schema else False
-        rdata['options'] = dict()
-        for child in schema['children']:
-            child_value = schema['children'][child]
-            rdata['options'][child] = schema_to_module_spec(child_value)
+        rdata['required'] = schema.get('required', False)
+        options = rdata['options'] = dict()
+        for child, child_value in schema['children'].items():
+            options[child] = child_spec = schema_to_module_spec(child_value)
             if is_secret_field(child):
-                rdata['options'][child]['no_log'] = True
+                child_spec['no_log'] = True
     elif schema['type'] in ['integer', 'string'] or (schema['type'] == 'list' and 'children' not in schema):
         if schema['type'] == 'integer':
             rdata['type'] = 'int'
@@ -90,7 +88,7 @@ def schema_to_module_spec(schema):
             rdata['elements'] = schema.get('elements')
         else:
             raise AssertionError()
-        rdata['required'] = schema['required'] if 'required' in schema else False
+        rdata['required'] = schema.get('required', False)
         if 'options' in schema:
             # see mantis #0690570, if the semantic meaning changes, remove choices as well
             # also see accept_auth_by_cert of module fortios_system_csf.
@@ -121,30 +119,85 @@ def __format_single_range_desc(one_range):
         return one_range[0] + ' -> ' + one_range[1]
 
 
-def __check_if_system_version_is_supported(v_range, version):
-    '''check the current system version is supported in v_range'''
-
-    if not v_range:
-        return {"supported": True}
-    system_version_number = __convert_version_to_number(version)
+def _compile_v_range(v_range):
+    compiled = list()
+    for one_range in v_range:
+        if len(one_range) != 2:
+            raise BaseException("Incorrect version range, expecting [start, end]: " + str(one_range))
+        compiled.append((__convert_version_to_number(one_range[0]),
+                         __convert_version_to_number(one_range[1]) if one_range[1] != '' else None))
+    return compiled
+
+
+def _describe_v_range(v_range):
+    return "Supported version ranges are " + ", ".join(list(map(__format_single_range_desc, v_range)))
+
+
+class VersionedSchemaNode(object):
+    '''
+    A node of a versioned schema compiled for the version checks: the version ranges as integer intervals,
+    the children and the options indexed by name and value, and the outcome of the check per firmware.
+    The children are compiled on first visit only.
+    '''
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.type = schema.get('type')
+        v_range = schema.get('v_range')
+        self.ranges = _compile_v_range(v_range) if v_range else None
+        self._children = dict()
+        self._options = None
+        self._reasons = dict()
+
+    def unsupported_reason(self, version_number):
+        '''
+        :return: None if the node is supported by the firmware, the reason otherwise.
+        '''
+        if not self.ranges:
+            return None
+        if version_number not in self._reasons:
+            supported = False
+            for start, end in self.ranges:
+                if version_number < start:
+                    break
+                if end is None or version_number <= end:
+                    supported = True
+                    break
+            self._reasons[version_number] = None if supported else _describe_v_range(self.schema['v_range'])
+        return self._reasons[version_number]
+
+    def has_child(self, name):
+        return name in self.schema['children']
+
+    def child(self, name):
+        node = self._children.get(name)
+        if node is None:
+            node = self._children[name] = VersionedSchemaNode(self.schema['children'][name])
+        return node
+
+    def option(self, value):
+        if self._options is None:
+            self._options = dict()
+            for option in self.schema['options']:
+                self._options.setdefault(option['value'], option)
+        option = self._options.get(value)
+        if option is None:
+            return None
+        node = self._children.get(('option', value))
+        if node is None:
+            node = self._children[('option', value)] = VersionedSchemaNode(option)
+        return node
 
-    v_range_desc = ", ".join(list(map(__format_single_range_desc, v_range)))
-    for [single_range_start, single_range_end] in v_range:
-        single_range_start_number = __convert_version_to_number(single_range_start)
-        if system_version_number < single_range_start_number:
 
-            return {
-                "supported": False,
-                "reason": "Supported version ranges are " + v_range_desc
-            }
+# the compiled schemas of this process by id, with the schema itself so that the id is not reused.
+_compiled_schemas = dict()
 
-        if single_range_end == '' or system_version_number <= __convert_version_to_number(single_range_end):
-            return {"supported": True}
 
-    return {
-        "supported": False,
-        "reason": "Supported version ranges are " + v_range_desc
-    }
+def compile_versioned_schema(schema):
+    entry = _compiled_schemas.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        entry = _compiled_schemas[id(schema)] = (schema, VersionedSchemaNode(schema))
+    return entry[1]
 
 
 def __check_version(revisions, version):
@@ -194,60 +247,66 @@ def __concat_attribute_sequence(trace_path):
     return rdata
 
 
-def check_schema_versioning_internal(results, trace, schema, params, version):
-    if not schema or not params:
-        return
-    matched = __check_if_system_version_is_supported(schema['v_range'] if 'v_range' in schema else {}, version)
-    if matched['supported'] is False:
-        results['mismatches'].append('option %s %s' % (__concat_attribute_sequence(trace), matched['reason']))
+def __format_trace_entry(entry):
+    key, value = entry
+    if key is None:
+        return '[%s]' % (value)
+    return '%s(%s)' % (key, value) if type(value) in [int, bool, str] else key
 
-    if 'type' not in schema:
+
+def __format_trace(trace):
+    return __concat_attribute_sequence([__format_trace_entry(entry) for entry in trace])
+
+
+def check_schema_versioning_internal(results, trace, node, params, version_number):
+    '''
+    :param trace: The (attribute, value) pairs leading to params, formatted only when a mismatch is reported.
+    :param node: The VersionedSchemaNode of params.
+    '''
+    if not node or not params:
         return
+    reason = node.unsupported_reason(version_number)
+    if reason:
+        results['mismatches'].append('option %s %s' % (__format_trace(trace), reason))
 
-    if schema['type'] == 'list':
+    if node.type == 'list':
         if type(params) is not list:
             raise AssertionError()
-        if 'children' in schema:
-            if 'options' in schema:
+        if 'children' in node.schema:
+            if 'options' in node.schema:
                 raise AssertionError()
             for list_item in params:
                 if type(list_item) is not dict:
                     # Parameter inconsistency here is not covered by Ansible, we gracefully throw a warning
-                    results['mismatches'].append('option [%s]\' playload is inconsistent with schema.' % (__concat_attribute_sequence(trace)))
+                    results['mismatches'].append('option [%s]\' playload is inconsistent with schema.' % (__format_trace(trace)))
                     continue
                 for key in list_item:
                     value = list_item[key]
-                    key_string = '%s(%s)' % (key, value) if type(value) in [int, bool, str] else key
-                    trace.append(key_string)
-                    check_schema_versioning_internal(results, trace, schema['children'][key], value, version)
+                    trace.append((key, value))
+                    check_schema_versioning_internal(results, trace, node.child(key), value, version_number)
                     del trace[-1]
-        elif 'options' in schema:
+        elif 'options' in node.schema:
             for param in params:
                 if type(param) not in [int, bool, str]:
                     raise AssertionError()
-                target_option = None
-                for option in schema['options']:
-                    if option['value'] == param:
-                        target_option = option
-                        break
+                target_option = node.option(param)
                 if not target_option:
                     raise AssertionError()
-                trace.append('[%s]' % param)
-                check_schema_versioning_internal(results, trace, target_option, param, version)
+                trace.append((None, param))
+                check_schema_versioning_internal(results, trace, target_option, param, version_number)
                 del trace[-1]
-    elif schema['type'] == 'dict':
+    elif node.type == 'dict':
         if type(params) is not dict:
             raise AssertionError()
-        if 'children' in schema:
+        if 'children' in node.schema:
             for dict_item_key in params:
                 dict_item_value = params[dict_item_key]
-                if dict_item_key not in schema['children']:
+                if not node.has_child(dict_item_key):
                     raise AssertionError()
-                key_string = '%s(%s)' % (dict_item_key, dict_item_value) if type(dict_item_value) in [int, bool, str] else dict_item_key
-                trace.append(key_string)
-                check_schema_versioning_internal(results, trace, schema['children'][dict_item_key], dict_item_value, version)
+                trace.append((dict_item_key, dict_item_value))
+                check_schema_versioning_internal(results, trace, node.child(dict_item_key), dict_item_value, version_number)
                 del trace[-1]
-    else:
+    elif node.type is not None:
         if type(params) not in [int, str, bool]:
             raise AssertionError()
 
@@ -265,20 +324,20 @@ def check_schema_versioning(fos, versioned_schema, top_level_param):
         # in case no top level parameters are given.
         # see module: fortios_firewall_policy
         return results
-    v_range = versioned_schema['v_range']
-    module_matched = __check_if_system_version_is_supported(v_range, system_version)
-    if not module_matched['supported']:
+    root = compile_versioned_schema(versioned_schema)
+    version_number = __convert_version_to_number(system_version)
+    reason = root.unsupported_reason(version_number)
+    if reason:
         results['matched'] = False
-        results['mismatches'].append('module fortios_%s %s' % (top_level_param, module_matched['reason']))
+        results['mismatches'].append('module fortios_%s %s' % (top_level_param, reason))
         return results
 
     for param_name in params:
         param_value = params[param_name]
-        if not param_value or param_name not in versioned_schema['children']:
+        if not param_value or not root.has_child(param_name):
             continue
-        key_string = '%s(%s)' % (param_name, param_value) if type(param_value) in [int, bool, str] else param_name
-        trace.append(key_string)
-        check_schema_versioning_internal(results, trace, versioned_schema['children'][param_name], param_value, system_version)
+        trace.append((param_name, param_value))
+        check_schema_versioning_internal(results, trace, root.child(param_name), param_value, version_number)
         del trace[-1]
     if len(results['mismatches']):
         results['matched'] = False
@@ -314,7 +373,7 @@ class FortiOSHandler(object):
             raise AssertionError('Invalid attribute type')
         if type(attr_params) is dict:
             trace_param_item = dict()
-            trace_param_item[current_attr_name] = (None, attr_params)
+            trace_param_item[current_attr_name] = (None, attr_params, None)
             trace_param.append(trace_param_item)
             if len(attr_blobs) <= 1:
                 raise AssertionError('Invalid attribute blob')
@@ -329,7 +388,7 @@ class FortiOSHandler(object):
             if current_attr_mkey not in param or not param[current_attr_mkey]:
                 self._module.fail_json('parameter %s.%s is empty' % (self._trace_to_string(trace), current_attr_mkey))
             trace_param_item = dict()
-            trace_param_item[current_attr_name] = (param[current_attr_mkey], param)
+            trace_param_item[current_attr_name] = (param[current_attr_mkey], param, current_attr_mkey)
             trace_param.append(trace_param_item)
             if len(attr_blobs) > 1:
                 next_attr_blob = attr_blobs[1]
@@ -385,6 +444,8 @@ class FortiOSHandler(object):
                     url_post += '/%s' % (token_name.replace('_', '-'))
                     url_post_payload = token_payload
                     url_put_payload = token_payload
+                    url['mkey_name'] = token[token_name][2].replace('_', '-') if token[token_name][2] else None
+                    url['mkey_value'] = token_value
             url['get'] = url_prefix + url_get + url_suffix
             url['put'] = url_prefix + url_put + url_suffix
             url['post'] = url_prefix + url_post + url_suffix
@@ -395,24 +456,116 @@ class FortiOSHandler(object):
             url['vdom'] = vdom
             all_urls.append(url)
 
-    def _request_sub_object(self, sub_obj):
+    def _get_member_collections(self, sub_objs):
+        '''
+        GET every parent collection of the members once.
+        :return: A dictionary of the collection url to its members keyed by master key, None if it could not be listed.
+        '''
+        collection_urls = list()
+        mkey_names = dict()
+        for sub_obj in sub_objs:
+            if sub_obj.get('mkey_name') and sub_obj['post'] not in mkey_names:
+                collection_urls.append(sub_obj['post'])
+                mkey_names[sub_obj['post']] = sub_obj['mkey_name']
+        collections = dict()
+        responses = self._dispatch([{'url': url, 'method': 'GET'} for url in collection_urls])
+        for url, (status, result_data) in zip(collection_urls, responses):
+            collections[url] = None
+            if status != 200:
+                continue
+            results = self.formatresponse(result_data, status, vdom='global' if '?global=1' in url else None).get('results')
+            if not isinstance(results, list):
+                continue
+            collections[url] = dict()
+            for member in results:
+                if isinstance(member, dict):
+                    collections[url][str(member.get(mkey_names[url]))] = member
+        return collections
+
+    def _unchanged_member_response(self, sub_obj, method):
+        return {
+            'status': 'success',
+            'http_status': 200,
+            'http_method': method,
+            'revision_changed': False,
+            'skipped': True,
+            'vdom': sub_obj['vdom'],
+        }
+
+    def _planned_member_response(self, sub_obj, method):
+        return {
+            'status': 'success',
+            'http_status': 200,
+            'http_method': method,
+            'revision_changed': True,
+            'check_mode': True,
+            'vdom': sub_obj['vdom'],
+        }
+
+    def _request_sub_objects(self, sub_objs):
         directive_state = self._module.params['member_state']
         if directive_state not in ['present', 'absent']:
             raise AssertionError('Not invalid member_state directive.')
-        status = None
-        result_data = None
-        if directive_state == 'present':
-            status, result_data = self._conn.send_request(url=sub_obj['get'], params=None, method='GET')
-            if status == 200:
-                status, result_data = self._conn.send_request(url=sub_obj['put'], data=json.dumps(sub_obj['put_payload']), method='PUT')
-                if status == 405:
-                    status, result_data = self._conn.send_request(url=sub_obj['post'], data=json.dumps(sub_obj['post_payload']), method='POST')
+
+        # the parent collections are listed once, then only the missing, different or
+        # listed members to remove are written, as one concurrent batch.
+        collections = self._get_member_collections(sub_objs)
+        results = [None] * len(sub_objs)
+        unknown_indexes = list()
+        writes = list()
+        write_indexes = list()
+        for index, sub_obj in enumerate(sub_objs):
+            members = collections.get(sub_obj['post'])
+            if members is None:
+                unknown_indexes.append(index)
+                continue
+            current_member = members.get(sub_obj['mkey_value'])
+            if directive_state == 'absent':
+                if current_member is None:
+                    results[index] = self._unchanged_member_response(sub_obj, 'DELETE')
+                    continue
+                writes.append({'url': sub_obj['delete'], 'method': 'DELETE'})
+            elif current_member is None:
+                writes.append({'url': sub_obj['post'], 'data': json.dumps(sub_obj['post_payload']), 'method': 'POST'})
+            elif is_same_value(serialize(current_member), serialize(sub_obj['put_payload'])):
+                results[index] = self._unchanged_member_response(sub_obj, 'PUT')
+                continue
             else:
-                status, result_data = self._conn.send_request(url=sub_obj['post'], data=json.dumps(sub_obj['post_payload']), method='POST')
+                writes.append({'url': sub_obj['put'], 'data': json.dumps(sub_obj['put_payload']), 'method': 'PUT'})
+            write_indexes.append(index)
+
+        # members whose parent is not a listable collection are looked up one by one.
+        if directive_state == 'absent':
+            for index in unknown_indexes:
+                writes.append({'url': sub_objs[index]['delete'], 'method': 'DELETE'})
+                write_indexes.append(index)
         else:
-            status, result_data = self._conn.send_request(url=sub_obj['delete'], params=None, method='DELETE')
-        result_data = self.formatresponse(result_data, status, vdom=sub_obj['vdom'])
-        return result_data
+            responses = self._dispatch([{'url': sub_objs[index]['get'], 'method': 'GET'} for index in unknown_indexes])
+            for index, (status, dummy) in zip(unknown_indexes, responses):
+                sub_obj = sub_objs[index]
+                if status == 200:
+                    writes.append({'url': sub_obj['put'], 'data': json.dumps(sub_obj['put_payload']), 'method': 'PUT'})
+                else:
+                    writes.append({'url': sub_obj['post'], 'data': json.dumps(sub_obj['post_payload']), 'method': 'POST'})
+                write_indexes.append(index)
+
+        # check mode reports the members which would be written without sending the writes.
+        if self._module.check_mode:
+            for index, write in zip(write_indexes, writes):
+                results[index] = self._planned_member_response(sub_objs[index], write['method'])
+            return results
+
+        responses = self._dispatch(writes)
+        fallback_indexes = [position for position, (status, dummy) in enumerate(responses) if status == 405 and writes[position]['method'] == 'PUT']
+        fallback_requests = [{'url': sub_objs[write_indexes[position]]['post'],
+                              'data': json.dumps(sub_objs[write_indexes[position]]['post_payload']), 'method': 'POST'}
+                             for position in fallback_indexes]
+        for position, response in zip(fallback_indexes, self._dispatch(fallback_requests)):
+            responses[position] = response
+
+        for index, (status, result_data) in zip(write_indexes, responses):
+            results[index] = self.formatresponse(result_data, status, vdom=sub_objs[index]['vdom'])
+        return results
 
     def _process_sub_object_result(self, results):
         meta = list()
@@ -502,11 +655,30 @@ class FortiOSHandler(object):
         trace.append(toplevel_name)
         self._validate_member_parameter(trace, trace_param, trace_url_tokens, attr_blobs, attr_params[attr_blobs[0]['name']])
         self._process_sub_object(urls, toplevel_url_token, trace_url_tokens, path, name)
-        for sub_obj in urls:
-            result = self._request_sub_object(sub_obj)
+        for sub_obj, result in zip(urls, self._request_sub_objects(urls)):
             results.append((sub_obj, result))
         self._process_sub_object_result(results)
 
+    def _dispatch(self, requests):
+        if not requests:
+            return []
+        return self._conn.send_requests(requests)
+
+    def send_requests(self, requests):
+        '''
+        Send a batch of requests concurrently through the connection plugin.
+        Each request is a dictionary of url, method, data, parameters and vdom,
+        the formatted responses are returned in the same order as the requests.
+        '''
+        batch = list()
+        for request in requests:
+            spec = {'url': request['url'], 'method': request.get('method', 'GET'), 'params': to_query_params(request.get('parameters'))}
+            if 'data' in request:
+                spec['data'] = json.dumps(request['data'])
+            batch.append(spec)
+        return [self.formatresponse(result_data, http_status, vdom=request.get('vdom'))
+                for request, (http_status, result_data) in zip(requests, self._dispatch(batch))]
+
     def cmdb_url(self, path, name, vdom=None, mkey=None):
 
         url = '/api/v2/cmdb/' + path + '/' + name
@@ -571,14 +743,14 @@ class FortiOSHandler(object):
         slash_index = url.find('/')
         full_url = self.log_url(url[: slash_index], url[slash_index + 1:])
 
-        http_status, result_data = self._conn.send_request(url=full_url, params=parameters, method='GET')
+        http_status, result_data = self._conn.send_request(url=full_url, params=to_query_params(parameters), method='GET')
 
         return self.formatresponse(result_data, http_status)
 
     def monitor_get(self, url, vdom=None, parameters=None):
         slash_index = url.find('/')
         full_url = self.mon_url(url[: slash_index], url[slash_index + 1:], vdom)
-        http_status, result_data = self._conn.send_request(url=full_url, params=parameters, method='GET')
+        http_status, result_data = self._conn.send_request(url=full_url, params=to_query_params(parameters), method='GET')
         return self.formatresponse(result_data, http_status, vdom=vdom)
 
     def monitor_post(self, url, data=None, vdom=None, mkey=None, parameters=None):
@@ -589,32 +761,297 @@ class FortiOSHandler(object):
 
         return self.formatresponse(result_data, http_status, vdom=vdom)
 
+    def download_results(self, url, dest, parameters=None, vdom=None):
+        '''
+        Write the results items of a GET response to dest as JSON lines without holding the
+        whole response in memory, the returned response carries results_file and results_count.
+        Results which are an object rather than an array are written as a single line.
+        A relative dest is resolved here, the connection plugin runs in another working directory.
+        '''
+        dest = os.path.abspath(dest)
+        http_status, result_data, count = self._conn.stream_request(url=url, dest=dest, params=to_query_params(parameters), method='GET')
+        resp = self.formatresponse(result_data, http_status, vdom=vdom)
+        results = resp.pop('results', None)
+        if results is not None and not isinstance(results, list):
+            # only the items of an array are streamed, any other results come back in the envelope.
+            with open(dest, 'w') as f:
+                f.write(json.dumps(results))
+                f.write('\n')
+            count = 1
+        resp['results_file'] = dest
+        resp['results_count'] = count
+        return resp
+
+    def iter_results(self, url, parameters=None, vdom=None):
+        '''
+        Yield the results items of a GET response one by one, the items are spooled to a
+        temporary file by the connection plugin and read back lazily.
+        '''
+        fd, dest = tempfile.mkstemp(prefix='fortios_results_', suffix='.jsonl')
+        os.close(fd)
+        try:
+            resp = self.download_results(url, dest, parameters=parameters, vdom=vdom)
+            if resp.get('http_status') != 200:
+                self._module.fail_json(msg='Failed to retrieve %s' % (url), meta=resp)
+            with open(dest, 'r') as f:
+                for line in f:
+                    yield json.loads(line)
+        finally:
+            os.remove(dest)
+
+    def iter_table(self, path, name, vdom=None, page_size=1000, filters=None, fields=None, sorters=None, prefetch=True,
+                   parameters=None, envelope=None):
+        '''
+        Yield the objects of a CMDB table page by page with start and count, so that a large table
+        is never requested in one response. With prefetch the next page is requested in the
+        background while the current one is consumed.
+        :param filters: A list of filter expressions combined as LOGICAL AND.
+        :param fields: A list of the attributes to return, all of them by default.
+        :param parameters: Additional query parameters sent with every page, e.g. with_meta.
+        :param envelope: A dictionary filled with the attributes of the first page but its results,
+            e.g. revision, serial, version and build.
+        '''
+        if page_size < 1:
+            raise AssertionError('page_size must be a positive integer')
+        # concurrent.futures brings logging with it, only the paged reads pay for it.
+        from concurrent.futures import ThreadPoolExecutor
+
+        def fetch(start):
+            page_parameters = compile_query_options(filters, sorters, fields)
+            page_parameters.extend(iter_query_pairs(parameters))
+            page_parameters.extend([('start', start), ('count', page_size)])
+            return self.get(path, name, vdom=vdom, parameters=page_parameters)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            start = 0
+            pending = None
+            while True:
+                resp = pending.result() if pending else fetch(start)
+                pending = None
+                if resp.get('http_status') != 200:
+                    self._module.fail_json(msg='Failed to retrieve %s %s' % (path, name), meta=resp)
+                if envelope is not None and start == 0:
+                    envelope.update((key, value) for key, value in resp.items() if key != 'results')
+                results = resp.get('results')
+                if not isinstance(results, list):
+                    # a settings object is not paged.
+                    yield results
+                    return
+                start += page_size
+                if executor and len(results) >= page_size:
+                    pending = executor.submit(fetch, start)
+                for item in results:
+                    yield item
+                if len(results) < page_size:
+                    return
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+
+    def purge(self, path, name, mkey_name, mkeys, vdom=None, page_size=1000):
+        '''
+        Delete objects of a CMDB table with concurrent batches, the referenced objects after their referrers.
+
+        Every round reads the reference count (q_ref) of the remaining objects from one listing of the table
+        and deletes the objects nothing refers to anymore. Once no unreferenced object is left or a round deletes
+        nothing, the remaining ones are attempted anyway so that the device reports why they can not be deleted.
+        :param mkeys: The master keys of the objects to delete.
+        :return: A dictionary of the response of the last delete request per master key as string,
+            the objects already gone are left out.
+        '''
+        key_values = dict((str(mkey), mkey) for mkey in mkeys)
+        pending = set(key_values)
+        outcomes = dict()
+        attempt_all = False
+        while pending:
+            ref_counts = dict()
+            for current_object in self.iter_table(path, name, vdom=vdom, page_size=page_size, parameters={'with_meta': 1}):
+                key = str(current_object.get(mkey_name))
+                if key in pending:
+                    ref_counts[key] = current_object.get('q_ref') or 0
+            pending = set(ref_counts)
+            ready = sorted(key for key in pending if attempt_all or not ref_counts[key])
+            if not ready:
+                attempt_all = True
+                ready = sorted(pending)
+            requests = [{'url': self.cmdb_url(path, name, vdom, mkey=key_values[key]), 'method': 'DELETE', 'vdom': vdom}
+                        for key in ready]
+            deleted = False
+            for key, resp in zip(ready, self.send_requests(requests)):
+                outcomes[key] = resp
+                if resp.get('http_status') in [200, 404]:
+                    pending.discard(key)
+                    deleted = True
+            if attempt_all:
+                break
+            attempt_all = not deleted
+        return outcomes
+
     def get(self, path, name, vdom=None, mkey=None, parameters=None):
         url = self.cmdb_url(path, name, vdom, mkey=mkey)
 
-        http_status, result_data = self._conn.send_request(url=url, params=parameters, method='GET')
+        http_status, result_data = self._conn.send_request(url=url, params=to_query_params(parameters), method='GET')
 
         return self.formatresponse(result_data, http_status, vdom=vdom)
 
     def monitor(self, path, name, vdom=None, mkey=None, parameters=None):
         url = self.mon_url(path, name, vdom, mkey)
 
-        http_status, result_data = self._conn.send_request(url=url, params=parameters, method='GET')
+        http_status, result_data = self._conn.send_request(url=url, params=to_query_params(parameters), method='GET')
 
         return self.formatresponse(result_data, http_status, vdom=vdom)
 
+    def _object_exists(self, path, name, mkey, vdom=None):
+        '''
+        :return: True or False as known by the existence index of the connection plugin, None if unknown.
+        '''
+        mkeyname = self.get_mkeyname(path, name, vdom)
+        if not mkeyname or mkey is None:
+            return None
+        return self._conn.object_exists(url=self.cmdb_url(path, name, vdom), mkey_name=mkeyname, mkey=mkey)
+
+    def check_snapshot(self, path, name, data, vdom=None, state='present'):
+        '''
+        Check mode of the modules without their own: compare the object to write with a snapshot
+        of its table, which the connection plugin takes once per table and vdom.
+
+        :return: The is_error, changed, result and diff tuple of the modules.
+        '''
+        http_status, result_data = self._conn.get_snapshot(url=self.cmdb_url(path, name, vdom))
+        resp = self.formatresponse(result_data, http_status, vdom=vdom)
+        if http_status != 200:
+            return True, False, resp, {}
+        current_object = resp.get('results')
+        if isinstance(current_object, list):
+            mkeyname = self.get_mkeyname(path, name, vdom)
+            mkey = data.get(mkeyname) if mkeyname else None
+            current_object = None
+            for item in resp['results']:
+                if mkey is not None and isinstance(item, dict) and str(item.get(mkeyname)) == str(mkey):
+                    current_object = item
+                    break
+
+        if state == 'absent':
+            if current_object is None:
+                return False, False, data, {}
+            return False, True, data, {'before': current_object, 'after': ''}
+        if current_object is None:
+            return False, True, data, {'before': '', 'after': data}
+        is_same = is_same_value(serialize(current_object), serialize(data))
+        current_values = dict((key, current_object[key]) for key in data if key in current_object)
+        return False, not is_same, data, {'before': current_values, 'after': data}
+
+    def field_projection(self, data):
+        '''
+        Query parameters which make the device return only the top level attributes of data,
+        the attributes may be given with underscores or hyphens.
+        '''
+        fields = [attr.replace('_', '-') for attr in (data or {})]
+        return {'format': '|'.join(fields)} if fields else None
+
+    def _get_current_object(self, path, name, mkey=None, vdom=None, fields=None):
+        if mkey is None and self.get_mkeyname(path, name, vdom):
+            return None
+        current_data = self.get(path, name, vdom=vdom, mkey=mkey, parameters=self.field_projection(fields))
+        if not current_data or current_data.get('http_status') != 200:
+            return None
+        current_object = current_data.get('results')
+        if isinstance(current_object, list):
+            current_object = current_object[0] if len(current_object) else None
+        return current_object if isinstance(current_object, dict) else None
+
+    def _unchanged_response(self, path, name, mkey=None, vdom=None):
+        return {
+            'status': 'success',
+            'http_status': 200,
+            'http_method': 'PUT',
+            'revision_changed': False,
+            'skipped': True,
+            'path': path,
+            'name': name,
+            'mkey': mkey,
+            'vdom': vdom,
+        }
+
+    def _sub_table_url(self, path, name, attr, mkey=None, member_mkey=None, vdom=None):
+        url, sep, query = self.cmdb_url(path, name, vdom, mkey).partition('?')
+        url += '/' + attr
+        if member_mkey is not None:
+            url += '/' + urlencoding.quote(str(member_mkey), safe='')
+        return url + sep + query
+
+    def _set_delta(self, path, name, data, current_object, mkey=None, vdom=None):
+        '''
+        Write only the attributes which differ from the current object, the nested tables with
+        a few changed members are updated member by member through their own urls.
+        '''
+        toplevel_name = (path + '_' + name).replace('-', '_').replace('.', '_').replace('+', 'plus')
+        toplevel_spec = self._module.argument_spec.get(toplevel_name) or {}
+        delta, sub_tables = compute_delta(toplevel_spec.get('options') or {}, current_object, data)
+        if not delta and not sub_tables:
+            return self._unchanged_response(path, name, mkey, vdom)
+
+        resp = None
+        if delta:
+            url = self.cmdb_url(path, name, vdom, mkey)
+            http_status, result_data = self._conn.send_request(url=url, data=json.dumps(delta), method='PUT')
+            resp = self.formatresponse(result_data, http_status, vdom=vdom)
+            if http_status != 200:
+                return resp
+
+        member_requests = list()
+        member_creations = list()
+        for attr, changes in sub_tables.items():
+            for member_mkey in changes['delete']:
+                member_requests.append({'url': self._sub_table_url(path, name, attr, mkey, member_mkey, vdom),
+                                        'method': 'DELETE', 'vdom': vdom})
+            for member in changes['update']:
+                member_requests.append({'url': self._sub_table_url(path, name, attr, mkey, member[changes['mkey']], vdom),
+                                        'method': 'PUT', 'data': member, 'vdom': vdom})
+            for member in changes['create']:
+                member_creations.append({'url': self._sub_table_url(path, name, attr, mkey, vdom=vdom),
+                                         'method': 'POST', 'data': member, 'vdom': vdom})
+        responses = self.send_requests(member_requests)
+        # created members are appended by the device, keep their order.
+        for request in member_creations:
+            responses.extend(self.send_requests([request]))
+        for member_resp in responses:
+            if member_resp.get('http_status') != 200:
+                return member_resp
+        return resp or responses[-1]
+
     def set(self, path, name, data, mkey=None, vdom=None, parameters=None):
 
         if not mkey:
             mkey = self.get_mkey(path, name, data, vdom=vdom)
         url = self.cmdb_url(path, name, vdom, mkey)
 
+        is_move = parameters and 'action' in parameters and parameters['action'] == 'move'
+        is_existed = None if is_move else self._object_exists(path, name, mkey, vdom)
+        skip_unchanged = self._module.params.get('skip_unchanged')
+        minimal_delta = self._module.params.get('minimal_delta')
+        if not is_move and is_existed is not False and (skip_unchanged or minimal_delta):
+            current_object = self._get_current_object(path, name, mkey, vdom, fields=data)
+            if current_object is not None:
+                # a secret attribute can not be compared, the object is written.
+                if skip_unchanged and not has_secret_attribute(data) and is_same_value(serialize(current_object), serialize(data)):
+                    return self._unchanged_response(path, name, mkey, vdom)
+                if minimal_delta:
+                    return self._set_delta(path, name, data, current_object, mkey, vdom)
+        if is_existed is False:
+            resp = self.post(path, name, data, vdom, mkey)
+            # a duplicate entry means the object was created meanwhile by another client, update it instead.
+            if resp.get('http_status') != 500 or resp.get('error') != -5:
+                return resp
+
         http_status, result_data = self._conn.send_request(url=url, params=parameters, data=json.dumps(data), method='PUT')
 
-        if parameters and 'action' in parameters and parameters['action'] == 'move':
+        if is_move:
             return self.formatresponse(result_data, http_status, vdom=vdom)
 
-        if http_status == 404 or http_status == 405 or http_status == 500:
+        # without the existence index a failed PUT is how a missing object is detected.
+        if http_status == 404 or http_status == 405 or (http_status == 500 and is_existed is None):
             return self.post(path, name, data, vdom, mkey)
         else:
             return self.formatresponse(result_data, http_status, vdom=vdom)
@@ -647,25 +1084,12 @@ class FortiOSHandler(object):
         http_status, result_data = self._conn.send_request(url=url, params=parameters, data=json.dumps(data), method='DELETE')
         return self.formatresponse(result_data, http_status, vdom=vdom)
 
-    def __to_local(self, data, http_status, is_array=False):
-        try:
-            resp = json.loads(data)
-        except Exception:
-            resp = {'raw': data}
-        if is_array and type(resp) is not list:
-            resp = [resp]
-        if is_array and 'http_status' not in resp[0]:
-            resp[0]['http_status'] = http_status
-        elif not is_array and 'status' not in resp:
-            resp['http_status'] = http_status
-        return resp
-
     def formatresponse(self, res, http_status=500, vdom=None):
         if vdom == "global":
-            resp = self.__to_local(to_text(res), http_status, True)[0]
+            resp = decode_response(res, http_status, is_array=True)
             resp['vdom'] = "global"
         else:
-            resp = self.__to_local(to_text(res), http_status, False)
+            resp = decode_response(res, http_status)
         return resp
 
     def jsonraw(self, method, path, data, specific_params, vdom=None, parameters=None):
@@ -690,134 +1114,3 @@ class FortiOSHandler(object):
             http_status, result_data = self._conn.send_request(url=url, method=method, data=json.dumps(data), params=parameters)
 
         return self.formatresponse(result_data, http_status, vdom=vdom)
-
-# BEGIN DEPRECATED
-
-
-def backup(module, running_config):
-    backup_path = module.params['backup_path']
-    backup_filename = module.params['backup_filename']
-    if not os.path.exists(backup_path):
-        try:
-            os.mkdir(backup_path)
-        except Exception:
-            module.fail_json(msg="Can't create directory {0} Permission denied ?".format(backup_path))
-    tstamp = time.strftime("%Y-%m-%d@%H:%M:%S", time.localtime(time.time()))
-    if 0 < len(backup_filename):
-        filename = '%s/%s' % (backup_path, backup_filename)
-    else:
-        filename = '%s/%s_config.%s' % (backup_path, module.params['host'], tstamp)
-    try:
-        open(filename, 'w').write(running_config)
-    except Exception:
-        module.fail_json(msg="Can't create backup file {0} Permission denied ?".format(filename))
-
-
-class AnsibleFortios(object):
-    def __init__(self, module):
-        if not HAS_PYFG:
-            module.fail_json(msg='Could not import the python library pyFG required by this module')
-
-        self.result = {
-            'changed': False,
-        }
-        self.module = module
-
-    def _connect(self):
-        if self.module.params['file_mode']:
-            self.forti_device = FortiOS('')
-        else:
-            host = self.module.params['host']
-            username = self.module.params['username']
-            password = self.module.params['password']
-            timeout = self.module.params['timeout']
-            vdom = self.module.params['vdom']
-
-            self.forti_device = FortiOS(host, username=username, password=password, timeout=timeout, vdom=vdom)
-
-            try:
-                self.forti_device.open()
-            except Exception as e:
-                self.module.fail_json(msg='Error connecting device. %s' % to_text(e),
-                                      exception=traceback.format_exc())
-
-    def load_config(self, path):
-        self.path = path
-        self._connect()
-        # load in file_mode
-        if self.module.params['file_mode']:
-            try:
-                f = open(self.module.params['config_file'], 'r')
-                running = f.read()
-                f.close()
-            except IOError as e:
-                self.module.fail_json(msg='Error reading configuration file. %s' % to_text(e),
-                                      exception=traceback.format_exc())
-            self.forti_device.load_config(config_text=running, path=path)
-
-        else:
-            # get  config
-            try:
-                self.forti_device.load_config(path=path)
-            except Exception as e:
-                self.forti_device.close()
-                self.module.fail_json(msg='Error reading running config. %s' % to_text(e),
-                                      exception=traceback.format_exc())
-
-        # set configs in object
-        self.result['running_config'] = self.forti_device.running_config.to_text()
-        self.candidate_config = self.forti_device.candidate_config
-
-        # backup if needed
-        if self.module.params['backup']:
-            backup(self.module, self.forti_device.running_config.to_text())
-
-    def apply_changes(self):
-        change_string = self.forti_device.compare_config()
-        if change_string:
-            self.result['change_string'] = change_string
-            self.result['changed'] = True
-
-        # Commit if not check mode
-        if change_string and not self.module.check_mode:
-            if self.module.params['file_mode']:
-                try:
-                    f = open(self.module.params['config_file'], 'w')
-                    f.write(self.candidate_config.to_text())
-                    f.close()
-                except IOError as e:
-                    self.module.fail_json(msg='Error writing configuration file. %s' %
-                                          to_text(e), exception=traceback.format_exc())
-            else:
-                try:
-                    self.forti_device.commit()
-                except FailedCommit as e:
-                    # Something's wrong (rollback is automatic)
-                    self.forti_device.close()
-                    error_list = self.get_error_infos(e)
-                    self.module.fail_json(msg_error_list=error_list, msg="Unable to commit change, check your args, the error was %s" % e.message)
-
-                self.forti_device.close()
-        self.module.exit_json(**self.result)
-
-    def del_block(self, block_id):
-        self.forti_device.candidate_config[self.path].del_block(block_id)
-
-    def add_block(self, block_id, block):
-        self.forti_device.candidate_config[self.path][block_id] = block
-
-    def get_error_infos(self, cli_errors):
-        error_list = []
-        for errors in cli_errors.args:
-            for error in errors:
-                error_code = error[0]
-                error_string = error[1]
-                error_type = fortios_error_codes.get(error_code, "unknown")
-                error_list.append(dict(error_code=error_code, error_type=error_type, error_string=error_string))
-
-        return error_list
-
-    def get_empty_configuration_block(self, block_name, block_type):
-        return FortiConfig(block_name, block_type)
-
-# END DEPRECATED
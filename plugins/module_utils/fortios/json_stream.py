@@ -0,0 +1,153 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import codecs
+import json
+
+WHITESPACES = ' \t\n\r'
+
+
+class JSONResultsStream(object):
+    '''
+    Incremental decoder of a FortiOS REST API response.
+
+    The items of the results array are yielded one by one as the chunks of the body
+    arrive, only the current item and the small response envelope are kept in memory.
+    Once the iteration is over, envelope holds the response without its results
+    and count the number of decoded items.
+    '''
+
+    def __init__(self, chunks, key='results'):
+        self._chunks = iter(chunks)
+        self._key = key
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._eof = False
+        self.envelope = None
+        self.count = 0
+
+    def _read(self):
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            self._buffer += self._text_decoder.decode(b'', final=True)
+            return False
+        self._buffer += self._text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return True
+
+    def _locate_results(self):
+        '''
+        Scan the body until the opening bracket of the results array.
+        :return: the text of the envelope preceding the array or None if there is no results array.
+        '''
+        position = 0
+        depth = 0
+        in_string = False
+        escaped = False
+        string_start = 0
+        # progress of the "<key>" : [ token sequence.
+        expecting = None
+        while True:
+            while position < len(self._buffer):
+                char = self._buffer[position]
+                position += 1
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == '\\':
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                        if depth <= 2 and self._buffer[string_start:position - 1] == self._key:
+                            expecting = ':'
+                    continue
+                if char in WHITESPACES:
+                    continue
+                if char == '"':
+                    in_string = True
+                    string_start = position
+                    expecting = None
+                elif char == ':' and expecting == ':':
+                    expecting = '['
+                elif char == '[' and expecting == '[':
+                    prefix = self._buffer[:position - 1]
+                    self._buffer = self._buffer[position:]
+                    return prefix
+                else:
+                    expecting = None
+                    if char in '{[':
+                        depth += 1
+                    elif char in '}]':
+                        depth -= 1
+            if not self._read():
+                return None
+
+    def _decode_envelope(self, text):
+        try:
+            return json.loads(text)
+        except ValueError:
+            return {'raw': text}
+
+    def __iter__(self):
+        prefix = self._locate_results()
+        if prefix is None:
+            self.envelope = self._decode_envelope(self._buffer)
+            self._buffer = ''
+            return
+
+        index = 0
+        while True:
+            while index < len(self._buffer) and self._buffer[index] in WHITESPACES + ',':
+                index += 1
+            if index >= len(self._buffer):
+                self._buffer = ''
+                index = 0
+                if not self._read():
+                    raise ValueError('Truncated response: results array is not terminated')
+                continue
+            if self._buffer[index] == ']':
+                break
+            try:
+                item, end = self._json_decoder.raw_decode(self._buffer, index)
+            except ValueError:
+                if not self._read():
+                    raise
+                continue
+            if self._buffer[index] not in '{["' and self._buffer[end:].lstrip(WHITESPACES)[:1] not in (',', ']'):
+                # a number or literal is only complete once its delimiter has arrived.
+                if not self._read():
+                    raise ValueError('Truncated response: results array is not terminated')
+                continue
+            self.count += 1
+            yield item
+            self._buffer = self._buffer[end:]
+            index = 0
+
+        suffix = [self._buffer[index + 1:]]
+        self._buffer = ''
+        while self._read():
+            suffix.append(self._buffer)
+            self._buffer = ''
+        suffix.append(self._buffer)
+        self._buffer = ''
+        self.envelope = self._decode_envelope(prefix + '[]' + ''.join(suffix))
+
+
+def locate_results(text, key='results'):
+    '''
+    :return: The position of the opening bracket of the results array in the text of a complete response,
+        None if there is no results array.
+    '''
+    prefix = JSONResultsStream([text], key=key)._locate_results()
+    return None if prefix is None else len(prefix)
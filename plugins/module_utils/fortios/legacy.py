@@ -0,0 +1,171 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+# The deprecated pyFG based helpers, formerly part of module_utils.fortios.fortios which still
+# exposes them, but only imports this module when one of them is used.
+
+import os
+import time
+import traceback
+
+from ansible.module_utils._text import to_text
+
+# check for pyFG lib
+try:
+    from pyFG import FortiOS, FortiConfig
+    from pyFG.exceptions import FailedCommit
+    HAS_PYFG = True
+except ImportError:
+    HAS_PYFG = False
+
+fortios_required_if = [
+    ['file_mode', False, ['host', 'username', 'password']],
+    ['file_mode', True, ['config_file']],
+    ['backup', True, ['backup_path']],
+]
+
+fortios_mutually_exclusive = [
+    ['config_file', 'host'],
+    ['config_file', 'username'],
+    ['config_file', 'password']
+]
+
+fortios_error_codes = {
+    '-3': "Object not found",
+    '-61': "Command error"
+}
+
+
+def backup(module, running_config):
+    backup_path = module.params['backup_path']
+    backup_filename = module.params['backup_filename']
+    if not os.path.exists(backup_path):
+        try:
+            os.mkdir(backup_path)
+        except Exception:
+            module.fail_json(msg="Can't create directory {0} Permission denied ?".format(backup_path))
+    tstamp = time.strftime("%Y-%m-%d@%H:%M:%S", time.localtime(time.time()))
+    if 0 < len(backup_filename):
+        filename = '%s/%s' % (backup_path, backup_filename)
+    else:
+        filename = '%s/%s_config.%s' % (backup_path, module.params['host'], tstamp)
+    try:
+        open(filename, 'w').write(running_config)
+    except Exception:
+        module.fail_json(msg="Can't create backup file {0} Permission denied ?".format(filename))
+
+
+class AnsibleFortios(object):
+    def __init__(self, module):
+        if not HAS_PYFG:
+            module.fail_json(msg='Could not import the python library pyFG required by this module')
+
+        self.result = {
+            'changed': False,
+        }
+        self.module = module
+
+    def _connect(self):
+        if self.module.params['file_mode']:
+            self.forti_device = FortiOS('')
+        else:
+            host = self.module.params['host']
+            username = self.module.params['username']
+            password = self.module.params['password']
+            timeout = self.module.params['timeout']
+            vdom = self.module.params['vdom']
+
+            self.forti_device = FortiOS(host, username=username, password=password, timeout=timeout, vdom=vdom)
+
+            try:
+                self.forti_device.open()
+            except Exception as e:
+                self.module.fail_json(msg='Error connecting device. %s' % to_text(e),
+                                      exception=traceback.format_exc())
+
+    def load_config(self, path):
+        self.path = path
+        self._connect()
+        # load in file_mode
+        if self.module.params['file_mode']:
+            try:
+                f = open(self.module.params['config_file'], 'r')
+                running = f.read()
+                f.close()
+            except IOError as e:
+                self.module.fail_json(msg='Error reading configuration file. %s' % to_text(e),
+                                      exception=traceback.format_exc())
+            self.forti_device.load_config(config_text=running, path=path)
+
+        else:
+            # get  config
+            try:
+                self.forti_device.load_config(path=path)
+            except Exception as e:
+                self.forti_device.close()
+                self.module.fail_json(msg='Error reading running config. %s' % to_text(e),
+                                      exception=traceback.format_exc())
+
+        # set configs in object
+        self.result['running_config'] = self.forti_device.running_config.to_text()
+        self.candidate_config = self.forti_device.candidate_config
+
+        # backup if needed
+        if self.module.params['backup']:
+            backup(self.module, self.forti_device.running_config.to_text())
+
+    def apply_changes(self):
+        change_string = self.forti_device.compare_config()
+        if change_string:
+            self.result['change_string'] = change_string
+            self.result['changed'] = True
+
+        # Commit if not check mode
+        if change_string and not self.module.check_mode:
+            if self.module.params['file_mode']:
+                try:
+                    f = open(self.module.params['config_file'], 'w')
+                    f.write(self.candidate_config.to_text())
+                    f.close()
+                except IOError as e:
+                    self.module.fail_json(msg='Error writing configuration file. %s' %
+                                          to_text(e), exception=traceback.format_exc())
+            else:
+                try:
+                    self.forti_device.commit()
+                except FailedCommit as e:
+                    # Something's wrong (rollback is automatic)
+                    self.forti_device.close()
+                    error_list = self.get_error_infos(e)
+                    self.module.fail_json(msg_error_list=error_list, msg="Unable to commit change, check your args, the error was %s" % e.message)
+
+                self.forti_device.close()
+        self.module.exit_json(**self.result)
+
+    def del_block(self, block_id):
+        self.forti_device.candidate_config[self.path].del_block(block_id)
+
+    def add_block(self, block_id, block):
+        self.forti_device.candidate_config[self.path][block_id] = block
+
+    def get_error_infos(self, cli_errors):
+        error_list = []
+        for errors in cli_errors.args:
+            for error in errors:
+                error_code = error[0]
+                error_string = error[1]
+                error_type = fortios_error_codes.get(error_code, "unknown")
+                error_list.append(dict(error_code=error_code, error_type=error_type, error_string=error_string))
+
+        return error_list
+
+    def get_empty_configuration_block(self, block_name, block_type):
+        return FortiConfig(block_name, block_type)
@@ -0,0 +1,129 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.module_utils.six.moves.urllib.parse import quote
+
+# comparison operators of the FortiOS filter syntax.
+FILTER_OPERATORS = ['==', '!=', '=@', '!@', '<=', '<', '>=', '>']
+
+
+def iter_query_pairs(params):
+    '''
+    Flatten query parameters into (key, value) pairs.
+    :param params: A dictionary whose values may be lists for repeated keys, or a list of (key, value) pairs.
+    '''
+    if not params:
+        return
+    items = params.items() if isinstance(params, dict) else params
+    for key, value in items:
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                if item is not None:
+                    yield key, item
+        else:
+            yield key, value
+
+
+def encode_query_value(value):
+    if isinstance(value, bool):
+        value = 'true' if value else 'false'
+    return quote(str(value), safe='/')
+
+
+def build_query(params):
+    '''Encode query parameters, repeated keys are kept in order.'''
+    return '&'.join('%s=%s' % (quote(str(key), safe=''), encode_query_value(value))
+                    for key, value in iter_query_pairs(params))
+
+
+def filter_condition(field, operator, value):
+    if operator not in FILTER_OPERATORS:
+        raise ValueError('Unknown filter operator %s, expecting one of %s' % (operator, FILTER_OPERATORS))
+    return '%s%s%s' % (field, operator, value)
+
+
+class QueryFilter(object):
+    '''
+    Compile a server side selection into FortiOS filter, format, sort, start and count parameters,
+    so that the device trims the data before sending it.
+
+    Every where() is a separate filter key combined as LOGICAL AND, the conditions of
+    one where_any() are joined by a comma as LOGICAL OR, e.g.
+
+        QueryFilter().where('type', '==', 'ipmask').where_any(('name', '=@', 'web'), ('name', '=@', 'db')) \\
+            .select('name', 'subnet').page(0, 1000).to_params()
+    '''
+
+    def __init__(self):
+        self._filters = list()
+        self._sorters = list()
+        self._fields = list()
+        self._start = None
+        self._count = None
+
+    def where(self, field, operator, value):
+        self._filters.append(filter_condition(field, operator, value))
+        return self
+
+    def where_any(self, *conditions):
+        self._filters.append(','.join(filter_condition(*condition) for condition in conditions))
+        return self
+
+    def raw(self, expression):
+        '''add an already formed filter expression, as given in the filters option of the fact modules.'''
+        self._filters.append(expression)
+        return self
+
+    def sort(self, expression):
+        self._sorters.append(expression)
+        return self
+
+    def select(self, *fields):
+        for field in fields:
+            if field not in self._fields:
+                self._fields.append(field)
+        return self
+
+    def page(self, start, count):
+        self._start = start
+        self._count = count
+        return self
+
+    def to_params(self):
+        params = [('filter', expression) for expression in self._filters]
+        params.extend(('sort', expression) for expression in self._sorters)
+        if self._fields:
+            params.append(('format', '|'.join(self._fields)))
+        if self._start is not None:
+            params.append(('start', self._start))
+        if self._count is not None:
+            params.append(('count', self._count))
+        return params
+
+
+def compile_query_options(filters=None, sorters=None, formatters=None):
+    '''build the query parameters of the filters, sorters and formatters options of the fact modules.'''
+    query = QueryFilter()
+    for expression in filters or []:
+        query.raw(expression)
+    for expression in sorters or []:
+        query.sort(expression)
+    query.select(*(formatters or []))
+    return query.to_params()
+
+
+def to_query_params(parameters):
+    '''turn a QueryFilter into parameters the connection plugin accepts, anything else is passed as is.'''
+    if isinstance(parameters, QueryFilter):
+        return parameters.to_params()
+    return parameters
@@ -0,0 +1,122 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+import re
+import threading
+import time
+
+THROTTLE_STATUS_CODES = [429, 503]
+# a busy device may also reject a request with an internal error.
+THROTTLE_ERROR_PATTERN = re.compile(r'too many (sessions|requests)|session limit|server busy', re.IGNORECASE)
+
+
+class RetryPolicy(object):
+    '''Decide which responses are worth a retry and how long to wait before it.'''
+
+    def __init__(self, max_retries=3, base_delay=0.5, max_delay=30.0, error_codes=None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.error_codes = [str(error_code) for error_code in (error_codes or [])]
+
+    def is_throttled(self, status, response_text):
+        if status in THROTTLE_STATUS_CODES:
+            return True
+        if status != 500 or not response_text:
+            return False
+        if THROTTLE_ERROR_PATTERN.search(response_text[:4096]):
+            return True
+        for error_code in self.error_codes:
+            if re.search(r'"error"\s*:\s*%s\b' % (re.escape(error_code)), response_text[:4096]):
+                return True
+        return False
+
+    def delay(self, attempt, retry_after=None):
+        '''exponential backoff with full jitter, a Retry-After header given by the device wins.'''
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_delay)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class TokenBucket(object):
+    '''Limit the request rate to one device, a rate of zero disables the limit.'''
+
+    def __init__(self, rate=0, burst=10):
+        self.rate = float(rate or 0)
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.time()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class AIMDLimiter(object):
+    '''
+    Adaptive bound of the requests in flight to one device.
+
+    The limit grows by one for every limit successful requests (additive increase) and
+    is halved when the device throttles or the latency exceeds the target (multiplicative decrease).
+    '''
+
+    def __init__(self, maximum, minimum=1, latency_target_ms=0, decrease_factor=0.5):
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.latency_target_ms = latency_target_ms
+        self.decrease_factor = decrease_factor
+        self.limit = float(self.maximum)
+        self.in_flight = 0
+        self.decreases = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, throttled=False, latency_ms=None):
+        with self._condition:
+            self.in_flight -= 1
+            congested = throttled or (self.latency_target_ms and latency_ms is not None and latency_ms > self.latency_target_ms)
+            if congested:
+                self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+                self.decreases += 1
+            else:
+                self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            self._condition.notify_all()
+
+    def get_stats(self):
+        with self._condition:
+            return {
+                'limit': round(self.limit, 3),
+                'maximum': self.maximum,
+                'in_flight': self.in_flight,
+                'decreases': self.decreases,
+            }
@@ -0,0 +1,173 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+from ansible.module_utils._text import to_text
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.json_stream import locate_results
+
+_decoder = json.JSONDecoder()
+
+
+class FortiOSResponse(dict):
+    '''
+    A response of the FortiOS REST API whose results are decoded on first access.
+
+    The envelope (status, http_status, vdom, revision...) is decoded at once, the results array
+    stays in the received text and is decoded from it in place the first time the results are read
+    or the response is enumerated, e.g. when it is copied or serialized into the module output.
+    Callers which only look at the status never pay for decoding a large table.
+    '''
+
+    _text = None
+    _results_at = None
+    _results_end = None
+
+    def __init__(self, envelope=None, text=None, results_at=None, results_end=None):
+        dict.__init__(self, envelope or {})
+        if text is not None:
+            self._text = text
+            self._results_at = results_at
+            self._results_end = results_end
+
+    @property
+    def is_loaded(self):
+        return self._text is None
+
+    def _load(self):
+        if self._text is None:
+            return
+        text = self._text
+        results, end = _decoder.raw_decode(text, self._results_at)
+        self._text = None
+        self._results_at = None
+        if self._results_end is not None and end != self._results_end:
+            # the envelope was cut at the bracket of an array following the results,
+            # recover the attributes in between from the whole response.
+            for key, value in json.loads(text).items():
+                if not dict.__contains__(self, key):
+                    dict.__setitem__(self, key, value)
+        self._results_end = None
+        dict.__setitem__(self, 'results', results)
+
+    def _lookup(self, key):
+        # an attribute missing from the envelope may be one the split dropped.
+        if key == 'results' or (self._text is not None and not dict.__contains__(self, key)):
+            self._load()
+
+    def __getitem__(self, key):
+        self._lookup(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        self._lookup(key)
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        if key == 'results' and self._text is not None:
+            return True
+        self._lookup(key)
+        return dict.__contains__(self, key)
+
+    def __len__(self):
+        self._load()
+        return dict.__len__(self)
+
+    def __iter__(self):
+        self._load()
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        self._load()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._load()
+        return dict.__repr__(self)
+
+    def __setitem__(self, key, value):
+        if key == 'results':
+            self._load()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        if key == 'results':
+            self._load()
+        dict.__delitem__(self, key)
+
+
+def _loaded(method):
+    def wrapper(self, *args, **kwargs):
+        self._load()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ['keys', 'values', 'items', 'copy', 'pop', 'popitem', 'setdefault', 'update', 'clear', '__reduce_ex__']:
+    setattr(FortiOSResponse, _name, _loaded(getattr(dict, _name)))
+
+
+def split_response(text):
+    '''
+    Split a response object into its decoded envelope and the position of its results array.
+
+    The results array is taken to end at the last closing bracket of the text and the envelope is decoded
+    with an empty array in its place. Should an array of the envelope follow the results, the attributes
+    between both are missing from the envelope: the end is verified when the results are decoded and
+    the response looks those attributes up in the whole text then.
+    :return: The envelope and the start and end of the results array, None if the text is not such an object.
+    '''
+    start = locate_results(text)
+    if start is None:
+        return None
+    end = text.rfind(']')
+    if end <= start:
+        return None
+    try:
+        envelope = json.loads(text[:start] + '[]' + text[end + 1:])
+    except ValueError:
+        return None
+    if not isinstance(envelope, dict) or envelope.get('results') != []:
+        return None
+    del envelope['results']
+    return envelope, start, end + 1
+
+
+def decode_response(data, http_status, is_array=False):
+    '''
+    :param is_array: Whether the response may be an array of per vdom responses, of which the first one is returned.
+    :return: The response with the transport status as http_status if the device did not report one.
+    '''
+    text = to_text(data)
+    resp = None
+    split = split_response(text) if text.lstrip()[:1] == '{' else None
+    if split:
+        resp = FortiOSResponse(split[0], text, split[1], split[2])
+    else:
+        try:
+            resp = json.loads(text)
+        except Exception:
+            resp = {'raw': text}
+        if is_array and type(resp) is list:
+            resp = resp[0]
+        resp = FortiOSResponse(resp if isinstance(resp, dict) else {'raw': resp})
+    if is_array and 'http_status' not in resp:
+        resp['http_status'] = http_status
+    elif not is_array and 'status' not in resp:
+        resp['http_status'] = http_status
+    return resp
@@ -0,0 +1,141 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+from collections import OrderedDict
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse, parse_qsl
+
+CMDB_PREFIX = '/api/v2/cmdb/'
+# query keys which do not change the content of a response.
+IGNORED_QUERY_KEYS = ['access_token']
+
+
+def split_cmdb_url(url):
+    '''
+    :return: the table path (/api/v2/cmdb/<path>/<name>), the vdom and the normalized query of a CMDB url,
+        or None for any other url.
+    '''
+    parsed = urlparse(url)
+    if not parsed.path.startswith(CMDB_PREFIX):
+        return None
+    table = '/'.join(parsed.path.split('/')[:6])
+    vdom = None
+    query = list()
+    for key, value in parse_qsl(parsed.query, keep_blank_values=True):
+        if key in IGNORED_QUERY_KEYS:
+            continue
+        if key == 'vdom':
+            vdom = value
+        elif key == 'global' and value == '1':
+            vdom = 'global'
+        query.append((key, value))
+    return table, vdom, tuple(sorted(query))
+
+
+class ResponseCache(object):
+    '''
+    LRU cache of successful CMDB GET responses of one persistent connection.
+
+    Entries expire after ttl seconds and the cache is bounded both in number of entries
+    and in bytes. A write to a table drops the cached responses of that table in the same
+    vdom, a write outside of the CMDB drops everything as its side effects are unknown.
+    '''
+
+    def __init__(self, max_entries=256, max_bytes=16 * 1024 * 1024, ttl=60):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'invalidations': 0,
+        }
+
+    def _key(self, method, url):
+        parts = split_cmdb_url(url)
+        if not parts:
+            return None
+        table, vdom, query = parts
+        return (method, urlparse(url).path, vdom, query), table, vdom
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._size -= entry['size']
+
+    def get(self, method, url):
+        key = self._key(method, url)
+        if not key:
+            return None
+        with self._lock:
+            entry = self._entries.get(key[0])
+            if entry and entry['expires_at'] < time.time():
+                self._remove(key[0])
+                entry = None
+            if not entry:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key[0])
+            self.stats['hits'] += 1
+            return entry['status'], entry['data']
+
+    def put(self, method, url, status, data):
+        key = self._key(method, url)
+        size = len(data)
+        if not key or status != 200 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key[0] in self._entries:
+                self._remove(key[0])
+            self._entries[key[0]] = {
+                'status': status,
+                'data': data,
+                'size': size,
+                'table': key[1],
+                'vdom': key[2],
+                'expires_at': time.time() + self.ttl,
+            }
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats['evictions'] += 1
+
+    def invalidate(self, url):
+        parts = split_cmdb_url(url)
+        with self._lock:
+            if not parts:
+                stale_keys = list(self._entries.keys())
+            else:
+                table, vdom, dummy = parts
+                stale_keys = [key for key, entry in self._entries.items()
+                              if entry['table'] == table and (vdom in [None, 'global'] or entry['vdom'] in [vdom, None, 'global'])]
+            for key in stale_keys:
+                self._remove(key)
+            self.stats['invalidations'] += len(stale_keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._size
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(float(stats['hits']) / lookups, 4) if lookups else 0.0
+        return stats
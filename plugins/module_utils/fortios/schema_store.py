@@ -0,0 +1,66 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+
+class SchemaStore(object):
+    '''
+    Read-only mapping of selectors to their schema entries, kept as compact text.
+
+    Every entry is a line of the selector, a space and the compact json of the entry, the lines
+    starting with a space continue the json of the previous entry. The text is indexed on first use
+    and an entry is decoded only when it is looked up, a module pays for the selectors it uses only.
+    '''
+
+    def __init__(self, text, convert=None):
+        self._text = text
+        self._convert = convert
+        self._index = None
+        self._entries = dict()
+
+    def _get_index(self):
+        if self._index is None:
+            index = dict()
+            key = None
+            for line in self._text.splitlines():
+                if not line:
+                    continue
+                if line[0] == ' ':
+                    index[key].append(line[1:])
+                    continue
+                key, dummy, value = line.partition(' ')
+                index[key] = [value]
+            self._index = index
+        return self._index
+
+    def __contains__(self, key):
+        return key in self._get_index()
+
+    def __iter__(self):
+        return iter(self._get_index())
+
+    def __len__(self):
+        return len(self._get_index())
+
+    def keys(self):
+        return list(self._get_index())
+
+    def __getitem__(self, key):
+        if key not in self._entries:
+            entry = json.loads(''.join(self._get_index()[key]))
+            self._entries[key] = self._convert(entry) if self._convert else entry
+        return self._entries[key]
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self[key]
@@ -0,0 +1,753 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schema_store import SchemaStore
+
+MKEY_TYPES = {'str': str, 'int': int}
+
+
+def _mkey_definition(entry):
+    return {'mkey': entry[0], 'mkey_type': MKEY_TYPES.get(entry[1])}
+
+
+# the master key of every CMDB table and its type, "None" for the tables of a single object.
+CMDB_MKEY_DEFINITIONS = SchemaStore(r'''
+system_vdom ["name","str"]
+system_global ["None",null]
+system_accprofile ["name","str"]
+system_vdom-link ["name","str"]
+system_switch-interface ["name","str"]
+system_object-tagging ["category","str"]
+system_interface ["name","str"]
+system_password-policy ["None",null]
+system_password-policy-guest-admin ["None",null]
+system_sms-server ["name","str"]
+system_custom-language ["name","str"]
+system_admin ["name","str"]
+system_api-user ["name","str"]
+system_sso-admin ["name","str"]
+system_sso-forticloud-admin ["name","str"]
+system_sso-fortigate-cloud-admin ["name","str"]
+system_settings ["None",null]
+system_sit-tunnel ["name","str"]
+system_fsso-polling ["None",null]
+system_ha ["None",null]
+system_ha-monitor ["None",null]
+system_storage ["name","str"]
+system_dedicated-mgmt ["None",null]
+system_arp-table ["id","int"]
+system_ipv6-neighbor-cache ["id","int"]
+system_dns ["None",null]
+system_ddns ["ddnsid","int"]
+system_sflow ["None",null]
+system_vdom-sflow ["None",null]
+system_netflow ["None",null]
+system_vdom-netflow ["None",null]
+system_vdom-dns ["None",null]
+system_replacemsg-image ["name","str"]
+system_replacemsg-group ["name","str"]
+system.snmp_sysinfo ["None",null]
+system.snmp_mib-view ["name","str"]
+system.snmp_community ["id","int"]
+system.snmp_user ["name","str"]
+system.autoupdate_schedule ["None",null]
+system.autoupdate_tunneling ["None",null]
+system_session-ttl ["None",null]
+system.dhcp_server ["id","int"]
+system.dhcp6_server ["id","int"]
+system_alias ["name","str"]
+system_auto-script ["name","str"]
+system_management-tunnel ["None",null]
+system_central-management ["None",null]
+system_zone ["name","str"]
+system_sdn-proxy ["name","str"]
+system_sdn-connector ["name","str"]
+system_ipv6-tunnel ["name","str"]
+system_external-resource ["name","str"]
+system_ips-urlfilter-dns ["address","str"]
+system_ips-urlfilter-dns6 ["address6","str"]
+system_network-visibility ["None",null]
+system_sdwan ["None",null]
+system_evpn ["id","int"]
+system_gre-tunnel ["name","str"]
+system_ipsec-aggregate ["name","str"]
+system_ipip-tunnel ["name","str"]
+system_mobile-tunnel ["name","str"]
+system_pppoe-interface ["name","str"]
+system_vxlan ["name","str"]
+system_geneve ["name","str"]
+system_virtual-wire-pair ["name","str"]
+system_dns-database ["name","str"]
+system_dns-server ["name","str"]
+system_resource-limits ["None",null]
+system_vdom-property ["name","str"]
+system_speed-test-server ["name","str"]
+system.lldp_network-policy ["name","str"]
+system_pcp-server ["None",null]
+system_speed-test-schedule ["interface","str"]
+system_speed-test-setting ["None",null]
+system_standalone-cluster ["None",null]
+system_fortiguard ["None",null]
+system_ips ["None",null]
+system_email-server ["None",null]
+system_alarm ["None",null]
+system_mac-address-table ["mac","str"]
+system_session-helper ["id","int"]
+system_proxy-arp ["id","int"]
+system_fips-cc ["None",null]
+system_tos-based-priority ["id","int"]
+system_dscp-based-priority ["id","int"]
+system_probe-response ["None",null]
+system_link-monitor ["name","str"]
+system_auto-install ["None",null]
+system_console ["None",null]
+system_ntp ["None",null]
+system_ptp ["None",null]
+system_wccp ["service_id","str"]
+system_dns64 ["None",null]
+system_vdom-radius-server ["name","str"]
+system_ftm-push ["None",null]
+system_geoip-override ["name","str"]
+system_fortisandbox ["None",null]
+system_fortindr ["None",null]
+system_affinity-interrupt ["id","int"]
+system_affinity-packet-redistribution ["id","int"]
+system_vdom-exception ["id","int"]
+system_csf ["None",null]
+system_automation-trigger ["name","str"]
+system_automation-action ["name","str"]
+system_automation-destination ["name","str"]
+system_automation-stitch ["name","str"]
+system_nd-proxy ["None",null]
+system_saml ["None",null]
+system_federated-upgrade ["None",null]
+system_device-upgrade ["serial","str"]
+system_vne-tunnel ["None",null]
+system_ike ["None",null]
+system_acme ["None",null]
+system_ipam ["None",null]
+system_fabric-vpn ["None",null]
+wireless-controller_inter-controller ["None",null]
+wireless-controller_global ["None",null]
+wireless-controller.hotspot20_anqp-venue-name ["name","str"]
+wireless-controller.hotspot20_anqp-venue-url ["name","str"]
+wireless-controller.hotspot20_anqp-network-auth-type ["name","str"]
+wireless-controller.hotspot20_anqp-roaming-consortium ["name","str"]
+wireless-controller.hotspot20_anqp-nai-realm ["name","str"]
+wireless-controller.hotspot20_anqp-3gpp-cellular ["name","str"]
+wireless-controller.hotspot20_anqp-ip-address-type ["name","str"]
+wireless-controller.hotspot20_h2qp-operator-name ["name","str"]
+wireless-controller.hotspot20_h2qp-wan-metric ["name","str"]
+wireless-controller.hotspot20_h2qp-conn-capability ["name","str"]
+wireless-controller.hotspot20_icon ["name","str"]
+wireless-controller.hotspot20_h2qp-osu-provider ["name","str"]
+wireless-controller.hotspot20_qos-map ["name","str"]
+wireless-controller.hotspot20_h2qp-advice-of-charge ["name","str"]
+wireless-controller.hotspot20_h2qp-osu-provider-nai ["name","str"]
+wireless-controller.hotspot20_h2qp-terms-and-conditions ["name","str"]
+wireless-controller.hotspot20_hs-profile ["name","str"]
+wireless-controller_vap ["name","str"]
+wireless-controller_timers ["None",null]
+wireless-controller_setting ["None",null]
+wireless-controller_log ["None",null]
+wireless-controller_apcfg-profile ["name","str"]
+wireless-controller_bonjour-profile ["name","str"]
+wireless-controller_arrp-profile ["name","str"]
+wireless-controller_region ["name","str"]
+wireless-controller_vap-group ["name","str"]
+wireless-controller_wids-profile ["name","str"]
+wireless-controller_ble-profile ["name","str"]
+wireless-controller_syslog-profile ["name","str"]
+wireless-controller_wtp-profile ["name","str"]
+wireless-controller_wtp ["wtp_id","str"]
+wireless-controller_wtp-group ["name","str"]
+wireless-controller_qos-profile ["name","str"]
+wireless-controller_wag-profile ["name","str"]
+wireless-controller_utm-profile ["name","str"]
+wireless-controller_snmp ["None",null]
+wireless-controller_mpsk-profile ["name","str"]
+wireless-controller_nac-profile ["name","str"]
+wireless-controller_ssid-policy ["name","str"]
+wireless-controller_access-control-list ["name","str"]
+wireless-controller_ap-status ["id","int"]
+switch-controller_traffic-policy ["name","str"]
+switch-controller_fortilink-settings ["name","str"]
+switch-controller_switch-interface-tag ["name","str"]
+switch-controller_802-1X-settings ["None",null]
+switch-controller.security-policy_802-1X ["name","str"]
+switch-controller.security-policy_local-access ["name","str"]
+switch-controller_location ["name","str"]
+switch-controller_lldp-settings ["None",null]
+switch-controller_lldp-profile ["name","str"]
+switch-controller.qos_dot1p-map ["name","str"]
+switch-controller.qos_ip-dscp-map ["name","str"]
+switch-controller.qos_queue-policy ["name","str"]
+switch-controller.qos_qos-policy ["name","str"]
+switch-controller_storm-control-policy ["name","str"]
+switch-controller.auto-config_policy ["name","str"]
+switch-controller.auto-config_default ["None",null]
+switch-controller.auto-config_custom ["name","str"]
+switch-controller.initial-config_template ["name","str"]
+switch-controller.initial-config_vlans ["None",null]
+switch-controller_switch-profile ["name","str"]
+switch-controller_custom-command ["command_name","str"]
+switch-controller_virtual-port-pool ["name","str"]
+switch-controller.ptp_profile ["name","str"]
+switch-controller.ptp_interface-policy ["name","str"]
+switch-controller_vlan-policy ["name","str"]
+switch-controller.acl_ingress ["id","int"]
+switch-controller.acl_group ["name","str"]
+switch-controller_dynamic-port-policy ["name","str"]
+switch-controller_managed-switch ["switch_id","str"]
+switch-controller_switch-group ["name","str"]
+switch-controller_stp-settings ["None",null]
+switch-controller_stp-instance ["id","str"]
+switch-controller_storm-control ["None",null]
+switch-controller_global ["None",null]
+switch-controller_system ["None",null]
+switch-controller_switch-log ["None",null]
+switch-controller_igmp-snooping ["None",null]
+switch-controller_sflow ["None",null]
+switch-controller_quarantine ["None",null]
+switch-controller_network-monitor-settings ["None",null]
+switch-controller_flow-tracking ["None",null]
+switch-controller_snmp-sysinfo ["None",null]
+switch-controller_snmp-trap-threshold ["None",null]
+switch-controller_snmp-community ["id","int"]
+switch-controller_snmp-user ["name","str"]
+switch-controller_traffic-sniffer ["None",null]
+switch-controller_remote-log ["name","str"]
+switch-controller_mac-policy ["name","str"]
+firewall_address ["name","str"]
+firewall_multicast-address ["name","str"]
+firewall_address6-template ["name","str"]
+firewall_address6 ["name","str"]
+firewall_multicast-address6 ["name","str"]
+firewall_addrgrp ["name","str"]
+firewall_addrgrp6 ["name","str"]
+firewall.wildcard-fqdn_custom ["name","str"]
+firewall.wildcard-fqdn_group ["name","str"]
+firewall_traffic-class ["class_id","int"]
+firewall.service_category ["name","str"]
+firewall.service_custom ["name","str"]
+firewall.service_group ["name","str"]
+firewall_internet-service-name ["name","str"]
+firewall_internet-service-group ["name","str"]
+firewall_internet-service-extension ["id","int"]
+firewall_internet-service-custom ["name","str"]
+firewall_internet-service-addition ["id","int"]
+firewall_internet-service-append ["None",null]
+firewall_internet-service-custom-group ["name","str"]
+firewall_internet-service-definition ["id","int"]
+firewall_network-service-dynamic ["name","str"]
+firewall.shaper_traffic-shaper ["name","str"]
+firewall.shaper_per-ip-shaper ["name","str"]
+firewall_proxy-address ["name","str"]
+firewall_proxy-addrgrp ["name","str"]
+firewall.schedule_onetime ["name","str"]
+firewall.schedule_recurring ["name","str"]
+firewall.schedule_group ["name","str"]
+firewall_ippool ["name","str"]
+firewall_ippool6 ["name","str"]
+firewall_ldb-monitor ["name","str"]
+firewall_vip ["name","str"]
+firewall_vip6 ["name","str"]
+firewall_vipgrp ["name","str"]
+firewall_vipgrp6 ["name","str"]
+firewall.ssh_local-key ["name","str"]
+firewall.ssh_local-ca ["name","str"]
+firewall.ssh_setting ["None",null]
+firewall.ssh_host-key ["name","str"]
+firewall_decrypted-traffic-mirror ["name","str"]
+firewall_access-proxy-virtual-host ["name","str"]
+firewall_access-proxy-ssh-client-cert ["name","str"]
+firewall_access-proxy ["name","str"]
+firewall_access-proxy6 ["name","str"]
+firewall.ipmacbinding_setting ["None",null]
+firewall.ipmacbinding_table ["seq_num","int"]
+firewall_profile-protocol-options ["name","str"]
+firewall_ssl-ssh-profile ["name","str"]
+firewall_ssl-server ["name","str"]
+firewall_profile-group ["name","str"]
+firewall_identity-based-route ["name","str"]
+firewall_auth-portal ["None",null]
+firewall_security-policy ["policyid","int"]
+firewall_policy ["policyid","int"]
+firewall_shaping-policy ["id","int"]
+firewall_shaping-profile ["profile_name","str"]
+firewall_local-in-policy ["policyid","int"]
+firewall_local-in-policy6 ["policyid","int"]
+firewall_ttl-policy ["id","int"]
+firewall_proxy-policy ["policyid","int"]
+firewall_dnstranslation ["id","int"]
+firewall_multicast-policy ["id","int"]
+firewall_multicast-policy6 ["id","int"]
+firewall_interface-policy ["policyid","int"]
+firewall_interface-policy6 ["policyid","int"]
+firewall_DoS-policy ["policyid","int"]
+firewall_DoS-policy6 ["policyid","int"]
+firewall_sniffer ["id","int"]
+firewall_central-snat-map ["policyid","int"]
+firewall.ssl_setting ["None",null]
+firewall_ip-translation ["transid","int"]
+firewall_ipv6-eh-filter ["None",null]
+firewall_global ["None",null]
+vpn.certificate_ca ["name","str"]
+vpn.certificate_remote ["name","str"]
+vpn.certificate_local ["name","str"]
+vpn.certificate_crl ["name","str"]
+vpn.certificate_ocsp-server ["name","str"]
+vpn.certificate_setting ["None",null]
+vpn_qkd ["name","str"]
+vpn.ssl.web_realm ["url_path","str"]
+vpn.ssl.web_host-check-software ["name","str"]
+vpn.ssl.web_portal ["name","str"]
+vpn.ssl.web_user-group-bookmark ["name","str"]
+vpn.ssl.web_user-bookmark ["name","str"]
+vpn.ssl_settings ["None",null]
+vpn.ssl_client ["name","str"]
+vpn.ipsec_fec ["name","str"]
+vpn.ipsec_phase1 ["name","str"]
+vpn.ipsec_phase2 ["name","str"]
+vpn.ipsec_manualkey ["name","str"]
+vpn.ipsec_concentrator ["id","int"]
+vpn.ipsec_phase1-interface ["name","str"]
+vpn.ipsec_phase2-interface ["name","str"]
+vpn.ipsec_manualkey-interface ["name","str"]
+vpn.ipsec_forticlient ["realm","str"]
+vpn_kmip-server ["name","str"]
+vpn_pptp ["None",null]
+vpn_l2tp ["None",null]
+certificate_ca ["name","str"]
+certificate_remote ["name","str"]
+certificate_local ["name","str"]
+certificate_crl ["name","str"]
+webfilter_ftgd-local-cat ["desc","str"]
+webfilter_content ["id","int"]
+webfilter_content-header ["id","int"]
+webfilter_urlfilter ["id","int"]
+webfilter_ips-urlfilter-setting ["None",null]
+webfilter_ips-urlfilter-setting6 ["None",null]
+webfilter_ips-urlfilter-cache-setting ["None",null]
+webfilter_profile ["name","str"]
+webfilter_fortiguard ["None",null]
+webfilter_override ["id","int"]
+webfilter_ftgd-local-rating ["url","str"]
+webfilter_search-engine ["name","str"]
+ips_sensor ["name","str"]
+ips_custom ["tag","str"]
+ips_global ["None",null]
+ips_settings ["None",null]
+sctp-filter_profile ["name","str"]
+diameter-filter_profile ["name","str"]
+web-proxy_profile ["name","str"]
+web-proxy_global ["None",null]
+web-proxy_explicit ["None",null]
+web-proxy_forward-server ["name","str"]
+web-proxy_forward-server-group ["name","str"]
+web-proxy_debug-url ["name","str"]
+web-proxy_wisp ["name","str"]
+web-proxy_fast-fallback ["name","str"]
+web-proxy_url-match ["name","str"]
+wanopt_webcache ["None",null]
+wanopt_settings ["None",null]
+wanopt_peer ["peer_host_id","str"]
+wanopt_auth-group ["name","str"]
+wanopt_profile ["name","str"]
+wanopt_content-delivery-network-rule ["name","str"]
+wanopt_cache-service ["None",null]
+wanopt_remote-storage ["None",null]
+ftp-proxy_explicit ["None",null]
+application_custom ["tag","str"]
+application_list ["name","str"]
+application_group ["name","str"]
+dlp_data-type ["name","str"]
+dlp_dictionary ["name","str"]
+dlp_exact-data-match ["name","str"]
+dlp_sensor ["name","str"]
+dlp_filepattern ["id","int"]
+dlp_sensitivity ["name","str"]
+dlp_fp-doc-source ["name","str"]
+dlp_profile ["name","str"]
+dlp_settings ["None",null]
+videofilter_youtube-key ["id","int"]
+videofilter_keyword ["id","int"]
+videofilter_profile ["name","str"]
+emailfilter_bword ["id","int"]
+emailfilter_block-allow-list ["id","int"]
+emailfilter_mheader ["id","int"]
+emailfilter_dnsbl ["id","int"]
+emailfilter_iptrust ["id","int"]
+emailfilter_profile ["name","str"]
+emailfilter_fortishield ["None",null]
+emailfilter_options ["None",null]
+log_threat-weight ["None",null]
+log_custom-field ["id","str"]
+log.syslogd_setting ["None",null]
+log.syslogd_override-setting ["None",null]
+log.syslogd_filter ["None",null]
+log.syslogd_override-filter ["None",null]
+log.syslogd2_setting ["None",null]
+log.syslogd2_override-setting ["None",null]
+log.syslogd2_filter ["None",null]
+log.syslogd2_override-filter ["None",null]
+log.syslogd3_setting ["None",null]
+log.syslogd3_override-setting ["None",null]
+log.syslogd3_filter ["None",null]
+log.syslogd3_override-filter ["None",null]
+log.syslogd4_setting ["None",null]
+log.syslogd4_override-setting ["None",null]
+log.syslogd4_filter ["None",null]
+log.syslogd4_override-filter ["None",null]
+log.webtrends_setting ["None",null]
+log.webtrends_filter ["None",null]
+log.memory_global-setting ["None",null]
+log.memory_setting ["None",null]
+log.memory_filter ["None",null]
+log.disk_setting ["None",null]
+log.disk_filter ["None",null]
+log_eventfilter ["None",null]
+log.fortiguard_setting ["None",null]
+log.fortiguard_override-setting ["None",null]
+log.fortiguard_filter ["None",null]
+log.fortiguard_override-filter ["None",null]
+log.tacacs+accounting_setting ["None",null]
+log.tacacs+accounting_filter ["None",null]
+log.tacacs+accounting2_setting ["None",null]
+log.tacacs+accounting2_filter ["None",null]
+log.tacacs+accounting3_setting ["None",null]
+log.tacacs+accounting3_filter ["None",null]
+log.null-device_setting ["None",null]
+log.null-device_filter ["None",null]
+log_setting ["None",null]
+log_gui-display ["None",null]
+log.fortianalyzer_setting ["None",null]
+log.fortianalyzer_override-setting ["None",null]
+log.fortianalyzer_filter ["None",null]
+log.fortianalyzer_override-filter ["None",null]
+log.fortianalyzer2_setting ["None",null]
+log.fortianalyzer2_override-setting ["None",null]
+log.fortianalyzer2_filter ["None",null]
+log.fortianalyzer2_override-filter ["None",null]
+log.fortianalyzer3_setting ["None",null]
+log.fortianalyzer3_override-setting ["None",null]
+log.fortianalyzer3_filter ["None",null]
+log.fortianalyzer3_override-filter ["None",null]
+log.fortianalyzer-cloud_setting ["None",null]
+log.fortianalyzer-cloud_override-setting ["None",null]
+log.fortianalyzer-cloud_filter ["None",null]
+log.fortianalyzer-cloud_override-filter ["None",null]
+icap_server ["name","str"]
+icap_server-group ["name","str"]
+icap_profile ["name","str"]
+user_peer ["name","str"]
+user_peergrp ["name","str"]
+user_certificate ["name","str"]
+user_radius ["name","str"]
+user_tacacs+ ["name","str"]
+user_exchange ["name","str"]
+user_ldap ["name","str"]
+user_krb-keytab ["name","str"]
+user_domain-controller ["name","str"]
+user_pop3 ["name","str"]
+user_saml ["name","str"]
+user_external-identity-provider ["name","str"]
+user_fsso ["name","str"]
+user_adgrp ["name","str"]
+user_fsso-polling ["id","int"]
+user_fortitoken ["serial_number","str"]
+user_password-policy ["name","str"]
+user_local ["name","str"]
+user_setting ["None",null]
+user_quarantine ["None",null]
+user_group ["name","str"]
+user_security-exempt-list ["name","str"]
+user_nac-policy ["name","str"]
+voip_profile ["name","str"]
+dnsfilter_domain-filter ["id","int"]
+dnsfilter_profile ["name","str"]
+nsxt_setting ["None",null]
+nsxt_service-chain ["id","int"]
+antivirus_settings ["None",null]
+antivirus_quarantine ["None",null]
+antivirus_exempt-list ["name","str"]
+antivirus_profile ["name","str"]
+ssh-filter_profile ["name","str"]
+file-filter_profile ["name","str"]
+virtual-patch_profile ["name","str"]
+report_layout ["name","str"]
+report_setting ["None",null]
+waf_main-class ["id","int"]
+waf_sub-class ["id","int"]
+waf_signature ["id","int"]
+waf_profile ["name","str"]
+casb_saas-application ["name","str"]
+casb_user-activity ["name","str"]
+casb_profile ["name","str"]
+authentication_scheme ["name","str"]
+authentication_rule ["name","str"]
+authentication_setting ["None",null]
+extension-controller_dataplan ["name","str"]
+extension-controller_extender-profile ["name","str"]
+extension-controller_extender ["name","str"]
+extension-controller_fortigate-profile ["name","str"]
+extension-controller_fortigate ["name","str"]
+endpoint-control_fctems ["ems_id","int"]
+endpoint-control_settings ["None",null]
+endpoint-control_fctems-override ["ems_id","int"]
+alertemail_setting ["None",null]
+router_access-list ["name","str"]
+router_access-list6 ["name","str"]
+router_aspath-list ["name","str"]
+router_prefix-list ["name","str"]
+router_prefix-list6 ["name","str"]
+router_key-chain ["name","str"]
+router_community-list ["name","str"]
+router_extcommunity-list ["name","str"]
+router_route-map ["name","str"]
+router_rip ["None",null]
+router_ripng ["None",null]
+router_static ["seq_num","int"]
+router_policy ["seq_num","int"]
+router_policy6 ["seq_num","int"]
+router_static6 ["seq_num","int"]
+router_ospf ["None",null]
+router_ospf6 ["None",null]
+router_bgp ["None",null]
+router_isis ["None",null]
+router_multicast-flow ["name","str"]
+router_multicast ["None",null]
+router_multicast6 ["None",null]
+router_auth-path ["name","str"]
+router_setting ["None",null]
+router_bfd ["None",null]
+router_bfd6 ["None",null]
+automation_setting ["None",null]
+dpdk_global ["None",null]
+dpdk_cpus ["None",null]
+system_isf-queue-profile ["name","str"]
+system_npu ["None",null]
+system_np6 ["name","str"]
+system_gi-gk ["None",null]
+system_modem ["None",null]
+system.3g-modem_custom ["id","int"]
+system_lte-modem ["None",null]
+firewall_gtp ["name","str"]
+firewall_pfcp ["name","str"]
+firewall_acl ["policyid","int"]
+firewall_acl6 ["policyid","int"]
+gtp_apn ["name","str"]
+gtp_apngrp ["name","str"]
+gtp_message-filter-v0v1 ["name","str"]
+gtp_message-filter-v2 ["name","str"]
+gtp_rat-timeout-profile ["name","str"]
+gtp_ie-allow-list ["name","str"]
+gtp_tunnel-limit ["name","str"]
+gtp_apn-shaper ["id","int"]
+pfcp_message-filter ["name","str"]
+monitoring_np6-ipsec-engine ["None",null]
+monitoring_npu-hpe ["None",null]
+system_npu-vlink ["name","str"]
+system_physical-switch ["name","str"]
+system_virtual-switch ["name","str"]
+system_stp ["None",null]
+system_smc-ntp ["None",null]
+videofilter_youtube-channel-filter ["id","int"]
+switch-controller.ptp_settings ["None",null]
+switch-controller.ptp_policy ["name","str"]
+vpn_ocvpn ["None",null]
+system.replacemsg_mail ["msg_type","str"]
+system.replacemsg_http ["msg_type","str"]
+system.replacemsg_webproxy ["msg_type","str"]
+system.replacemsg_ftp ["msg_type","str"]
+system.replacemsg_fortiguard-wf ["msg_type","str"]
+system.replacemsg_spam ["msg_type","str"]
+system.replacemsg_alertmail ["msg_type","str"]
+system.replacemsg_admin ["msg_type","str"]
+system.replacemsg_auth ["msg_type","str"]
+system.replacemsg_sslvpn ["msg_type","str"]
+system.replacemsg_nac-quar ["msg_type","str"]
+system.replacemsg_traffic-quota ["msg_type","str"]
+system.replacemsg_utm ["msg_type","str"]
+system.replacemsg_icap ["msg_type","str"]
+system.replacemsg_automation ["msg_type","str"]
+system_status ["None",null]
+system.performance_status ["None",null]
+system.performance_top ["None",null]
+system.performance.firewall_packet-distribution ["None",null]
+system.performance.firewall_statistics ["None",null]
+system_session ["None",null]
+system_session6 ["None",null]
+system_cmdb ["None",null]
+system_fortiguard-service ["None",null]
+system_fortianalyzer-connectivity ["None",null]
+system.checksum_status ["None",null]
+system_mgmt-csum ["None",null]
+system_ha-nonsync-csum ["None",null]
+system_fortiguard-log-service ["None",null]
+system_central-mgmt ["None",null]
+system.info.admin_status ["None",null]
+system.info.admin_ssh ["None",null]
+system_geoip-country ["id","str"]
+system_cluster-sync ["sync_id","int"]
+system_arp ["None",null]
+system_startup-error-log ["None",null]
+system.source-ip_status ["None",null]
+system.auto-update_status ["None",null]
+system.auto-update_versions ["None",null]
+system.session-info_list ["None",null]
+system.session-info_expectation ["None",null]
+system.session-info_full-stat ["None",null]
+system.session-info_statistics ["None",null]
+system.session-info_ttl ["None",null]
+system.session-helper-info_list ["None",null]
+system.ip-conflict_status ["None",null]
+wireless-controller_scan ["None",null]
+wireless-controller_wlchanlistlic ["None",null]
+wireless-controller_status ["None",null]
+wireless-controller_wtp-status ["None",null]
+wireless-controller_client-info ["None",null]
+wireless-controller_vap-status ["None",null]
+wireless-controller_rf-analysis ["None",null]
+wireless-controller_spectral-info ["None",null]
+ipsec_tunnel ["None",null]
+firewall_city ["id","int"]
+firewall_region ["id","int"]
+firewall_country ["id","int"]
+firewall_internet-service ["id","int"]
+firewall_internet-service-reputation ["id","int"]
+firewall_internet-service-sld ["id","int"]
+firewall_internet-service-ipbl-vendor ["id","int"]
+firewall_internet-service-ipbl-reason ["id","int"]
+firewall_internet-service-owner ["id","int"]
+firewall_internet-service-list ["id","int"]
+firewall_internet-service-botnet ["id","int"]
+firewall_vendor-mac ["id","int"]
+firewall_vendor-mac-summary ["None",null]
+firewall.shaper_traffic ["None",null]
+firewall.shaper_per-ip ["None",null]
+firewall.iprope_list ["None",null]
+firewall.iprope.appctrl_list ["None",null]
+firewall.iprope.appctrl_status ["None",null]
+firewall_proute ["None",null]
+firewall_proute6 ["None",null]
+vpn.ssl_monitor ["None",null]
+vpn.ipsec.stats_crypto ["None",null]
+vpn.ipsec.stats_tunnel ["None",null]
+vpn.ipsec.tunnel_details ["None",null]
+vpn.ipsec.tunnel_summary ["None",null]
+vpn.ipsec.tunnel_name ["None",null]
+vpn.ike_gateway ["None",null]
+vpn.status_l2tp ["None",null]
+vpn.status_pptp ["None",null]
+vpn.status.ssl_list ["None",null]
+vpn.status.ssl_hw-acceleration-status ["None",null]
+webfilter_categories ["None",null]
+webfilter_ftgd-statistics ["None",null]
+webfilter_status ["None",null]
+webfilter_override-usr ["None",null]
+ips_view-map ["id","int"]
+ips_decoder ["name","str"]
+ips_rule ["name","str"]
+ips_rule-settings ["id","int"]
+ips_session ["None",null]
+application_name ["name","str"]
+application_rule-settings ["id","int"]
+report.sql_status ["None",null]
+extender-controller_dataplan ["name","str"]
+extender-controller_extender-profile ["name","str"]
+extender-controller_extender ["name","str"]
+router_info ["None",null]
+router_info6 ["None",null]
+hardware_status ["None",null]
+hardware_cpu ["None",null]
+hardware_memory ["None",null]
+hardware_nic ["None",null]
+hardware.npu.np6_port-list ["None",null]
+hardware.npu.np6_dce ["None",null]
+hardware.npu.np6_session-stats ["None",null]
+hardware.npu.np6_sse-stats ["None",null]
+hardware.npu.np6_ipsec-stats ["None",null]
+hardware.npu.np6_synproxy-stats ["None",null]
+mgmt-data_status ["None",null]
+extender_sys-info ["None",null]
+extender_extender-info ["None",null]
+extender_session-info ["None",null]
+extender_datachannel-info ["None",null]
+extender_fexwan ["None",null]
+extender_modem-status ["None",null]
+extender_lte-carrier-list ["None",null]
+extender_lte-carrier-by-mcc-mnc ["None",null]
+wireless-controller_address ["id","str"]
+wireless-controller_addrgrp ["id","str"]
+system_fortiai ["None",null]
+system_fortimanager ["None",null]
+system_fm ["None",null]
+system_nat64 ["None",null]
+firewall_vip46 ["name","str"]
+firewall_vip64 ["name","str"]
+firewall_vipgrp46 ["name","str"]
+firewall_vipgrp64 ["name","str"]
+firewall_policy64 ["policyid","int"]
+firewall_policy46 ["policyid","int"]
+system.autoupdate_push-update ["None",null]
+switch-controller_nac-settings ["name","str"]
+switch-controller_port-policy ["name","str"]
+switch-controller_nac-device ["id","int"]
+emailfilter_bwl ["id","int"]
+antivirus_heuristic ["None",null]
+credential-store_domain-controller ["server_name","str"]
+report_dataset ["name","str"]
+report_chart ["name","str"]
+report_style ["name","str"]
+report_theme ["name","str"]
+gtp_ie-white-list ["name","str"]
+system.replacemsg_nntp ["msg_type","str"]
+system.replacemsg_device-detection-portal ["msg_type","str"]
+switch-controller_poe ["None",null]
+cifs_domain-controller ["server_name","str"]
+cifs_profile ["name","str"]
+system.replacemsg_mms ["msg_type","str"]
+system.replacemsg_mm1 ["msg_type","str"]
+system.replacemsg_mm3 ["msg_type","str"]
+system.replacemsg_mm4 ["msg_type","str"]
+system.replacemsg_mm7 ["msg_type","str"]
+system_virtual-wan-link ["None",null]
+system_mem-mgr ["None",null]
+firewall_carrier-endpoint-bwl ["id","int"]
+firewall_mms-profile ["name","str"]
+firewall.consolidated_policy ["policyid","int"]
+firewall_policy6 ["policyid","int"]
+antivirus_notification ["id","int"]
+antivirus_mms-checksum ["id","int"]
+switch-controller_vlan ["name","str"]
+switch-controller.security-policy_captive-portal ["name","str"]
+user_device ["alias","str"]
+user_device-group ["name","str"]
+endpoint-control_client ["id","int"]
+system.replacemsg_ec ["msg_type","str"]
+dlp_fp-sensitivity ["name","str"]
+spamfilter_bword ["id","int"]
+spamfilter_bwl ["id","int"]
+spamfilter_mheader ["id","int"]
+spamfilter_dnsbl ["id","int"]
+spamfilter_iptrust ["id","int"]
+spamfilter_profile ["name","str"]
+spamfilter_fortishield ["None",null]
+spamfilter_options ["None",null]
+user_device-category ["name","str"]
+user_device-access-list ["name","str"]
+switch-controller_mac-sync-settings ["None",null]
+endpoint-control_forticlient-ems ["name","str"]
+endpoint-control_profile ["profile_name","str"]
+endpoint-control_forticlient-registration-sync ["peer_name","str"]
+endpoint-control_registered-forticlient ["uid","str"]
+''', convert=_mkey_definition)
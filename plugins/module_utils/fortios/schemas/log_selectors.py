@@ -0,0 +1,446 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schema_store import SchemaStore
+
+# the log API url of every selector and the query parameters it accepts.
+LOG_SELECTOR_DEFINITIONS = SchemaStore(r'''
+disk_virus_archive {"url":"disk/virus/archive","params":{"mkey":{"type":"int","required":"False"},"filename":{"type":"string","required":"False"}}}
+memory_virus_archive {"url":"memory/virus/archive","params":{"mkey":{"type":"int","required":"False"},"filename":{"type":"string",
+ "required":"False"}}}
+fortianalyzer_virus_archive {"url":"fortianalyzer/virus/archive","params":{"mkey":{"type":"int","required":"False"},"filename":{"type":"string",
+ "required":"False"}}}
+forticloud_virus_archive {"url":"forticloud/virus/archive","params":{"mkey":{"type":"int","required":"False"},"filename":{"type":"string",
+ "required":"False"}}}
+disk_ips_archive {"url":"disk/ips/archive","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int","required":"False"}}}
+disk_app-ctrl_archive {"url":"disk/app-ctrl/archive","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int","required":"False"}}}
+memory_ips_archive {"url":"memory/ips/archive","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int","required":"False"}}}
+memory_app-ctrl_archive {"url":"memory/app-ctrl/archive","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int","required":"False"}}}
+fortianalyzer_ips_archive {"url":"fortianalyzer/ips/archive","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int",
+ "required":"False"}}}
+fortianalyzer_app-ctrl_archive {"url":"fortianalyzer/app-ctrl/archive","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int",
+ "required":"False"}}}
+forticloud_ips_archive {"url":"forticloud/ips/archive","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int","required":"False"}}}
+forticloud_app-ctrl_archive {"url":"forticloud/app-ctrl/archive","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int",
+ "required":"False"}}}
+disk_ips_archive-download {"url":"disk/ips/archive-download","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int",
+ "required":"False"},"filename":{"type":"string","required":"False"}}}
+disk_app-ctrl_archive-download {"url":"disk/app-ctrl/archive-download","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int",
+ "required":"False"},"filename":{"type":"string","required":"False"}}}
+memory_ips_archive-download {"url":"memory/ips/archive-download","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int",
+ "required":"False"},"filename":{"type":"string","required":"False"}}}
+memory_app-ctrl_archive-download {"url":"memory/app-ctrl/archive-download","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int",
+ "required":"False"},"filename":{"type":"string","required":"False"}}}
+fortianalyzer_ips_archive-download {"url":"fortianalyzer/ips/archive-download","params":{"mkey":{"type":"int","required":"False"},
+ "roll":{"type":"int","required":"False"},"filename":{"type":"string","required":"False"}}}
+fortianalyzer_app-ctrl_archive-download {"url":"fortianalyzer/app-ctrl/archive-download","params":{"mkey":{"type":"int","required":"False"},
+ "roll":{"type":"int","required":"False"},"filename":{"type":"string","required":"False"}}}
+forticloud_ips_archive-download {"url":"forticloud/ips/archive-download","params":{"mkey":{"type":"int","required":"False"},"roll":{"type":"int",
+ "required":"False"},"filename":{"type":"string","required":"False"}}}
+forticloud_app-ctrl_archive-download {"url":"forticloud/app-ctrl/archive-download","params":{"mkey":{"type":"int","required":"False"},
+ "roll":{"type":"int","required":"False"},"filename":{"type":"string","required":"False"}}}
+disk_virus_raw {"url":"disk/virus/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_webfilter_raw {"url":"disk/webfilter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_waf_raw {"url":"disk/waf/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_ips_raw {"url":"disk/ips/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_anomaly_raw {"url":"disk/anomaly/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_app-ctrl_raw {"url":"disk/app-ctrl/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_cifs_raw {"url":"disk/cifs/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_emailfilter_raw {"url":"disk/emailfilter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_dlp_raw {"url":"disk/dlp/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_voip_raw {"url":"disk/voip/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_gtp_raw {"url":"disk/gtp/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_dns_raw {"url":"disk/dns/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_ssh_raw {"url":"disk/ssh/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_ssl_raw {"url":"disk/ssl/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+disk_file-filter_raw {"url":"disk/file-filter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_virus_raw {"url":"memory/virus/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_webfilter_raw {"url":"memory/webfilter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_waf_raw {"url":"memory/waf/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_ips_raw {"url":"memory/ips/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_anomaly_raw {"url":"memory/anomaly/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_app-ctrl_raw {"url":"memory/app-ctrl/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_cifs_raw {"url":"memory/cifs/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_emailfilter_raw {"url":"memory/emailfilter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_dlp_raw {"url":"memory/dlp/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_voip_raw {"url":"memory/voip/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_gtp_raw {"url":"memory/gtp/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_dns_raw {"url":"memory/dns/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_ssh_raw {"url":"memory/ssh/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_ssl_raw {"url":"memory/ssl/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+memory_file-filter_raw {"url":"memory/file-filter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_virus_raw {"url":"fortianalyzer/virus/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_webfilter_raw {"url":"fortianalyzer/webfilter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"}}}
+fortianalyzer_waf_raw {"url":"fortianalyzer/waf/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_ips_raw {"url":"fortianalyzer/ips/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_anomaly_raw {"url":"fortianalyzer/anomaly/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"}}}
+fortianalyzer_app-ctrl_raw {"url":"fortianalyzer/app-ctrl/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"}}}
+fortianalyzer_cifs_raw {"url":"fortianalyzer/cifs/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_emailfilter_raw {"url":"fortianalyzer/emailfilter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"}}}
+fortianalyzer_dlp_raw {"url":"fortianalyzer/dlp/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_voip_raw {"url":"fortianalyzer/voip/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_gtp_raw {"url":"fortianalyzer/gtp/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_dns_raw {"url":"fortianalyzer/dns/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_ssh_raw {"url":"fortianalyzer/ssh/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_ssl_raw {"url":"fortianalyzer/ssl/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+fortianalyzer_file-filter_raw {"url":"fortianalyzer/file-filter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"}}}
+forticloud_virus_raw {"url":"forticloud/virus/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_webfilter_raw {"url":"forticloud/webfilter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"}}}
+forticloud_waf_raw {"url":"forticloud/waf/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_ips_raw {"url":"forticloud/ips/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_anomaly_raw {"url":"forticloud/anomaly/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_app-ctrl_raw {"url":"forticloud/app-ctrl/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_cifs_raw {"url":"forticloud/cifs/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_emailfilter_raw {"url":"forticloud/emailfilter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"}}}
+forticloud_dlp_raw {"url":"forticloud/dlp/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_voip_raw {"url":"forticloud/voip/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_gtp_raw {"url":"forticloud/gtp/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_dns_raw {"url":"forticloud/dns/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_ssh_raw {"url":"forticloud/ssh/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_ssl_raw {"url":"forticloud/ssl/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"}}}
+forticloud_file-filter_raw {"url":"forticloud/file-filter/raw","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"}}}
+disk_event_vpn {"url":"disk/event/vpn","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_user {"url":"disk/event/user","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_router {"url":"disk/event/router","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_wireless {"url":"disk/event/wireless","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_wad {"url":"disk/event/wad","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_endpoint {"url":"disk/event/endpoint","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_ha {"url":"disk/event/ha","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_compliance-check {"url":"disk/event/compliance-check","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_system {"url":"disk/event/system","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_connector {"url":"disk/event/connector","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_security-rating {"url":"disk/event/security-rating","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_event_fortiextender {"url":"disk/event/fortiextender","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_traffic_forward {"url":"disk/traffic/forward","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_traffic_local {"url":"disk/traffic/local","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_traffic_multicast {"url":"disk/traffic/multicast","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_traffic_sniffer {"url":"disk/traffic/sniffer","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_traffic_fortiview {"url":"disk/traffic/fortiview","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+disk_traffic_threat {"url":"disk/traffic/threat","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_vpn {"url":"memory/event/vpn","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_user {"url":"memory/event/user","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_router {"url":"memory/event/router","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_wireless {"url":"memory/event/wireless","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_wad {"url":"memory/event/wad","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_endpoint {"url":"memory/event/endpoint","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_ha {"url":"memory/event/ha","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_compliance-check {"url":"memory/event/compliance-check","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_system {"url":"memory/event/system","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_connector {"url":"memory/event/connector","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_security-rating {"url":"memory/event/security-rating","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_event_fortiextender {"url":"memory/event/fortiextender","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_traffic_forward {"url":"memory/traffic/forward","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_traffic_local {"url":"memory/traffic/local","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_traffic_multicast {"url":"memory/traffic/multicast","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_traffic_sniffer {"url":"memory/traffic/sniffer","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_traffic_fortiview {"url":"memory/traffic/fortiview","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+memory_traffic_threat {"url":"memory/traffic/threat","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_vpn {"url":"fortianalyzer/event/vpn","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_user {"url":"fortianalyzer/event/user","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_router {"url":"fortianalyzer/event/router","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_wireless {"url":"fortianalyzer/event/wireless","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_wad {"url":"fortianalyzer/event/wad","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_endpoint {"url":"fortianalyzer/event/endpoint","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_ha {"url":"fortianalyzer/event/ha","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_compliance-check {"url":"fortianalyzer/event/compliance-check","params":{"start":{"type":"int","required":"False"},
+ "rows":{"type":"int","required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},
+ "is_ha_member":{"type":"boolean","required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_system {"url":"fortianalyzer/event/system","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_connector {"url":"fortianalyzer/event/connector","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_security-rating {"url":"fortianalyzer/event/security-rating","params":{"start":{"type":"int","required":"False"},
+ "rows":{"type":"int","required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},
+ "is_ha_member":{"type":"boolean","required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_event_fortiextender {"url":"fortianalyzer/event/fortiextender","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_traffic_forward {"url":"fortianalyzer/traffic/forward","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_traffic_local {"url":"fortianalyzer/traffic/local","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_traffic_multicast {"url":"fortianalyzer/traffic/multicast","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_traffic_sniffer {"url":"fortianalyzer/traffic/sniffer","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_traffic_fortiview {"url":"fortianalyzer/traffic/fortiview","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+fortianalyzer_traffic_threat {"url":"fortianalyzer/traffic/threat","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_vpn {"url":"forticloud/event/vpn","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_user {"url":"forticloud/event/user","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_router {"url":"forticloud/event/router","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_wireless {"url":"forticloud/event/wireless","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_wad {"url":"forticloud/event/wad","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_endpoint {"url":"forticloud/event/endpoint","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_ha {"url":"forticloud/event/ha","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_compliance-check {"url":"forticloud/event/compliance-check","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_system {"url":"forticloud/event/system","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int","required":"False"},
+ "session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean","required":"False"},
+ "filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_connector {"url":"forticloud/event/connector","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_security-rating {"url":"forticloud/event/security-rating","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_event_fortiextender {"url":"forticloud/event/fortiextender","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_traffic_forward {"url":"forticloud/traffic/forward","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_traffic_local {"url":"forticloud/traffic/local","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_traffic_multicast {"url":"forticloud/traffic/multicast","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_traffic_sniffer {"url":"forticloud/traffic/sniffer","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_traffic_fortiview {"url":"forticloud/traffic/fortiview","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+forticloud_traffic_threat {"url":"forticloud/traffic/threat","params":{"start":{"type":"int","required":"False"},"rows":{"type":"int",
+ "required":"False"},"session_id":{"type":"int","required":"False"},"serial_no":{"type":"string","required":"False"},"is_ha_member":{"type":"boolean",
+ "required":"False"},"filter":{"type":"string","required":"False"},"extra":{"type":"string","required":"False"}}}
+''')
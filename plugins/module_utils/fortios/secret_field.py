@@ -31,7 +31,8 @@ secret_fields = [
 ]
 
 
+_secret_field_set = frozenset(secret_fields)
+
+
 def is_secret_field(key_name):
-    if key_name in secret_fields:
-        return True
-    return False
+    return key_name in _secret_field_set
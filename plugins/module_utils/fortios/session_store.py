@@ -0,0 +1,112 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from ansible.module_utils._text import to_bytes
+
+
+def _is_process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+class SessionStore(object):
+    '''
+    File based broker of authenticated FortiOS sessions.
+
+    All the ansible-connection processes of a controller which log in to the same device
+    with the same user share one admin session instead of opening their own. An entry
+    holds the auth headers, the session key, the pids of the processes using it and a
+    generation number which is increased whenever a process logs in again after a 401.
+    Every read-modify-write of an entry must happen within lock().
+    '''
+
+    def __init__(self, store_dir, ttl=300):
+        self.store_dir = os.path.expanduser(store_dir)
+        self.ttl = ttl
+
+    def _entry_path(self, host, username):
+        digest = hashlib.sha256(to_bytes('%s|%s' % (host, username))).hexdigest()
+        return os.path.join(self.store_dir, 'fortios_session_%s.json' % (digest[:32]))
+
+    @contextmanager
+    def lock(self, host, username):
+        if not os.path.isdir(self.store_dir):
+            os.makedirs(self.store_dir, 0o700)
+        with open(self._entry_path(host, username) + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def load(self, host, username):
+        try:
+            with open(self._entry_path(host, username), 'r') as f:
+                entry = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if entry.get('expires_at', 0) < time.time():
+            return None
+        entry['holders'] = [pid for pid in entry.get('holders', []) if _is_process_alive(pid)]
+        return entry
+
+    def save(self, host, username, entry):
+        entry['expires_at'] = time.time() + self.ttl
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, prefix='.fortios_session_')
+        with os.fdopen(fd, 'w') as f:
+            os.fchmod(f.fileno(), 0o600)
+            json.dump(entry, f)
+        os.rename(tmp_path, self._entry_path(host, username))
+        return entry
+
+    def touch(self, host, username):
+        '''extend the lifetime of an entry, the device keeps the session alive while it is used.'''
+        entry = self.load(host, username)
+        if entry:
+            self.save(host, username, entry)
+
+    def delete(self, host, username):
+        try:
+            os.remove(self._entry_path(host, username))
+        except OSError:
+            pass
+
+    def register(self, host, username, entry, pid=None):
+        pid = pid or os.getpid()
+        if pid not in entry['holders']:
+            entry['holders'].append(pid)
+        return self.save(host, username, entry)
+
+    def unregister(self, host, username, pid=None):
+        '''
+        :return: True if no other live process uses the session anymore, the caller logs it out.
+        '''
+        pid = pid or os.getpid()
+        entry = self.load(host, username)
+        if not entry:
+            return True
+        entry['holders'] = [holder for holder in entry['holders'] if holder != pid]
+        if entry['holders']:
+            self.save(host, username, entry)
+            return False
+        self.delete(host, username)
+        return True
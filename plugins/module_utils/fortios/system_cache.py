@@ -0,0 +1,85 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from ansible.module_utils._text import to_bytes
+
+
+def token_fingerprint(secret):
+    '''one way fingerprint of a credential, the credential itself is never written to disk.'''
+    if not secret:
+        return 'anonymous'
+    return hashlib.sha256(to_bytes(secret)).hexdigest()[:16]
+
+
+class SystemStateCache(object):
+    '''
+    On-disk cache of the firmware version and authentication validity of FortiOS devices.
+
+    Entries are keyed by host and credential fingerprint and shared by all the
+    ansible-connection processes of the controller, a file lock serializes writers.
+    '''
+
+    def __init__(self, cache_dir, ttl=300):
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.ttl = ttl
+
+    def _entry_path(self, host, fingerprint):
+        digest = hashlib.sha256(to_bytes('%s|%s' % (host, fingerprint))).hexdigest()
+        return os.path.join(self.cache_dir, 'fortios_system_%s.json' % (digest[:32]))
+
+    def _read(self, path):
+        try:
+            with open(path, 'r') as f:
+                fcntl.flock(f, fcntl.LOCK_SH)
+                try:
+                    return json.load(f)
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def get(self, host, fingerprint):
+        entry = self._read(self._entry_path(host, fingerprint))
+        if not entry or entry.get('expires_at', 0) < time.time():
+            return None
+        return entry
+
+    def update(self, host, fingerprint, **values):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+        path = self._entry_path(host, fingerprint)
+        with open(path + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                entry = self.get(host, fingerprint) or dict()
+                entry.update(values)
+                entry['host'] = host
+                entry['expires_at'] = time.time() + self.ttl
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.fortios_system_')
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entry, f)
+                os.rename(tmp_path, path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+        return entry
+
+    def invalidate(self, host, fingerprint):
+        try:
+            os.remove(self._entry_path(host, fingerprint))
+        except OSError:
+            pass
@@ -0,0 +1,166 @@
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import json
+import os
+import threading
+import time
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse, parse_qs
+
+# upper bounds of the latency histogram buckets in milliseconds, the last bucket is unbounded.
+LATENCY_BUCKETS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+def normalize_url_template(url):
+    '''
+    Reduce a request url to its endpoint template, object keys of CMDB urls are replaced by {mkey}
+    and the query string, which may carry the access token, is dropped.
+    e.g. /api/v2/cmdb/firewall/addrgrp/grp1/member/addr1?vdom=root -> /api/v2/cmdb/firewall/addrgrp/{mkey}/member/{mkey}
+    '''
+    path = urlparse(url).path
+    segments = path.split('/')
+    # ['', 'api', 'v2', 'cmdb', <path>, <name>, <mkey>, <child>, <mkey>, ...]
+    if len(segments) > 6 and segments[3] == 'cmdb':
+        for index in range(6, len(segments), 2):
+            segments[index] = '{mkey}'
+    return '/'.join(segments)
+
+
+def extract_vdom(url):
+    query = parse_qs(urlparse(url).query)
+    if query.get('global') == ['1']:
+        return 'global'
+    vdoms = query.get('vdom')
+    return vdoms[0] if vdoms else None
+
+
+class LatencyHistogram(object):
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = None
+
+    def observe(self, latency_ms):
+        index = 0
+        while index < len(LATENCY_BUCKETS) and latency_ms > LATENCY_BUCKETS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.min_ms = latency_ms if self.min_ms is None else min(self.min_ms, latency_ms)
+        self.max_ms = latency_ms if self.max_ms is None else max(self.max_ms, latency_ms)
+
+    def to_dict(self):
+        bounds = ['le_%d' % (bound) for bound in LATENCY_BUCKETS] + ['le_inf']
+        return {
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'min_ms': self.min_ms,
+            'max_ms': self.max_ms,
+            'buckets': dict(zip(bounds, self.buckets)),
+        }
+
+
+class JSONLinesSink(object):
+    '''Append every trace record as one JSON line to a file.'''
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        line = json.dumps(record, sort_keys=True) + '\n'
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(line)
+
+
+def load_sink(spec):
+    '''
+    Instantiate a custom sink from a "package.module.attribute" path, the attribute is
+    either a class with a write(record) method or a function called with the record.
+    '''
+    module_name, dummy, attribute = spec.rpartition('.')
+    if not module_name:
+        raise ValueError('Invalid trace sink %s, expecting package.module.attribute' % (spec))
+    target = getattr(importlib.import_module(module_name), attribute)
+    if isinstance(target, type):
+        return target()
+
+    class CallableSink(object):
+        def write(self, record):
+            target(record)
+    return CallableSink()
+
+
+class TraceRecorder(object):
+    '''
+    Collect one structured record per REST API request and aggregate per endpoint latency histograms.
+    A failing sink never fails the request, its error is counted as sink_errors and passed to log.
+    '''
+
+    def __init__(self, sinks=None, log=None):
+        self.sinks = sinks or list()
+        self.histograms = dict()
+        self.counters = dict()
+        self._log = log
+        self._lock = threading.Lock()
+
+    def increase(self, counter, step=1):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + step
+
+    def _write(self, record):
+        for sink in self.sinks:
+            try:
+                sink.write(record)
+            except Exception as err:
+                self.increase('sink_errors')
+                if self._log:
+                    self._log('trace sink %s failed: %s' % (type(sink).__name__, err))
+
+    def record(self, method, url, status, total_ms, **fields):
+        template = normalize_url_template(url)
+        record = {
+            'timestamp': time.time(),
+            'method': method,
+            'url_template': template,
+            'vdom': extract_vdom(url),
+            'status': status,
+            'total_ms': round(total_ms, 3),
+        }
+        record.update(fields)
+        with self._lock:
+            key = '%s %s' % (method, template)
+            if key not in self.histograms:
+                self.histograms[key] = LatencyHistogram()
+            self.histograms[key].observe(total_ms)
+        self._write(record)
+        return record
+
+    def get_stats(self):
+        with self._lock:
+            endpoints = dict((key, histogram.to_dict()) for key, histogram in self.histograms.items())
+            counters = dict(self.counters)
+        return {'endpoints': endpoints, 'counters': counters}
+
+    def flush(self):
+        '''emit the aggregated histograms to the sinks as a summary record.'''
+        summary = self.get_stats()
+        summary['timestamp'] = time.time()
+        summary['type'] = 'summary'
+        self._write(summary)
+        return summary
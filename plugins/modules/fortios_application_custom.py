@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -291,7 +306,13 @@ def application_custom(data, fos, check_mode=False):
             "after": filtered_data,
         }
         mkey = fos.get_mkey("application", "custom", filtered_data, vdom=vdom)
-        current_data = fos.get("application", "custom", vdom=vdom, mkey=mkey)
+        current_data = fos.get(
+            "application",
+            "custom",
+            vdom=vdom,
+            mkey=mkey,
+            parameters=fos.field_projection(filtered_data),
+        )
         is_existed = (
             current_data
             and current_data.get("http_status") == 200
@@ -414,6 +435,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -0,0 +1,446 @@
+#!/usr/bin/python
+from __future__ import absolute_import, division, print_function
+
+# Copyright: (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "status": ["preview"],
+    "supported_by": "community",
+    "metadata_version": "1.1",
+}
+
+DOCUMENTATION = """
+---
+module: fortios_configuration_bulk
+short_description: Reconcile many objects of one FortiOS configuration table in a single task.
+description:
+    - This module manages a list of objects of one CMDB table of a FortiGate or FortiOS (FOS) device.
+      The table is fetched once, every desired object is compared with its current state locally and
+      only the objects which differ are created, updated or deleted, concurrently.
+    - With the overridden state the given objects become the whole table, every other object of the table
+      is deleted, the objects still referenced after their referrers.
+    - Use it instead of looping over a per-object module when thousands of objects are managed.
+version_added: "2.4.0"
+author:
+    - Jie Xue (@JieX19)
+    - Link Zheng (@chillancezen)
+    - Hongbin Lu (@fgtdev-hblu)
+    - Frank Shen (@fshen01)
+notes:
+    - Different selectors can not be used in one task, use one task per table.
+    - The desired objects accept the same attributes as the per-object module of the table,
+      e.g. fortinet.fortios.fortios_firewall_address for the firewall_address selector.
+    - The objects are free-form, so their attributes are not declared no_log as in the per-object modules.
+      The attributes known to hold secrets (password, psksecret, private_key...) are declared no_log
+      from the objects given to the task, the values of other sensitive attributes are not masked.
+    - The attributes of the objects are not validated against the schema of the table nor the FortiOS version,
+      an unknown or misspelled attribute is sent to the device as is.
+requirements:
+    - ansible>=2.15
+options:
+    access_token:
+        description:
+            - Token-based authentication.
+              Generated from GUI of Fortigate.
+        type: str
+        required: false
+    enable_log:
+        description:
+            - Enable/Disable logging for task.
+        type: bool
+        required: false
+        default: false
+    vdom:
+        description:
+            - Virtual domain, among those defined previously. A vdom is a
+              virtual instance of the FortiGate that can be configured and
+              used as a different unit.
+        type: str
+        default: root
+    selector:
+        description:
+            - Selector of the table, e.g. firewall_address or firewall.service_custom.
+        type: str
+        required: true
+    mkey:
+        description:
+            - Name of the master key attribute of the table, e.g. name or policyid.
+            - It is read from the table schema of the device if not given.
+        type: str
+        required: false
+    state:
+        description:
+            - Indicates whether the objects are created/updated or deleted.
+            - overridden creates/updates the objects and deletes the other objects of the table. The objects
+              to delete are removed in rounds, each round deletes the objects no longer referenced according
+              to their reference count, so that an object is deleted after the objects which refer to it.
+              Nothing is deleted if a create or update failed.
+        type: str
+        required: true
+        choices:
+            - present
+            - absent
+            - overridden
+    objects:
+        description:
+            - The desired objects of the table, every object must carry its master key.
+            - Only the values of the attributes known to hold secrets are masked, and the attributes are not
+              validated, see the notes.
+        type: list
+        elements: dict
+        required: true
+    page_size:
+        description:
+            - Number of objects fetched per request when the current table is read.
+        type: int
+        required: false
+        default: 1000
+"""
+
+EXAMPLES = """
+- name: Reconcile firewall addresses
+  fortinet.fortios.fortios_configuration_bulk:
+      vdom: "root"
+      selector: "firewall_address"
+      state: "present"
+      objects:
+          - name: "web-1"
+            subnet: "10.0.1.10 255.255.255.255"
+            comment: "web server"
+          - name: "web-2"
+            subnet: "10.0.1.11 255.255.255.255"
+
+- name: Make the firewall address groups exactly the given ones
+  fortinet.fortios.fortios_configuration_bulk:
+      vdom: "root"
+      selector: "firewall_addrgrp"
+      state: "overridden"
+      objects:
+          - name: "web-servers"
+            member:
+                - name: "web-1"
+                - name: "web-2"
+
+- name: Delete firewall addresses
+  fortinet.fortios.fortios_configuration_bulk:
+      vdom: "root"
+      selector: "firewall_address"
+      state: "absent"
+      objects:
+          - name: "web-1"
+          - name: "web-2"
+"""
+
+RETURN = """
+meta:
+  description: Outcome of every desired object and a summary of the run.
+  returned: always
+  type: dict
+  contains:
+    results:
+      description: One outcome per desired object in the given order, with mkey, action (create, update, delete or none),
+        changed, and the http_status and status of the write request if one was sent. With the overridden state
+        the outcomes of the deleted objects follow in the order they were deleted.
+      returned: always
+      type: list
+      elements: dict
+    summary:
+      description: Number of objects per action and number of failed writes.
+      returned: always
+      type: dict
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import _load_params
+from ansible.module_utils.connection import Connection
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import (
+    FortiOSHandler,
+)
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import (
+    check_legacy_fortiosapi,
+)
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import (
+    FAIL_SOCKET_MSG,
+)
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.data_post_processor import (
+    remove_invalid_fields,
+)
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import (
+    is_same_value,
+)
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import (
+    serialize,
+)
+from ansible_collections.fortinet.fortios.plugins.module_utils.common.type_utils import (
+    underscore_to_hyphen,
+)
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.secret_field import (
+    is_secret_field,
+)
+
+
+def is_successful_status(resp):
+    return (
+        "status" in resp
+        and resp["status"] == "success"
+        or "http_status" in resp
+        and resp["http_status"] == 200
+        or "http_method" in resp
+        and resp["http_method"] == "DELETE"
+        and resp["http_status"] == 404
+    )
+
+
+def attributes_spec(members):
+    """
+    The argument spec options of free-form objects, built from the attributes they carry so that
+    the secret ones, nested ones included, are no_log before the module logs its invocation.
+    """
+    values = dict()
+    for member in members:
+        for key, value in member.items():
+            values.setdefault(key, []).append(value)
+    options = dict()
+    for key, key_values in values.items():
+        present = [value for value in key_values if value is not None]
+        spec = {"required": False, "type": "raw"}
+        if is_secret_field(key.replace("-", "_")):
+            spec["no_log"] = True
+        elif present and all(isinstance(value, dict) for value in present):
+            spec = {"required": False, "type": "dict", "options": attributes_spec(present)}
+        elif any(present) and all(
+            isinstance(value, list) and all(isinstance(elem, dict) for elem in value)
+            for value in present
+        ):
+            spec = {
+                "required": False,
+                "type": "list",
+                "elements": "dict",
+                "options": attributes_spec([elem for value in present for elem in value]),
+            }
+        options[key] = spec
+    return options
+
+
+def get_table_mkey(path, name, vdom, fos):
+    schema = fos.schema(path, name, vdom=vdom)
+    if not isinstance(schema, dict) or not schema.get("mkey"):
+        fos._module.fail_json(
+            msg="Unable to find the master key of %s %s, please specify mkey" % (path, name),
+            meta=schema,
+        )
+    return schema["mkey"]
+
+
+def get_current_objects(path, name, vdom, mkey_name, page_size, fos):
+    current_objects = dict()
+    for current_object in fos.iter_table(path, name, vdom=vdom, page_size=page_size):
+        current_objects[str(current_object.get(mkey_name))] = current_object
+    return current_objects
+
+
+def plan_object(desired_object, state, path, name, vdom, mkey_name, current_objects, fos):
+    converted_data = underscore_to_hyphen(remove_invalid_fields(desired_object))
+    mkey = converted_data.get(mkey_name)
+    outcome = {"mkey": mkey, "action": "none", "changed": False}
+    if mkey is None:
+        outcome["failed"] = True
+        outcome["msg"] = "missing master key %s" % (mkey_name)
+        return outcome, None
+
+    current_object = current_objects.get(str(mkey))
+    request = None
+    if state in ["present", "overridden"]:
+        if current_object is None:
+            outcome["action"] = "create"
+            request = {
+                "url": fos.cmdb_url(path, name, vdom),
+                "method": "POST",
+                "data": converted_data,
+                "vdom": vdom,
+            }
+        elif not is_same_value(serialize(current_object), serialize(converted_data)):
+            outcome["action"] = "update"
+            request = {
+                "url": fos.cmdb_url(path, name, vdom, mkey=mkey),
+                "method": "PUT",
+                "data": converted_data,
+                "vdom": vdom,
+            }
+    elif current_object is not None:
+        outcome["action"] = "delete"
+        request = {
+            "url": fos.cmdb_url(path, name, vdom, mkey=mkey),
+            "method": "DELETE",
+            "vdom": vdom,
+        }
+    outcome["changed"] = request is not None
+    return outcome, request
+
+
+def record_response(outcome, resp):
+    outcome["http_status"] = resp.get("http_status")
+    outcome["status"] = resp.get("status")
+    if not is_successful_status(resp):
+        outcome["failed"] = True
+        outcome["changed"] = False
+        outcome["meta"] = resp
+
+
+def purge_stale_objects(
+    path, name, vdom, mkey_name, page_size, current_objects, outcomes, fos, check_mode
+):
+    desired_keys = set(str(outcome["mkey"]) for outcome in outcomes)
+    stale_keys = [key for key in current_objects if key not in desired_keys]
+    stale_outcomes = dict(
+        (
+            key,
+            {
+                "mkey": current_objects[key].get(mkey_name),
+                "action": "delete",
+                "changed": True,
+            },
+        )
+        for key in stale_keys
+    )
+    if not stale_keys or check_mode:
+        return [stale_outcomes[key] for key in stale_keys]
+    if any(outcome.get("failed") for outcome in outcomes):
+        # the other objects may still refer to the stale ones.
+        for outcome in stale_outcomes.values():
+            outcome["changed"] = False
+            outcome["msg"] = "not deleted, the desired objects failed to be written"
+        return [stale_outcomes[key] for key in stale_keys]
+
+    responses = fos.purge(
+        path,
+        name,
+        mkey_name,
+        [stale_outcomes[key]["mkey"] for key in stale_keys],
+        vdom=vdom,
+        page_size=page_size,
+    )
+    purged = list()
+    for key, resp in responses.items():
+        record_response(stale_outcomes[key], resp)
+        purged.append(stale_outcomes[key])
+    for key in stale_keys:
+        if key not in responses:
+            # deleted meanwhile by someone else.
+            stale_outcomes[key]["action"] = "none"
+            stale_outcomes[key]["changed"] = False
+            purged.append(stale_outcomes[key])
+    return purged
+
+
+def fortios_configuration_bulk(params, fos, check_mode=False):
+    vdom = params["vdom"]
+    selector = params["selector"]
+    if selector.count("_") != 1:
+        fos._module.fail_json(msg="Invalid selector %s, expecting <path>_<name>" % (selector))
+    [path, name] = selector.split("_")
+    if params["mkey"]:
+        mkey_name = params["mkey"].replace("_", "-")
+    else:
+        mkey_name = get_table_mkey(path, name, vdom, fos)
+    page_size = params["page_size"]
+    if page_size < 1:
+        fos._module.fail_json(msg="page_size must be a positive integer")
+
+    current_objects = get_current_objects(path, name, vdom, mkey_name, page_size, fos)
+
+    outcomes = list()
+    requests = list()
+    pending_outcomes = list()
+    for desired_object in params["objects"]:
+        outcome, request = plan_object(
+            desired_object, params["state"], path, name, vdom, mkey_name, current_objects, fos
+        )
+        outcomes.append(outcome)
+        if request:
+            requests.append(request)
+            pending_outcomes.append(outcome)
+
+    if requests and not check_mode:
+        for outcome, resp in zip(pending_outcomes, fos.send_requests(requests)):
+            record_response(outcome, resp)
+
+    if params["state"] == "overridden":
+        outcomes.extend(
+            purge_stale_objects(
+                path, name, vdom, mkey_name, page_size, current_objects, outcomes, fos, check_mode
+            )
+        )
+
+    summary = {"create": 0, "update": 0, "delete": 0, "none": 0, "failed": 0}
+    for outcome in outcomes:
+        summary[outcome["action"]] += 1
+        if outcome.get("failed"):
+            summary["failed"] += 1
+
+    is_error = summary["failed"] > 0
+    has_changed = any(outcome["changed"] for outcome in outcomes)
+    return is_error, has_changed, {"results": outcomes, "summary": summary}
+
+
+def main():
+    fields = {
+        "access_token": {"required": False, "type": "str", "no_log": True},
+        "enable_log": {"required": False, "type": "bool", "default": False},
+        "vdom": {"required": False, "type": "str", "default": "root"},
+        "selector": {"required": True, "type": "str"},
+        "mkey": {"required": False, "type": "str"},
+        "state": {
+            "required": True,
+            "type": "str",
+            "choices": ["present", "absent", "overridden"],
+        },
+        "objects": {"required": True, "type": "list", "elements": "dict"},
+        "page_size": {"required": False, "type": "int", "default": 1000},
+    }
+    desired_objects = _load_params().get("objects")
+    if isinstance(desired_objects, list) and all(
+        isinstance(desired_object, dict) for desired_object in desired_objects
+    ):
+        fields["objects"]["options"] = attributes_spec(desired_objects)
+
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
+    check_legacy_fortiosapi(module)
+
+    is_error = False
+    has_changed = False
+    result = None
+
+    if module._socket_path:
+        connection = Connection(module._socket_path)
+        if "access_token" in module.params:
+            connection.set_option("access_token", module.params["access_token"])
+
+        if "enable_log" in module.params:
+            connection.set_option("enable_log", module.params["enable_log"])
+        else:
+            connection.set_option("enable_log", False)
+        fos = FortiOSHandler(connection, module)
+
+        is_error, has_changed, result = fortios_configuration_bulk(
+            module.params, fos, module.check_mode
+        )
+    else:
+        module.fail_json(**FAIL_SOCKET_MSG)
+
+    if not is_error:
+        module.exit_json(changed=has_changed, meta=result)
+    else:
+        module.fail_json(msg="Error in repo", meta=result)
+
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -491,7 +506,7 @@ def valid_attr_to_invalid_attrs(data):
     return data
 
 
-def dlp_profile(data, fos):
+def dlp_profile(data, fos, check_mode=False):
     vdom = data["vdom"]
 
     state = data["state"]
@@ -501,6 +516,12 @@ def dlp_profile(data, fos):
     filtered_data = filter_dlp_profile_data(dlp_profile_data)
     converted_data = underscore_to_hyphen(valid_attr_to_invalid_attrs(filtered_data))
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "dlp", "profile", converted_data, vdom=vdom, state=state
+        )
+
     if state == "present" or state is True:
         return fos.set("dlp", "profile", data=converted_data, vdom=vdom)
 
@@ -522,13 +543,14 @@ def is_successful_status(resp):
     )
 
 
-def fortios_dlp(data, fos):
+def fortios_dlp(data, fos, check_mode):
     fos.do_member_operation("dlp", "profile")
     if data["dlp_profile"]:
-        resp = dlp_profile(data, fos)
+        resp = dlp_profile(data, fos, check_mode)
     else:
         fos._module.fail_json(msg="missing task body: %s" % ("dlp_profile"))
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -720,6 +742,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -742,7 +766,7 @@ def main():
         if mkeyname and mkeyname == attribute_name:
             fields["dlp_profile"]["options"][attribute_name]["required"] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -765,7 +789,9 @@ def main():
             fos, versioned_schema, "dlp_profile"
         )
 
-        is_error, has_changed, result, diff = fortios_dlp(module.params, fos)
+        is_error, has_changed, result, diff = fortios_dlp(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -312,7 +327,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def endpoint_control_settings(data, fos):
+def endpoint_control_settings(data, fos, check_mode=False):
     vdom = data["vdom"]
     endpoint_control_settings_data = data["endpoint_control_settings"]
     filtered_data = filter_endpoint_control_settings_data(
@@ -320,6 +335,12 @@ def endpoint_control_settings(data, fos):
     )
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "endpoint-control", "settings", converted_data, vdom=vdom
+        )
+
     return fos.set("endpoint-control", "settings", data=converted_data, vdom=vdom)
 
 
@@ -335,15 +356,16 @@ def is_successful_status(resp):
     )
 
 
-def fortios_endpoint_control(data, fos):
+def fortios_endpoint_control(data, fos, check_mode):
     fos.do_member_operation("endpoint-control", "settings")
     if data["endpoint_control_settings"]:
-        resp = endpoint_control_settings(data, fos)
+        resp = endpoint_control_settings(data, fos, check_mode)
     else:
         fos._module.fail_json(
             msg="missing task body: %s" % ("endpoint_control_settings")
         )
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -432,6 +454,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -455,7 +479,7 @@ def main():
                 "required"
             ] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -479,7 +503,7 @@ def main():
         )
 
         is_error, has_changed, result, diff = fortios_endpoint_control(
-            module.params, fos
+            module.params, fos, module.check_mode
         )
 
     else:
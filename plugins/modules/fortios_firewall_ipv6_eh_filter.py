@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -293,7 +308,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def firewall_ipv6_eh_filter(data, fos):
+def firewall_ipv6_eh_filter(data, fos, check_mode=False):
     vdom = data["vdom"]
     firewall_ipv6_eh_filter_data = data["firewall_ipv6_eh_filter"]
     firewall_ipv6_eh_filter_data = flatten_multilists_attributes(
@@ -302,6 +317,12 @@ def firewall_ipv6_eh_filter(data, fos):
     filtered_data = filter_firewall_ipv6_eh_filter_data(firewall_ipv6_eh_filter_data)
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "firewall", "ipv6-eh-filter", converted_data, vdom=vdom
+        )
+
     return fos.set("firewall", "ipv6-eh-filter", data=converted_data, vdom=vdom)
 
 
@@ -317,13 +338,14 @@ def is_successful_status(resp):
     )
 
 
-def fortios_firewall(data, fos):
+def fortios_firewall(data, fos, check_mode):
     fos.do_member_operation("firewall", "ipv6-eh-filter")
     if data["firewall_ipv6_eh_filter"]:
-        resp = firewall_ipv6_eh_filter(data, fos)
+        resp = firewall_ipv6_eh_filter(data, fos, check_mode)
     else:
         fos._module.fail_json(msg="missing task body: %s" % ("firewall_ipv6_eh_filter"))
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -389,6 +411,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -412,7 +436,7 @@ def main():
                 "required"
             ] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -435,7 +459,9 @@ def main():
             fos, versioned_schema, "firewall_ipv6_eh_filter"
         )
 
-        is_error, has_changed, result, diff = fortios_firewall(module.params, fos)
+        is_error, has_changed, result, diff = fortios_firewall(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
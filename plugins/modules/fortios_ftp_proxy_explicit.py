@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -345,7 +360,7 @@ def remap_attribute_names(data):
     return data
 
 
-def ftp_proxy_explicit(data, fos):
+def ftp_proxy_explicit(data, fos, check_mode=False):
     vdom = data["vdom"]
     ftp_proxy_explicit_data = data["ftp_proxy_explicit"]
     ftp_proxy_explicit_data = flatten_multilists_attributes(ftp_proxy_explicit_data)
@@ -353,6 +368,10 @@ def ftp_proxy_explicit(data, fos):
     converted_data = underscore_to_hyphen(filtered_data)
     converted_data = remap_attribute_names(converted_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot("ftp-proxy", "explicit", converted_data, vdom=vdom)
+
     return fos.set("ftp-proxy", "explicit", data=converted_data, vdom=vdom)
 
 
@@ -368,13 +387,14 @@ def is_successful_status(resp):
     )
 
 
-def fortios_ftp_proxy(data, fos):
+def fortios_ftp_proxy(data, fos, check_mode):
     fos.do_member_operation("ftp-proxy", "explicit")
     if data["ftp_proxy_explicit"]:
-        resp = ftp_proxy_explicit(data, fos)
+        resp = ftp_proxy_explicit(data, fos, check_mode)
     else:
         fos._module.fail_json(msg="missing task body: %s" % ("ftp_proxy_explicit"))
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -454,6 +474,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -475,7 +497,7 @@ def main():
         if mkeyname and mkeyname == attribute_name:
             fields["ftp_proxy_explicit"]["options"][attribute_name]["required"] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -498,7 +520,9 @@ def main():
             fos, versioned_schema, "ftp_proxy_explicit"
         )
 
-        is_error, has_changed, result, diff = fortios_ftp_proxy(module.params, fos)
+        is_error, has_changed, result, diff = fortios_ftp_proxy(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -272,7 +287,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def gtp_rat_timeout_profile(data, fos):
+def gtp_rat_timeout_profile(data, fos, check_mode=False):
     vdom = data["vdom"]
 
     state = data["state"]
@@ -281,6 +296,12 @@ def gtp_rat_timeout_profile(data, fos):
     filtered_data = filter_gtp_rat_timeout_profile_data(gtp_rat_timeout_profile_data)
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "gtp", "rat-timeout-profile", converted_data, vdom=vdom, state=state
+        )
+
     if state == "present" or state is True:
         return fos.set("gtp", "rat-timeout-profile", data=converted_data, vdom=vdom)
 
@@ -304,13 +325,14 @@ def is_successful_status(resp):
     )
 
 
-def fortios_gtp(data, fos):
+def fortios_gtp(data, fos, check_mode):
     fos.do_member_operation("gtp", "rat-timeout-profile")
     if data["gtp_rat_timeout_profile"]:
-        resp = gtp_rat_timeout_profile(data, fos)
+        resp = gtp_rat_timeout_profile(data, fos, check_mode)
     else:
         fos._module.fail_json(msg="missing task body: %s" % ("gtp_rat_timeout_profile"))
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -380,6 +402,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -404,7 +428,7 @@ def main():
                 "required"
             ] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -427,7 +451,9 @@ def main():
             fos, versioned_schema, "gtp_rat_timeout_profile"
         )
 
-        is_error, has_changed, result, diff = fortios_gtp(module.params, fos)
+        is_error, has_changed, result, diff = fortios_gtp(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -218,7 +233,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def log_tacacsplusaccounting3_filter(data, fos):
+def log_tacacsplusaccounting3_filter(data, fos, check_mode=False):
     vdom = data["vdom"]
     log_tacacsplusaccounting3_filter_data = data["log_tacacsplusaccounting3_filter"]
     filtered_data = filter_log_tacacsplusaccounting3_filter_data(
@@ -226,6 +241,12 @@ def log_tacacsplusaccounting3_filter(data, fos):
     )
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "log.tacacs+accounting3", "filter", converted_data, vdom=vdom
+        )
+
     return fos.set("log.tacacs+accounting3", "filter", data=converted_data, vdom=vdom)
 
 
@@ -241,15 +262,16 @@ def is_successful_status(resp):
     )
 
 
-def fortios_log_tacacsplusaccounting3(data, fos):
+def fortios_log_tacacsplusaccounting3(data, fos, check_mode):
     fos.do_member_operation("log.tacacs+accounting3", "filter")
     if data["log_tacacsplusaccounting3_filter"]:
-        resp = log_tacacsplusaccounting3_filter(data, fos)
+        resp = log_tacacsplusaccounting3_filter(data, fos, check_mode)
     else:
         fos._module.fail_json(
             msg="missing task body: %s" % ("log_tacacsplusaccounting3_filter")
         )
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -288,6 +310,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -311,7 +335,7 @@ def main():
                 "required"
             ] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -335,7 +359,7 @@ def main():
         )
 
         is_error, has_changed, result, diff = fortios_log_tacacsplusaccounting3(
-            module.params, fos
+            module.params, fos, module.check_mode
         )
 
     else:
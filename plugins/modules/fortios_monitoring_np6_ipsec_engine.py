@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -243,7 +258,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def monitoring_np6_ipsec_engine(data, fos):
+def monitoring_np6_ipsec_engine(data, fos, check_mode=False):
     vdom = data["vdom"]
     monitoring_np6_ipsec_engine_data = data["monitoring_np6_ipsec_engine"]
     monitoring_np6_ipsec_engine_data = flatten_multilists_attributes(
@@ -254,6 +269,12 @@ def monitoring_np6_ipsec_engine(data, fos):
     )
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "monitoring", "np6-ipsec-engine", converted_data, vdom=vdom
+        )
+
     return fos.set("monitoring", "np6-ipsec-engine", data=converted_data, vdom=vdom)
 
 
@@ -269,15 +290,16 @@ def is_successful_status(resp):
     )
 
 
-def fortios_monitoring(data, fos):
+def fortios_monitoring(data, fos, check_mode):
     fos.do_member_operation("monitoring", "np6-ipsec-engine")
     if data["monitoring_np6_ipsec_engine"]:
-        resp = monitoring_np6_ipsec_engine(data, fos)
+        resp = monitoring_np6_ipsec_engine(data, fos, check_mode)
     else:
         fos._module.fail_json(
             msg="missing task body: %s" % ("monitoring_np6_ipsec_engine")
         )
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -316,6 +338,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -339,7 +363,7 @@ def main():
                 "required"
             ] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -362,7 +386,9 @@ def main():
             fos, versioned_schema, "monitoring_np6_ipsec_engine"
         )
 
-        is_error, has_changed, result, diff = fortios_monitoring(module.params, fos)
+        is_error, has_changed, result, diff = fortios_monitoring(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
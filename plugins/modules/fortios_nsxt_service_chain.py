@@ -54,6 +54,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -246,7 +261,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def nsxt_service_chain(data, fos):
+def nsxt_service_chain(data, fos, check_mode=False):
     vdom = data["vdom"]
 
     state = data["state"]
@@ -255,6 +270,12 @@ def nsxt_service_chain(data, fos):
     filtered_data = filter_nsxt_service_chain_data(nsxt_service_chain_data)
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "nsxt", "service-chain", converted_data, vdom=vdom, state=state
+        )
+
     if state == "present" or state is True:
         return fos.set("nsxt", "service-chain", data=converted_data, vdom=vdom)
 
@@ -276,13 +297,14 @@ def is_successful_status(resp):
     )
 
 
-def fortios_nsxt(data, fos):
+def fortios_nsxt(data, fos, check_mode):
     fos.do_member_operation("nsxt", "service-chain")
     if data["nsxt_service_chain"]:
-        resp = nsxt_service_chain(data, fos)
+        resp = nsxt_service_chain(data, fos, check_mode)
     else:
         fos._module.fail_json(msg="missing task body: %s" % ("nsxt_service_chain"))
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -356,6 +378,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -378,7 +402,7 @@ def main():
         if mkeyname and mkeyname == attribute_name:
             fields["nsxt_service_chain"]["options"][attribute_name]["required"] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -401,7 +425,9 @@ def main():
             fos, versioned_schema, "nsxt_service_chain"
         )
 
-        is_error, has_changed, result, diff = fortios_nsxt(module.params, fos)
+        is_error, has_changed, result, diff = fortios_nsxt(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -248,7 +263,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def sctp_filter_profile(data, fos):
+def sctp_filter_profile(data, fos, check_mode=False):
     vdom = data["vdom"]
 
     state = data["state"]
@@ -257,6 +272,12 @@ def sctp_filter_profile(data, fos):
     filtered_data = filter_sctp_filter_profile_data(sctp_filter_profile_data)
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "sctp-filter", "profile", converted_data, vdom=vdom, state=state
+        )
+
     if state == "present" or state is True:
         return fos.set("sctp-filter", "profile", data=converted_data, vdom=vdom)
 
@@ -280,13 +301,14 @@ def is_successful_status(resp):
     )
 
 
-def fortios_sctp_filter(data, fos):
+def fortios_sctp_filter(data, fos, check_mode):
     fos.do_member_operation("sctp-filter", "profile")
     if data["sctp_filter_profile"]:
-        resp = sctp_filter_profile(data, fos)
+        resp = sctp_filter_profile(data, fos, check_mode)
     else:
         fos._module.fail_json(msg="missing task body: %s" % ("sctp_filter_profile"))
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -336,6 +358,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -358,7 +382,7 @@ def main():
         if mkeyname and mkeyname == attribute_name:
             fields["sctp_filter_profile"]["options"][attribute_name]["required"] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -381,7 +405,9 @@ def main():
             fos, versioned_schema, "sctp_filter_profile"
         )
 
-        is_error, has_changed, result, diff = fortios_sctp_filter(module.params, fos)
+        is_error, has_changed, result, diff = fortios_sctp_filter(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -301,7 +316,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def switch_controller_fortilink_settings(data, fos):
+def switch_controller_fortilink_settings(data, fos, check_mode=False):
     vdom = data["vdom"]
 
     state = data["state"]
@@ -314,6 +329,16 @@ def switch_controller_fortilink_settings(data, fos):
     )
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "switch-controller",
+            "fortilink-settings",
+            converted_data,
+            vdom=vdom,
+            state=state,
+        )
+
     if state == "present" or state is True:
         return fos.set(
             "switch-controller", "fortilink-settings", data=converted_data, vdom=vdom
@@ -342,15 +367,16 @@ def is_successful_status(resp):
     )
 
 
-def fortios_switch_controller(data, fos):
+def fortios_switch_controller(data, fos, check_mode):
     fos.do_member_operation("switch-controller", "fortilink-settings")
     if data["switch_controller_fortilink_settings"]:
-        resp = switch_controller_fortilink_settings(data, fos)
+        resp = switch_controller_fortilink_settings(data, fos, check_mode)
     else:
         fos._module.fail_json(
             msg="missing task body: %s" % ("switch_controller_fortilink_settings")
         )
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -430,6 +456,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -454,7 +482,7 @@ def main():
                 "required"
             ] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -478,7 +506,7 @@ def main():
         )
 
         is_error, has_changed, result, diff = fortios_switch_controller(
-            module.params, fos
+            module.params, fos, module.check_mode
         )
 
     else:
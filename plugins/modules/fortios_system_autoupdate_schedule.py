@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -230,7 +245,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def system_autoupdate_schedule(data, fos):
+def system_autoupdate_schedule(data, fos, check_mode=False):
     vdom = data["vdom"]
     system_autoupdate_schedule_data = data["system_autoupdate_schedule"]
     filtered_data = filter_system_autoupdate_schedule_data(
@@ -238,6 +253,12 @@ def system_autoupdate_schedule(data, fos):
     )
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "system.autoupdate", "schedule", converted_data, vdom=vdom
+        )
+
     return fos.set("system.autoupdate", "schedule", data=converted_data, vdom=vdom)
 
 
@@ -253,15 +274,16 @@ def is_successful_status(resp):
     )
 
 
-def fortios_system_autoupdate(data, fos):
+def fortios_system_autoupdate(data, fos, check_mode):
     fos.do_member_operation("system.autoupdate", "schedule")
     if data["system_autoupdate_schedule"]:
-        resp = system_autoupdate_schedule(data, fos)
+        resp = system_autoupdate_schedule(data, fos, check_mode)
     else:
         fos._module.fail_json(
             msg="missing task body: %s" % ("system_autoupdate_schedule")
         )
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -314,6 +336,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -337,7 +361,7 @@ def main():
                 "required"
             ] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -361,7 +385,7 @@ def main():
         )
 
         is_error, has_changed, result, diff = fortios_system_autoupdate(
-            module.params, fos
+            module.params, fos, module.check_mode
         )
 
     else:
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -225,12 +240,18 @@ def valid_attr_to_invalid_attrs(data):
     return data
 
 
-def system_performance_top(data, fos):
+def system_performance_top(data, fos, check_mode=False):
     vdom = data["vdom"]
     system_performance_top_data = data["system_performance_top"]
     filtered_data = filter_system_performance_top_data(system_performance_top_data)
     converted_data = underscore_to_hyphen(valid_attr_to_invalid_attrs(filtered_data))
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "system.performance", "top", converted_data, vdom=vdom
+        )
+
     return fos.set("system.performance", "top", data=converted_data, vdom=vdom)
 
 
@@ -246,13 +267,14 @@ def is_successful_status(resp):
     )
 
 
-def fortios_system_performance(data, fos):
+def fortios_system_performance(data, fos, check_mode):
     fos.do_member_operation("system.performance", "top")
     if data["system_performance_top"]:
-        resp = system_performance_top(data, fos)
+        resp = system_performance_top(data, fos, check_mode)
     else:
         fos._module.fail_json(msg="missing task body: %s" % ("system_performance_top"))
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -284,6 +306,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -307,7 +331,7 @@ def main():
                 "required"
             ] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -331,7 +355,7 @@ def main():
         )
 
         is_error, has_changed, result, diff = fortios_system_performance(
-            module.params, fos
+            module.params, fos, module.check_mode
         )
 
     else:
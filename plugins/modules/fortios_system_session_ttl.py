@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -242,12 +257,16 @@ def underscore_to_hyphen(data):
     return data
 
 
-def system_session_ttl(data, fos):
+def system_session_ttl(data, fos, check_mode=False):
     vdom = data["vdom"]
     system_session_ttl_data = data["system_session_ttl"]
     filtered_data = filter_system_session_ttl_data(system_session_ttl_data)
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot("system", "session-ttl", converted_data, vdom=vdom)
+
     return fos.set("system", "session-ttl", data=converted_data, vdom=vdom)
 
 
@@ -263,13 +282,14 @@ def is_successful_status(resp):
     )
 
 
-def fortios_system(data, fos):
+def fortios_system(data, fos, check_mode):
     fos.do_member_operation("system", "session-ttl")
     if data["system_session_ttl"]:
-        resp = system_session_ttl(data, fos)
+        resp = system_session_ttl(data, fos, check_mode)
     else:
         fos._module.fail_json(msg="missing task body: %s" % ("system_session_ttl"))
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -319,6 +339,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -340,7 +362,7 @@ def main():
         if mkeyname and mkeyname == attribute_name:
             fields["system_session_ttl"]["options"][attribute_name]["required"] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -363,7 +385,9 @@ def main():
             fos, versioned_schema, "system_session_ttl"
         )
 
-        is_error, has_changed, result, diff = fortios_system(module.params, fos)
+        is_error, has_changed, result, diff = fortios_system(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -299,12 +314,16 @@ def underscore_to_hyphen(data):
     return data
 
 
-def wanopt_cache_service(data, fos):
+def wanopt_cache_service(data, fos, check_mode=False):
     vdom = data["vdom"]
     wanopt_cache_service_data = data["wanopt_cache_service"]
     filtered_data = filter_wanopt_cache_service_data(wanopt_cache_service_data)
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot("wanopt", "cache-service", converted_data, vdom=vdom)
+
     return fos.set("wanopt", "cache-service", data=converted_data, vdom=vdom)
 
 
@@ -320,13 +339,14 @@ def is_successful_status(resp):
     )
 
 
-def fortios_wanopt(data, fos):
+def fortios_wanopt(data, fos, check_mode):
     fos.do_member_operation("wanopt", "cache-service")
     if data["wanopt_cache_service"]:
-        resp = wanopt_cache_service(data, fos)
+        resp = wanopt_cache_service(data, fos, check_mode)
     else:
         fos._module.fail_json(msg="missing task body: %s" % ("wanopt_cache_service"))
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -402,6 +422,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -423,7 +445,7 @@ def main():
         if mkeyname and mkeyname == attribute_name:
             fields["wanopt_cache_service"]["options"][attribute_name]["required"] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -446,7 +468,9 @@ def main():
             fos, versioned_schema, "wanopt_cache_service"
         )
 
-        is_error, has_changed, result, diff = fortios_wanopt(module.params, fos)
+        is_error, has_changed, result, diff = fortios_wanopt(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -214,7 +229,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def webfilter_ips_urlfilter_setting(data, fos):
+def webfilter_ips_urlfilter_setting(data, fos, check_mode=False):
     vdom = data["vdom"]
     webfilter_ips_urlfilter_setting_data = data["webfilter_ips_urlfilter_setting"]
     filtered_data = filter_webfilter_ips_urlfilter_setting_data(
@@ -222,6 +237,12 @@ def webfilter_ips_urlfilter_setting(data, fos):
     )
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "webfilter", "ips-urlfilter-setting", converted_data, vdom=vdom
+        )
+
     return fos.set("webfilter", "ips-urlfilter-setting", data=converted_data, vdom=vdom)
 
 
@@ -237,15 +258,16 @@ def is_successful_status(resp):
     )
 
 
-def fortios_webfilter(data, fos):
+def fortios_webfilter(data, fos, check_mode):
     fos.do_member_operation("webfilter", "ips-urlfilter-setting")
     if data["webfilter_ips_urlfilter_setting"]:
-        resp = webfilter_ips_urlfilter_setting(data, fos)
+        resp = webfilter_ips_urlfilter_setting(data, fos, check_mode)
     else:
         fos._module.fail_json(
             msg="missing task body: %s" % ("webfilter_ips_urlfilter_setting")
         )
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -273,6 +295,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -296,7 +320,7 @@ def main():
                 "required"
             ] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -319,7 +343,9 @@ def main():
             fos, versioned_schema, "webfilter_ips_urlfilter_setting"
         )
 
-        is_error, has_changed, result, diff = fortios_webfilter(module.params, fos)
+        is_error, has_changed, result, diff = fortios_webfilter(
+            module.params, fos, module.check_mode
+        )
 
     else:
         module.fail_json(**FAIL_SOCKET_MSG)
@@ -52,6 +52,21 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Compare the object with its current state on the device first, the same way check mode does,
+              and do not write it if nothing changed, so that idempotent runs do not bump the config revision.
+            - An object with a secret attribute such as a password is always written, the device only returns it encrypted.
+        type: bool
+        required: false
+        default: false
+    minimal_delta:
+        description:
+            - Read the current object first and only write the attributes which differ from it. Nested tables
+              with a few changed members are updated member by member through their own urls.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
@@ -273,7 +288,7 @@ def underscore_to_hyphen(data):
     return data
 
 
-def wireless_controller_hotspot20_h2qp_advice_of_charge(data, fos):
+def wireless_controller_hotspot20_h2qp_advice_of_charge(data, fos, check_mode=False):
     vdom = data["vdom"]
 
     state = data["state"]
@@ -286,6 +301,16 @@ def wireless_controller_hotspot20_h2qp_advice_of_charge(data, fos):
     )
     converted_data = underscore_to_hyphen(filtered_data)
 
+    # check_mode starts from here
+    if check_mode:
+        return fos.check_snapshot(
+            "wireless-controller.hotspot20",
+            "h2qp-advice-of-charge",
+            converted_data,
+            vdom=vdom,
+            state=state,
+        )
+
     if state == "present" or state is True:
         return fos.set(
             "wireless-controller.hotspot20",
@@ -317,16 +342,17 @@ def is_successful_status(resp):
     )
 
 
-def fortios_wireless_controller_hotspot20(data, fos):
+def fortios_wireless_controller_hotspot20(data, fos, check_mode):
     fos.do_member_operation("wireless-controller.hotspot20", "h2qp-advice-of-charge")
     if data["wireless_controller_hotspot20_h2qp_advice_of_charge"]:
-        resp = wireless_controller_hotspot20_h2qp_advice_of_charge(data, fos)
+        resp = wireless_controller_hotspot20_h2qp_advice_of_charge(data, fos, check_mode)
     else:
         fos._module.fail_json(
             msg="missing task body: %s"
             % ("wireless_controller_hotspot20_h2qp_advice_of_charge")
         )
-
+    if isinstance(resp, tuple) and len(resp) == 4:
+        return resp
     return (
         not is_successful_status(resp),
         is_successful_status(resp)
@@ -391,6 +417,8 @@ def main():
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": "bool", "default": False},
+        "skip_unchanged": {"required": False, "type": "bool", "default": False},
+        "minimal_delta": {"required": False, "type": "bool", "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "member_path": {"required": False, "type": "str"},
         "member_state": {
@@ -415,7 +443,7 @@ def main():
                 attribute_name
             ]["required"] = True
 
-    module = AnsibleModule(argument_spec=fields, supports_check_mode=False)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
     check_legacy_fortiosapi(module)
 
     is_error = False
@@ -439,7 +467,7 @@ def main():
         )
 
         is_error, has_changed, result, diff = fortios_wireless_controller_hotspot20(
-            module.params, fos
+            module.params, fos, module.check_mode
         )
 
     else:
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+'''
+Import-time benchmark of the module bootstrap.
+
+Every target is imported in a fresh interpreter with python -X importtime, the cumulative
+import time of the target is the best of the runs. The targets are module_utils.fortios.fortios
+and the heaviest modules by default. ansible-core must be installed.
+
+    python tools/import_time.py --heaviest 5 --budget-ms 150
+
+The command fails if a target exceeds the budget, --details lists its most expensive imports.
+'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+COLLECTION_PACKAGE = 'ansible_collections.fortinet.fortios'
+HANDLER_MODULE = COLLECTION_PACKAGE + '.plugins.module_utils.fortios.fortios'
+
+
+def collections_path(collection_root, work_dir):
+    '''
+    :return: The directory to put on PYTHONPATH so that the collection is importable.
+    '''
+    parts = collection_root.split(os.sep)
+    if parts[-3:-1] == ['ansible_collections', 'fortinet'] and parts[-1] == 'fortios':
+        return os.sep.join(parts[:-3])
+    namespace_dir = os.path.join(work_dir, 'ansible_collections', 'fortinet')
+    os.makedirs(namespace_dir)
+    os.symlink(collection_root, os.path.join(namespace_dir, 'fortios'))
+    return work_dir
+
+
+def heaviest_modules(collection_root, count):
+    modules_dir = os.path.join(collection_root, 'plugins', 'modules')
+    modules = [name for name in os.listdir(modules_dir) if name.endswith('.py') and name != '__init__.py']
+    modules.sort(key=lambda name: os.path.getsize(os.path.join(modules_dir, name)), reverse=True)
+    return ['%s.plugins.modules.%s' % (COLLECTION_PACKAGE, name[:-len('.py')]) for name in modules[:count]]
+
+
+def parse_importtime(stderr):
+    '''
+    :return: A list of (package, self us, cumulative us) in the order python reports them.
+    '''
+    imports = list()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        imports.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return imports
+
+
+def time_import(target, python_path, rounds):
+    '''
+    :return: The best cumulative import time in us and the imports of that run, None if the import failed.
+    '''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([python_path, env.get('PYTHONPATH', '')]).rstrip(os.pathsep)
+    best = None
+    for dummy in range(rounds):
+        process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', 'import %s' % (target)],
+                                   env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        dummy, stderr = process.communicate()
+        if process.returncode != 0:
+            return None, stderr.strip().splitlines()[-1:]
+        imports = parse_importtime(stderr)
+        cumulative = [item[2] for item in imports if item[0] == target]
+        if cumulative and (best is None or cumulative[-1] < best[0]):
+            best = (cumulative[-1], imports)
+    return best or (None, ['%s is not reported by -X importtime' % (target)])
+
+
+def run(args, collection_root, python_path):
+    targets = [HANDLER_MODULE] + ['%s.plugins.modules.%s' % (COLLECTION_PACKAGE, name) for name in args.module]
+    if not args.module:
+        targets.extend(heaviest_modules(collection_root, args.heaviest))
+
+    over_budget = False
+    for target in targets:
+        cumulative, imports = time_import(target, python_path, args.rounds)
+        short_name = target[len(COLLECTION_PACKAGE) + 1:]
+        if cumulative is None:
+            print('%-70s failed: %s' % (short_name, ' '.join(imports)))
+            over_budget = True
+            continue
+        milliseconds = cumulative / 1000.0
+        exceeded = args.budget_ms is not None and milliseconds > args.budget_ms
+        over_budget = over_budget or exceeded
+        print('%-70s %10.1f ms%s' % (short_name, milliseconds, ' OVER BUDGET' if exceeded else ''))
+        for package, self_time, dummy in sorted(imports, key=lambda item: item[1], reverse=True)[:args.details]:
+            print('    %-66s %10.1f ms' % (package, self_time / 1000.0))
+    return 1 if over_budget else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time benchmark of the fortios modules.')
+    parser.add_argument('--collection', default=os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)))
+    parser.add_argument('--heaviest', type=int, default=5, help='number of the largest modules to time')
+    parser.add_argument('--module', action='append', default=[], help='module to time, e.g. fortios_system_interface')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=None, help='fail if a target imports slower')
+    parser.add_argument('--details', type=int, default=0, help='list the slowest imports of every target')
+    args = parser.parse_args()
+
+    collection_root = os.path.realpath(args.collection)
+    work_dir = tempfile.mkdtemp(prefix='fortios_importtime_')
+    try:
+        return run(args, collection_root, collections_path(collection_root, work_dir))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
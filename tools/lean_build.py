@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# Copyright (c) 2022 Fortinet
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+'''
+Build the lean runtime flavour of the collection.
+
+The DOCUMENTATION, EXAMPLES and RETURN blocks of every module are moved into a sidecar
+<module>.yml file next to the module, which ansible-doc reads instead of the module source,
+and are removed from the module itself. Only the module body then goes into the AnsiballZ
+payload sent for every task.
+
+    python tools/lean_build.py --output /tmp/fortios-lean
+    ansible-galaxy collection build /tmp/fortios-lean
+
+With --measure the module is packed with the collection module_utils it imports, deflated and
+base64 encoded as AnsiballZ does, and the payload size and the time to pack and unpack it are
+reported before and after. The module_utils of ansible-core are not counted, so the sizes are a
+lower bound of the payload: inspect a real one with ANSIBLE_KEEP_REMOTE_FILES=1.
+'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import ast
+import base64
+import io
+import os
+import shutil
+import sys
+import time
+import zipfile
+
+COLLECTION_PACKAGE = 'ansible_collections.fortinet.fortios'
+DOC_BLOCKS = ['DOCUMENTATION', 'EXAMPLES', 'RETURN']
+IGNORED_PATHS = ['.git', 'tools', '__pycache__']
+
+
+def find_doc_blocks(source):
+    '''
+    :return: A list of (name, first line, last line, text) of the documentation assignments of a module.
+    '''
+    blocks = list()
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        name = getattr(node.targets[0], 'id', None)
+        if name in DOC_BLOCKS and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            blocks.append((name, node.lineno, node.end_lineno, node.value.value))
+    return blocks
+
+
+def indent_block(text):
+    lines = text.strip('\n').split('\n')
+    if lines and lines[0].strip() == '---':
+        lines = lines[1:]
+    return '\n'.join(('  ' + line) if line.strip() else '' for line in lines)
+
+
+def to_sidecar(blocks):
+    parts = ['---']
+    for name, dummy, dummy, text in blocks:
+        if name == 'EXAMPLES':
+            parts.append('%s: |\n%s' % (name, indent_block(text)))
+        elif text.strip() in ['', '---']:
+            parts.append('%s: {}' % (name))
+        else:
+            parts.append('%s:\n%s' % (name, indent_block(text)))
+    return '\n'.join(parts) + '\n'
+
+
+def strip_doc_blocks(source, blocks):
+    lines = source.split('\n')
+    for dummy, first, last, dummy in sorted(blocks, key=lambda block: block[1], reverse=True):
+        # drop the blank line the block leaves behind.
+        if last < len(lines) and not lines[last].strip():
+            last += 1
+        del lines[first - 1:last]
+    return '\n'.join(lines)
+
+
+def validate_sidecar(text):
+    try:
+        import yaml
+    except ImportError:
+        return
+    docs = yaml.safe_load(text)
+    if not isinstance(docs, dict) or not isinstance(docs.get('DOCUMENTATION'), dict):
+        raise ValueError('invalid sidecar documentation')
+
+
+def build_module(source):
+    '''
+    :return: The module without its documentation and the sidecar documentation, None if it has none.
+    '''
+    blocks = find_doc_blocks(source)
+    if not blocks:
+        return source, None
+    sidecar = to_sidecar(blocks)
+    validate_sidecar(sidecar)
+    return strip_doc_blocks(source, blocks), sidecar
+
+
+def collection_imports(source):
+    names = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            names.update(node.module + '.' + alias.name for alias in node.names)
+        elif isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+    return [name for name in names if name.startswith(COLLECTION_PACKAGE + '.plugins.module_utils.')]
+
+
+def module_utils_files(collection_root, source):
+    '''
+    :return: A dictionary of the archive names and sources of the collection module_utils a module
+        imports, directly or not, with the __init__ files of their packages.
+    '''
+    files = dict()
+    pending = [source]
+    while pending:
+        for name in collection_imports(pending.pop()):
+            parts = name[len(COLLECTION_PACKAGE) + 1:].split('.')
+            for depth in range(1, len(parts) + 1):
+                for relative in [os.path.join(*parts[:depth]) + '.py', os.path.join(*(parts[:depth] + ['__init__.py']))]:
+                    path = os.path.join(collection_root, relative)
+                    arcname = '/'.join(COLLECTION_PACKAGE.split('.') + relative.split(os.sep))
+                    if arcname in files or not os.path.isfile(path):
+                        continue
+                    with open(path) as f:
+                        files[arcname] = f.read()
+                    pending.append(files[arcname])
+    return files
+
+
+def ansiballz_payload(name, source, module_utils=None):
+    '''pack a module body the way AnsiballZ does: deflated into a zip with its module_utils, then base64 encoded.'''
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('ansible_collections/fortinet/fortios/plugins/modules/%s' % (name), source)
+        for arcname, module_utils_source in sorted((module_utils or {}).items()):
+            archive.writestr(arcname, module_utils_source)
+    return base64.b64encode(buffer.getvalue())
+
+
+def unpack_payload(payload):
+    with zipfile.ZipFile(io.BytesIO(base64.b64decode(payload))) as archive:
+        for info in archive.infolist():
+            compile(archive.read(info), info.filename, 'exec')
+
+
+def measure(name, source, module_utils, rounds=5):
+    start = time.time()
+    for dummy in range(rounds):
+        payload = ansiballz_payload(name, source, module_utils)
+    packed = time.time()
+    for dummy in range(rounds):
+        unpack_payload(payload)
+    unpacked = time.time()
+    return len(payload), (packed - start) / rounds * 1000, (unpacked - packed) / rounds * 1000
+
+
+def report(measurements, largest=5):
+    total = [0, 0]
+    for name, before, after in measurements:
+        total[0] += before[0]
+        total[1] += after[0]
+    print('%-55s %12s %12s %16s %16s' % ('module', 'payload', 'lean', 'pack+unpack ms', 'lean ms'))
+    for name, before, after in sorted(measurements, key=lambda item: item[1][0], reverse=True)[:largest]:
+        print('%-55s %12d %12d %16.1f %16.1f' % (name, before[0], after[0], before[1] + before[2], after[1] + after[2]))
+    print('%-55s %12d %12d' % ('all %d modules' % (len(measurements)), total[0], total[1]))
+
+
+def build(source_dir, output_dir, with_measure=False):
+    if os.path.exists(output_dir):
+        raise SystemExit('%s already exists' % (output_dir))
+    shutil.copytree(source_dir, output_dir, ignore=shutil.ignore_patterns(*IGNORED_PATHS))
+    modules_dir = os.path.join(output_dir, 'plugins', 'modules')
+    measurements = list()
+    for name in sorted(os.listdir(modules_dir)):
+        if not name.endswith('.py') or name == '__init__.py':
+            continue
+        path = os.path.join(modules_dir, name)
+        with open(path) as f:
+            source = f.read()
+        lean_source, sidecar = build_module(source)
+        if sidecar is None:
+            continue
+        with open(path, 'w') as f:
+            f.write(lean_source)
+        with open(path[:-len('.py')] + '.yml', 'w') as f:
+            f.write(sidecar)
+        if with_measure:
+            module_utils = module_utils_files(output_dir, source)
+            measurements.append((name, measure(name, source, module_utils), measure(name, lean_source, module_utils)))
+    if with_measure:
+        report(measurements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the lean runtime flavour of the collection.')
+    parser.add_argument('--source', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+    parser.add_argument('--output', required=True, help='directory of the lean collection, must not exist')
+    parser.add_argument('--measure', action='store_true', help='report the AnsiballZ payload before and after')
+    args = parser.parse_args()
+    build(os.path.abspath(args.source), os.path.abspath(args.output), args.measure)
+
+
+if __name__ == '__main__':
+    sys.exit(main())